@@ -1,24 +1,68 @@
 '''
 A simple assembler that resolves labels.
+
+Labels and noops are stripped from the assembled code, with the label
+addresses kept as a separate table of debug symbols.  The assembler can
+optionally fuse common instruction pairs into superinstructions before
+resolving labels, reducing the number of dispatches the machine performs.
 '''
 
+from collections import defaultdict
+
 from util.dispatch import method_store, multimethod
 
+COMPARISONS = ('lt', 'lte', 'gt', 'gte', 'eq', 'neq')
+
+STRIPPED = ('label', 'noop')
+
+
 class Assembler(object):
     _store = method_store()
 
-    def __init__(self):
+    def __init__(self, fuse=False):
         self._labels = {}
+        self._relocations = []
 
-    def assemble(self, bytecode):
-        newcode = []
+        self.fuse = fuse
+        self.eliminated = 0
 
-        for i, code in enumerate(bytecode):
-            op = code[0]
-            if op == 'label':
-                name = code[1]
-                # +1 because labels refer to the next bytecode
-                self._labels[name] = i + 1
+        # source spans of the assembled code, by address
+        self.lines = {}
+
+    @property
+    def symbols(self):
+        '''
+        Debug symbols: the names of the labels at each address.
+        '''
+        symbols = defaultdict(list)
+
+        for name, address in self._labels.items():
+            symbols[address].append(name)
+
+        return {address: sorted(names) for address, names in symbols.items()}
+
+    def assemble(self, bytecode, spans=None):
+        '''
+        Assemble instructions, resolving labels.
+
+        Given the source span of each instruction, the span of the first
+        instruction assembled to each address is recorded in lines.
+        '''
+        original = bytecode
+
+        # +1 to allow addressing the end of the code
+        relocations = range(len(bytecode) + 1)
+
+        if self.fuse:
+            bytecode, relocations = self.fuse_instructions(bytecode)
+
+        bytecode, stripped_relocations = self.strip(bytecode)
+
+        self._relocations = [stripped_relocations[i] for i in relocations]
+
+        self.lines = self.relocate_spans(original, spans) if spans is not None else {}
+
+        newcode = []
 
         for code in bytecode:
             op = code[0]
@@ -31,26 +75,189 @@ class Assembler(object):
 
         return newcode
 
+    def strip(self, bytecode):
+        '''
+        Remove labels and noops, recording the address each label refers to.
+
+        Returns the stripped code and the new address of every instruction.
+        '''
+        stripped = []
+        relocations = []
+
+        for code in bytecode:
+            op = code[0]
+            relocations.append(len(stripped))
+
+            if op == 'label':
+                name = code[1]
+                # labels refer to the next bytecode
+                self._labels[name] = len(stripped)
+
+            if op not in STRIPPED:
+                stripped.append(code)
+
+        # allow addressing the end of the code
+        relocations.append(len(stripped))
+
+        return stripped, relocations
+
+    def relocate_spans(self, bytecode, spans):
+        '''
+        Map the spans of unassembled instructions to assembled addresses.
+        '''
+        lines = {}
+
+        for index, (code, span) in enumerate(zip(bytecode, spans)):
+            if span is not None and code[0] not in STRIPPED:
+                lines.setdefault(self._relocations[index], span)
+
+        return lines
+
+    def _address(self, target):
+        '''
+        Resolve a jump target, either a label or an absolute address.
+        '''
+        if isinstance(target, basestring):
+            return self._labels[target]
+
+        return self._relocations[target]
+
+    ##########################################################################
+    # Fusion
+    ##########################################################################
+
+    def fuse_instructions(self, bytecode):
+        '''
+        Rewrite adjacent instruction pairs into superinstructions.
+
+        Returns the fused code and the new address of every instruction.
+        The number of instructions removed is recorded in eliminated.
+        '''
+        fused = []
+        relocations = []
+
+        i = 0
+        while i < len(bytecode):
+            code = tuple(bytecode[i])
+            relocations.append(len(fused))
+
+            if i + 1 < len(bytecode):
+                following = tuple(bytecode[i + 1])
+                superinstruction = self.fuse_pair(code, following)
+
+                if superinstruction is not None:
+                    relocations.append(len(fused))
+                    fused.append(superinstruction)
+                    i += 2
+                    continue
+
+            fused.append(code)
+            i += 1
+
+        # allow addressing the end of the code
+        relocations.append(len(fused))
+
+        self.eliminated = len(bytecode) - len(fused)
+
+        return fused, relocations
+
+    def fuse_pair(self, first, second):
+        '''
+        Return the superinstruction for a pair of instructions,
+        or None if the pair cannot be fused.
+        '''
+        op = first[0]
+        next_op = second[0]
+
+        # cmp rX, a, b; branch_zero rX, label => cmp_branch_zero rX, a, b, label
+        if op in COMPARISONS and next_op == 'branch_zero':
+            _, dst, left, right = first
+            _, pred, label = second
+
+            if pred == dst:
+                return (op + '_branch_zero', dst, left, right, label)
+
+        # call f, args...; copy rX, 0 => call_into rX, f, args...
+        if op == 'call' and next_op == 'copy':
+            _, dst, src = second
+
+            if src == 0:
+                return ('call_into', dst) + first[1:]
+
+        # load_c rT, i; add rX, a, rT => add_c rX, a, rT, i
+        if op == 'load_c' and next_op in ('add', 'sub'):
+            _, tmp, index = first
+            _, dst, left, right = second
+
+            if right == tmp and left != tmp:
+                return (next_op + '_c', dst, left, tmp, index)
+
+        # load_v rT, v; add rX, a, rT => add_v rX, a, rT, v
+        if op == 'load_v' and next_op in ('add', 'sub'):
+            _, tmp, value = first
+            _, dst, left, right = second
+
+            if right == tmp and left != tmp and isinstance(value, (int, long)):
+                return (next_op + '_v', dst, left, tmp, value)
+
+        return None
+
+    ##########################################################################
+    # Label Resolution
+    ##########################################################################
+
     def jump(self, op, label):
-        address = self._labels[label]
+        address = self._address(label)
 
         return (op, address)
 
     def branch_zero(self, op, pred, label):
-        address = self._labels[label]
+        address = self._address(label)
 
         return (op, pred, address)
 
     def branch_one(self, op, pred, label):
-        address = self._labels[label]
+        address = self._address(label)
 
         return (op, pred, address)
 
     def branch_eq(self, op, left, right, label):
-        address = self._labels[label]
+        address = self._address(label)
 
         return (op, left, right, address)
 
+    def _compare_branch_zero(self, op, dst, left, right, label):
+        address = self._address(label)
+
+        return (op, dst, left, right, address)
+
+    lt_branch_zero = _compare_branch_zero
+    lte_branch_zero = _compare_branch_zero
+    gt_branch_zero = _compare_branch_zero
+    gte_branch_zero = _compare_branch_zero
+    eq_branch_zero = _compare_branch_zero
+    neq_branch_zero = _compare_branch_zero
+
+    def call(self, op, func, *params):
+        address = self._address(func)
+
+        return (op, address) + params
+
+    def call_into(self, op, dst, func, *params):
+        address = self._address(func)
+
+        return (op, dst, address) + params
+
+    def tail_call(self, op, func, *operands):
+        address = self._address(func)
+
+        return (op, address) + operands
+
+    def load_a(self, op, reg, label):
+        address = self._address(label)
+
+        return ('load_v', reg, address)
+
     def default(self, *args):
 
         return tuple(args)
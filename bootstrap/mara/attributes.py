@@ -12,6 +12,8 @@ from util.reflection import deriving
 
 
 class Attributes(deriving('members_dict')):
+    __slots__ = ('members',)
+
     def __init__(self, members=None):
         self.members = {}
 
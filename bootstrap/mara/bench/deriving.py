@@ -0,0 +1,85 @@
+'''
+Derived method throughput.
+
+    python -m mara.bench.deriving [ROUNDS]
+
+Compares nodes and formats them with the eq and repr methods generated
+for each class by deriving(), against the reflection based methods that
+look up the fields of every object on every call.
+'''
+import sys
+import time
+
+from .. import node
+from ..util.reflection import instance_fields
+
+
+def reflected_eq(self, other):
+    canary = object()
+    for attr in instance_fields(self):
+        other_attribute = getattr(other, attr, canary)
+
+        if other_attribute is canary or getattr(self, attr) != other_attribute:
+            return False
+
+    return self.__class__ == other.__class__
+
+
+def reflected_repr(self):
+    return '{cls}({fields})'.format(
+        cls=self.__class__.__name__,
+        fields=', '.join(
+            '{0}={1}'.format(attr, repr(getattr(self, attr)))
+            for attr in instance_fields(self)
+        ),
+    )
+
+
+def cases():
+    '''
+    Pairs of equal nodes, from a type up to a small expression.
+    '''
+    def binop():
+        return node.BinOp(
+            func=node.SymbolId('*'),
+            args=[node.ValueId('x'), node.Int('1')],
+        )
+
+    return [
+        ('IntType', node.IntType(), node.IntType()),
+        ('Int', node.Int('1'), node.Int('1')),
+        ('BinOp', binop(), binop()),
+    ]
+
+
+def measure(operation, rounds):
+    start = time.time()
+    for _ in xrange(rounds):
+        operation()
+    elapsed = time.time() - start
+
+    return rounds / elapsed
+
+
+def main(rounds=20000):
+    for name, left, right in cases():
+        generated_eq = measure(lambda: left == right, rounds)
+        reflected = measure(lambda: reflected_eq(left, right), rounds)
+
+        generated_repr = measure(lambda: repr(left), rounds)
+        reflected_show = measure(lambda: reflected_repr(left), rounds)
+
+        print '{name:<8} eq {gen:>10.0f}/s vs {ref:>9.0f}/s ({eq_x:>5.1f}x)  ' \
+            'repr {gen_r:>9.0f}/s vs {ref_r:>8.0f}/s ({repr_x:>5.1f}x)'.format(
+                name=name,
+                gen=generated_eq,
+                ref=reflected,
+                eq_x=generated_eq / reflected,
+                gen_r=generated_repr,
+                ref_r=reflected_show,
+                repr_x=generated_repr / reflected_show,
+            )
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:]])
@@ -0,0 +1,74 @@
+'''
+Heap allocation throughput.
+
+    python -m mara.bench.heap [CHUNKS]
+
+Allocates CHUNKS small chunks in a machine loop, once with every chunk
+becoming garbage straight away and once with every chunk kept alive in a
+linked list, for a few initial heap sizes and growth factors.
+'''
+import sys
+import time
+
+from ..machine import Machine
+
+CONFIGURATIONS = (
+    (8, 2),
+    (8, 1.5),
+    (1 << 16, 2),
+)
+
+
+def program(chunks, retain):
+    '''
+    Allocate chunks two cell chunks, linking each to the last if retain.
+    '''
+    link = [
+        ['store_d', 5, 4],                  # *chunk = previous
+        ['copy', 5, 4],                     # previous = chunk
+    ]
+
+    return [
+        ['load_v', 3, chunks],
+        ['load_v', 11, 1],
+        ['label', 'loop'],
+        ['new_chunk', 4, 2],
+    ] + (link if retain else []) + [
+        ['sub', 3, 3, 11],
+        ['branch_zero', 3, 'done'],
+        ['jump', 'loop'],
+        ['label', 'done'],
+        ['halt'],
+    ]
+
+
+def measure(chunks, retain, heap_size, heap_growth):
+    machine = Machine(heap_size=heap_size, heap_growth=heap_growth)
+    machine._load(program(chunks, retain))  # pylint: disable=W0212
+
+    start = time.time()
+    machine._loop()  # pylint: disable=W0212
+    elapsed = time.time() - start
+
+    stats = machine._heap_stats  # pylint: disable=W0212
+
+    print '{kind:<8} size={size:<6} growth={growth:<4} {rate:>10.0f} chunks/s ' \
+        '{collections:>4} collections {pause:.3f}s paused {heap:>9} cells'.format(
+            kind='retained' if retain else 'garbage',
+            size=heap_size,
+            growth=heap_growth,
+            rate=chunks / elapsed,
+            collections=stats.collections,
+            pause=stats.total_pause,
+            heap=len(machine._heaplet),  # pylint: disable=W0212
+        )
+
+
+def main(chunks=1000000):
+    for retain in (False, True):
+        for heap_size, heap_growth in CONFIGURATIONS:
+            measure(chunks, retain, heap_size, heap_growth)
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:]])
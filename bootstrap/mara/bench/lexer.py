@@ -0,0 +1,137 @@
+'''
+Lexing throughput over the standard library.
+
+    python -m mara.bench.lexer [--baseline] [ROUNDS]
+
+Lexes every .mara file under lib/, then a synthetic module with deeply
+indented blank lines, and reports characters and tokens per second.
+The bootstrap lexer has no character literals, so the characters it
+cannot lex are skipped rather than leaving files out.
+
+With --baseline, newline termination is decided by the original
+_newline_terminates, which rescans the whitespace before every newline,
+so the two can be compared on the same machine.
+'''
+import os
+import re
+import sys
+import time
+
+from ply.lex import LexError
+
+from .. import lexer
+
+LIB = os.path.join(os.path.dirname(__file__), '..', '..', '..', 'lib')
+
+SYM_REGEX = re.compile(r'{A}|{B}|(\{{|\[|\(|\\)'.format(A=lexer.SYMA, B=lexer.SYMB))
+WHITESPACE = re.compile(r'[ \t\r\n]')
+
+
+def baseline_newline_terminates(tok):
+    '''
+    The original _newline_terminates, matching a regex per character
+    while walking back over all the whitespace before each newline.
+    '''
+    # walk backward to find first non-whitespace char
+    # -1 because the current position is known to be whitespace
+    pos = tok.lexer.lexpos - 1
+    lexdata = tok.lexer.lexdata
+
+    while WHITESPACE.match(lexdata[pos]):
+        pos -= 1
+
+    # check if the character causes a termination
+    after_symbol = SYM_REGEX.match(tok.lexer.lexdata[pos])
+
+    return (
+        not after_symbol
+        and not tok.lexer.marabalancer.isopen()
+    )
+
+
+def library(root=LIB):
+    '''
+    The source of every .mara file under root.
+    '''
+    sources = []
+
+    for directory, _, filenames in sorted(os.walk(root)):
+        for filename in sorted(filenames):
+            if filename.endswith('.mara'):
+                with open(os.path.join(directory, filename)) as stream:
+                    sources.append(stream.read())
+
+    return sources
+
+
+def blank_lines(lines=2000, indent=40):
+    '''
+    A module dominated by indented blank lines.
+    '''
+    blank = ' ' * indent + '\n'
+    body = ''.join('x = {0}\n{1}'.format(i, blank * 10) for i in range(lines // 10))
+
+    return 'module blank\n{0}end\n'.format(body)
+
+
+def count_tokens(source):
+    '''
+    The number of tokens in source, skipping characters that cannot be lexed.
+    '''
+    lex = lexer.build_lexer()
+    lex.begin('INITIAL')
+    lex.input(source)
+
+    tokens = 0
+
+    while True:
+        try:
+            tok = lex.token()
+        except LexError:
+            lex.skip(1)
+            continue
+
+        if tok is None:
+            return tokens
+
+        tokens += 1
+
+
+def measure(name, sources, rounds):
+    characters = sum(len(source) for source in sources) * rounds
+    tokens = 0
+
+    start = time.time()
+    for _ in range(rounds):
+        for source in sources:
+            tokens += count_tokens(source)
+    elapsed = time.time() - start
+
+    print '{name:<12} {chars:>10.0f} chars/s {toks:>10.0f} tokens/s ({elapsed:.3f}s)'.format(
+        name=name,
+        chars=characters / elapsed,
+        toks=tokens / elapsed,
+        elapsed=elapsed,
+    )
+
+
+def main(rounds=20, baseline=False):
+    current = lexer._newline_terminates  # pylint: disable=W0212
+
+    if baseline:
+        lexer._newline_terminates = baseline_newline_terminates  # pylint: disable=W0212
+
+    try:
+        sources = library()
+
+        measure('lib/ ({0})'.format(len(sources)), sources, rounds)
+        measure('blank lines', [blank_lines()], rounds)
+    finally:
+        lexer._newline_terminates = current  # pylint: disable=W0212
+
+
+if __name__ == '__main__':
+    args = sys.argv[1:]
+    baseline = '--baseline' in args
+
+    main(*[int(arg) for arg in args if arg != '--baseline'], baseline=baseline)
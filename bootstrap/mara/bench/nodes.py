@@ -0,0 +1,104 @@
+'''
+Memory used by the AST of a large generated module.
+
+    python -m mara.bench.nodes [FUNCTIONS]
+
+Parses a module of FUNCTIONS small functions and the calls between them,
+runs the passes the interpreter runs before compiling, then reports the
+number of nodes and the bytes they and their attributes take up.
+'''
+import resource
+import sys
+import time
+
+from .. import passes
+from .. import tables
+from ..constant import ConstantPool
+from ..parser import Parser
+
+
+def module(functions):
+    '''
+    A module defining functions functions, each calling the one before.
+    '''
+    definitions = []
+
+    for i in range(functions):
+        previous = 'f_{0}(x - 1)'.format(i - 1) if i else 'x'
+
+        definitions.append(
+            'def f_{i} (x) {{\n'
+            '    val y = x * {i} + 2\n'
+            '    ({previous}) + y\n'
+            '}}\n'
+            'var v_{i} = f_{i}({i})\n'.format(i=i, previous=previous)
+        )
+
+    return 'module bench\n{0}end\n'.format(''.join(definitions))
+
+
+def footprint(n):
+    '''
+    The bytes used by a node, its instance dict and its attributes.
+    '''
+    size = sys.getsizeof(n)
+
+    if hasattr(n, '__dict__'):
+        size += sys.getsizeof(n.__dict__)
+
+    attrs = n._attrs  # pylint: disable=W0212
+    if attrs is not None:
+        size += sys.getsizeof(attrs) + sys.getsizeof(attrs.members)
+
+    return size
+
+
+class Measure(object):
+    '''
+    Visitor summing the footprint of every node.
+    '''
+
+    def __init__(self):
+        self.nodes = 0
+        self.bytes = 0
+
+    def visit(self, n):
+        self.nodes += 1
+        self.bytes += footprint(n)
+
+
+def main(functions=20000):
+    source = module(functions)
+
+    start = time.time()
+    context = tables.Tables()
+    ast = Parser().parse(source)
+    ast.walk_down(passes.JoinElse())
+    ast.walk_down(passes.ModuleFunction(), short_circuit=True)
+    ast.walk_down(passes.CollectNames(context))
+    ast.walk_down(passes.CollectLocals(context))
+    ast.walk_up(passes.ConstantFold(context))
+    ast.walk_down(ConstantPool(context))
+    elapsed = time.time() - start
+
+    measure = Measure()
+    ast.walk_down(measure)
+
+    # pylint: disable=W0212
+    table_bytes = sum(sys.getsizeof(table._values) for table in context.tables())
+
+    print '{nodes} nodes, {size:.1f} bytes/node, {total:.1f} MB of nodes, ' \
+        '{tables:.1f} MB of side tables'.format(
+            nodes=measure.nodes,
+            size=float(measure.bytes) / measure.nodes,
+            total=measure.bytes / 1e6,
+            tables=table_bytes / 1e6,
+        )
+    print '{elapsed:.3f}s to parse and run passes, {rss:.1f} MB peak rss'.format(
+        elapsed=elapsed,
+        rss=resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1e3,
+    )
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:]])
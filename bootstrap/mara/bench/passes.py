@@ -0,0 +1,101 @@
+'''
+Compiler pass throughput.
+
+    python -m mara.bench.passes [FUNCTIONS] [ROUNDS]
+
+Runs the interpreter's passes over a generated module of many functions,
+once walking the tree separately for each pass and once with the pass
+manager fusing the walks, then reports the time spent in each fused pass.
+'''
+import sys
+import time
+
+from .. import constant
+from .. import passes
+from .. import tables
+from ..parser import Parser
+
+
+def source(functions):
+    '''
+    A module of the given number of small functions.
+    '''
+    lines = ['module bench']
+
+    for i in xrange(functions):
+        lines.extend([
+            'def f{0}(x) {{'.format(i),
+            '    val y = {0} * 2'.format(i),
+            '    var z = x + y',
+            '    if z < 10 {',
+            '        z = z + 1',
+            '    } else {',
+            '        z = z - 1',
+            '    }',
+            '    z',
+            '}',
+        ])
+
+    lines.append('end')
+
+    return '\n'.join(lines)
+
+
+def schedule(context, times=None):
+    manager = passes.PassManager(times=times)
+
+    manager.add(passes.JoinElse())
+    manager.add(passes.ModuleFunction())
+    manager.add(passes.CollectNames(context))
+    manager.add(passes.CollectLocals(context))
+    manager.add(passes.ConstantFold(context))
+    manager.add(constant.ConstantPool(context))
+
+    return manager
+
+
+def separate(ast, context):
+    for pass_ in schedule(context).passes:
+        passes.manager.WALKS[pass_.walk](ast, pass_)
+
+
+def fused(ast, context, times=None):
+    schedule(context, times).run(ast)
+
+
+def measure(module, run, rounds):
+    parser = Parser()
+    elapsed = 0.0
+
+    for _ in xrange(rounds):
+        context = tables.Tables()
+        ast = parser.parse(module)
+
+        start = time.time()
+        run(ast, context)
+        elapsed += time.time() - start
+
+    return elapsed / rounds
+
+
+def main(functions=200, rounds=10):
+    module = source(functions)
+
+    walks = measure(module, separate, rounds)
+    fuses = measure(module, fused, rounds)
+
+    print 'separate walks {0:.4f}s, fused {1:.4f}s ({2:.2f}x)'.format(
+        walks,
+        fuses,
+        walks / fuses,
+    )
+
+    times = passes.PassTimes()
+    measure(module, lambda ast, context: fused(ast, context, times), rounds)
+
+    print
+    print times.report()
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:]])
@@ -0,0 +1,245 @@
+'''
+Compact Bytecode.
+
+Encodes assembled instructions into a flat array of integers:
+
+    opcode, length, operand_0, ..., operand_length-1
+
+Opcodes are indexes into OPCODES.  Operands that are not integers by
+construction, such as the value of a load_v, are stored in a table of
+literals and encoded as their index in that table.
+
+This is a storage and cache format only.  The machine does not dispatch
+on the encoded words: loading Bytecode decodes every instruction back to
+tuple form once and binds it to its handler.
+'''
+
+from array import array
+
+from util.reflection import deriving
+
+
+OPCODES = (
+    'halt',
+    'noop',
+    'phi',
+
+    'print_const',
+    'print_reg',
+    'print_sym',
+
+    'lt', 'lte', 'gt', 'gte', 'eq', 'neq',
+
+    'lt_branch_zero', 'lte_branch_zero',
+    'gt_branch_zero', 'gte_branch_zero',
+    'eq_branch_zero', 'neq_branch_zero',
+
+    'add', 'sub', 'mul', 'div', 'rem',
+    'add_c', 'sub_c',
+
+    'jump', 'jump_ir', 'jump_ia',
+    'branch_zero', 'branch_one', 'branch_eq',
+
+    'copy',
+
+    'call', 'call_into', 'ret',
+
+    'push', 'pop', 'peak', 'reserve', 'save', 'restore',
+
+    'new_sym', 'new_chunk',
+
+    'load_v', 'load_c', 'load_p', 'load_d', 'load_i',
+    'store_p', 'store_d', 'store_i', 'store_c',
+
+    # new opcodes go last, so encoded bytecode stays valid
+    'new_str', 'print_str',
+    'str_len', 'str_index', 'str_slice', 'str_concat',
+    'tail_call',
+    'add_v', 'sub_v',
+)
+
+OPCODE = {name: number for number, name in enumerate(OPCODES)}
+
+# bytes used by a single word of encoded instructions
+WORD_SIZE = array('i').itemsize
+
+# Positions of the operands that are stored in the literal table.
+LITERAL_OPERANDS = {
+    'print_const': (0,),
+    'new_sym': (1,),
+    'load_v': (1,),
+    'store_c': (1,),
+    'new_str': (1,),
+    'add_v': (3,),
+    'sub_v': (3,),
+}
+
+
+class BytecodeError(Exception, deriving('eq', 'show')):
+    def __init__(self, msg, *largs, **kwargs):
+        self.message = msg.format(*largs, **kwargs)
+        super(BytecodeError, self).__init__(self.message)
+
+
+class Bytecode(deriving('eq')):
+    '''
+    Encoded instructions.
+
+    Supports len() and indexing by pc, which decodes a single instruction.
+    Debug symbols and the source span of each pc are kept alongside.
+    '''
+
+    def __init__(self, code=None, literals=None, offsets=None, symbols=None, lines=None):
+        self.code = code if code is not None else array('i')
+        self.literals = literals if literals is not None else []
+        self.offsets = offsets if offsets is not None else array('i')
+        self.symbols = symbols if symbols is not None else {}
+        self.lines = lines if lines is not None else {}
+
+    def __len__(self):
+        return len(self.offsets)
+
+    def __getitem__(self, pc):
+        return self.instruction(self.offsets[pc])
+
+    def __iter__(self):
+        for offset in self.offsets:
+            yield self.instruction(offset)
+
+    def __repr__(self):
+        return 'Bytecode({n} instructions, {w} words, {l} literals)'.format(
+            n=len(self.offsets),
+            w=len(self.code),
+            l=len(self.literals),
+        )
+
+    def operands(self, offset):
+        '''
+        The opcode name and operands of the instruction at offset,
+        with literal operands resolved.
+        '''
+        code = self.code
+        name = OPCODES[code[offset]]
+        length = code[offset + 1]
+
+        operands = code[offset + 2:offset + 2 + length].tolist()
+
+        for i in LITERAL_OPERANDS.get(name, ()):
+            operands[i] = self.literals[operands[i]]
+
+        return name, operands
+
+    def instruction(self, offset):
+        '''
+        The tuple form of the instruction at offset.
+        '''
+        name, operands = self.operands(offset)
+
+        return (name,) + tuple(operands)
+
+    def tostring(self):
+        '''
+        The raw bytes of the encoded instructions.
+        '''
+        return self.code.tostring()
+
+    @classmethod
+    def fromstring(cls, data, literals, symbols=None, lines=None):
+        '''
+        Rebuild Bytecode from the raw bytes of its instructions and its literals.
+        '''
+        code = array('i')
+        code.fromstring(data)
+
+        return cls.fromcode(code, literals, symbols, lines)
+
+    @classmethod
+    def fromfile(cls, stream, words, literals, symbols=None, lines=None):
+        '''
+        Rebuild Bytecode by reading the given number of words of encoded
+        instructions from a file straight into its array.
+        '''
+        code = array('i')
+        code.fromfile(stream, words)
+
+        return cls.fromcode(code, literals, symbols, lines)
+
+    @classmethod
+    def fromcode(cls, code, literals, symbols=None, lines=None):
+        '''
+        Rebuild Bytecode from an array of encoded instructions and its literals.
+        '''
+        offsets = array('i')
+        offset = 0
+        while offset < len(code):
+            offsets.append(offset)
+            offset += code[offset + 1] + 2
+
+        return cls(code=code, literals=literals, offsets=offsets, symbols=symbols, lines=lines)
+
+
+def encode(instructions, symbols=None, lines=None):
+    '''
+    Encode assembled instructions in tuple form into Bytecode.
+    '''
+    bytecode = Bytecode(symbols=symbols, lines=lines)
+
+    code = bytecode.code
+    literals = bytecode.literals
+    offsets = bytecode.offsets
+
+    # index literals by type as well as value, so 1, 1.0 and True stay distinct
+    literal_index = {}
+
+    for instruction in instructions:
+        name = instruction[0]
+        operands = list(instruction[1:])
+
+        try:
+            opcode = OPCODE[name]
+        except KeyError:
+            raise BytecodeError('Unknown opcode {op}.', op=name)
+
+        for i in LITERAL_OPERANDS.get(name, ()):
+            value = operands[i]
+
+            try:
+                key = (type(value), value)
+                index = literal_index[key]
+            except KeyError:
+                index = literal_index[key] = len(literals)
+                literals.append(value)
+            except TypeError:
+                # unhashable literals are never shared
+                index = len(literals)
+                literals.append(value)
+
+            operands[i] = index
+
+        if not all(isinstance(operand, (int, long)) for operand in operands):
+            raise BytecodeError(
+                'Cannot encode the operands of {instruction}.',
+                instruction=instruction,
+            )
+
+        words = array('i', [opcode, len(operands)])
+
+        try:
+            words.extend(operands)
+        except OverflowError:
+            raise BytecodeError(
+                'Operands of {instruction} do not fit in a word.',
+                instruction=instruction,
+            )
+
+        offsets.append(len(code))
+        code.extend(words)
+
+    return bytecode
+
+
+def decode(bytecode):
+    '''
+    Decode Bytecode into a list of instructions in tuple form.
+    '''
+    return list(bytecode)
@@ -0,0 +1,155 @@
+'''
+Compiled Bytecode Cache.
+
+Compiled units are stored on disk under a hash of their source, the
+compiler version and the options they were compiled with, so evaluating
+unchanged source skips parsing, the compiler passes and assembly entirely.
+
+Each cache file is laid out as:
+
+    magic, header length, pickled header, encoded instructions
+
+On load the header is unpickled and the encoded instructions are read
+straight from the file into the array the machine decodes them from,
+without an intermediate string.
+'''
+
+import cPickle as pickle
+import hashlib
+import os
+import struct
+import tempfile
+
+from bytecode import Bytecode, WORD_SIZE
+from compiler import VERSION
+from util.reflection import deriving
+
+MAGIC = 'MARAC\x00\x00\x03'
+
+SUFFIX = '.marac'
+
+_LENGTH = struct.Struct('<I')
+
+
+class CompiledUnit(deriving('eq', 'show')):
+    '''
+    Everything the machine needs to run compiled source, and the number of
+    dispatches the assembler eliminated from it by fusing instructions.
+    '''
+
+    def __init__(self, code, pool, result, registers, frames, eliminated=0):
+        self.code = code
+        self.pool = pool
+        self.result = result
+        self.registers = registers
+        self.frames = frames
+        self.eliminated = eliminated
+
+
+class BytecodeCache(object):
+    '''
+    A directory of compiled units.
+    '''
+
+    def __init__(self, directory):
+        self.directory = directory
+
+        self.hits = 0
+        self.misses = 0
+
+    def key(self, source, **options):
+        '''
+        The cache key of source compiled with the given options.
+        '''
+        digest = hashlib.sha1()
+        digest.update('{0}:{1}\n'.format(VERSION, sorted(options.items())))
+        digest.update(source)
+
+        return digest.hexdigest()
+
+    def path(self, key):
+        return os.path.join(self.directory, key + SUFFIX)
+
+    def load(self, key):
+        '''
+        The unit cached under key, or None if there is no usable entry.
+        '''
+        try:
+            unit = self._read(self.path(key))
+        except (IOError, OSError, ValueError, EOFError, pickle.UnpicklingError):
+            unit = None
+
+        if unit is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+
+        return unit
+
+    def store(self, key, unit):
+        '''
+        Cache unit under key.
+
+        Entries are written to a temporary file and renamed into place,
+        so concurrent readers never see a partial entry.
+        '''
+        header = pickle.dumps(
+            (
+                unit.code.literals,
+                unit.code.symbols,
+                unit.code.lines,
+                list(unit.pool),
+                unit.result,
+                unit.registers,
+                unit.frames,
+                unit.eliminated,
+            ),
+            pickle.HIGHEST_PROTOCOL,
+        )
+
+        if not os.path.isdir(self.directory):
+            os.makedirs(self.directory)
+
+        fd, temp = tempfile.mkstemp(suffix=SUFFIX, dir=self.directory)
+        try:
+            with os.fdopen(fd, 'wb') as stream:
+                stream.write(MAGIC)
+                stream.write(_LENGTH.pack(len(header)))
+                stream.write(header)
+                stream.write(unit.code.tostring())
+
+            os.rename(temp, self.path(key))
+        except:
+            os.remove(temp)
+            raise
+
+    def _read(self, path):
+        with open(path, 'rb') as stream:
+            size = os.fstat(stream.fileno()).st_size
+
+            if size < len(MAGIC) + _LENGTH.size:
+                return None
+
+            if stream.read(len(MAGIC)) != MAGIC:
+                return None
+
+            length, = _LENGTH.unpack(stream.read(_LENGTH.size))
+
+            header = pickle.loads(stream.read(length))
+            literals, symbols, lines, pool, result, registers, frames, eliminated = header
+
+            words, remainder = divmod(size - stream.tell(), WORD_SIZE)
+
+            if remainder:
+                return None
+
+            code = Bytecode.fromfile(stream, words, literals, symbols, lines)
+
+        return CompiledUnit(
+            code=code,
+            pool=pool,
+            result=result,
+            registers=registers,
+            frames=frames,
+            eliminated=eliminated,
+        )
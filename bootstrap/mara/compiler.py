@@ -4,6 +4,8 @@ Compiler.py
 Translate AST to Mara Bytecode.
 '''
 
+import heapq
+
 import node
 import scope
 import special
@@ -20,8 +22,12 @@ class CompileError(Exception, deriving('eq', 'show')):
 
 
 class Registry(deriving('show')):
+    '''
+    Hands out virtual registers, which the Allocator later maps onto
+    physical registers.  Register 0 is reserved for return values.
+    '''
     def __init__(self):
-        self.counter = -1
+        self.counter = 0
         self.regs = {}
 
     def __call__(self, i):
@@ -66,6 +72,225 @@ class RegistryFrame(deriving('show', 'eq')):
     def label(self, name):
         return '{f}_{n}'.format(f=self.unique_name, n=name)
 
+
+class Function(deriving('show', 'eq')):
+    '''
+    The span of a compiled function body within the compiler's block,
+    the number of stack slots used by its locals, params included, and the
+    positions of the tail calls it makes.  A function whose body ends in a
+    tail call has no restore, as it never returns from its own frame, and
+    ends at that tail call instead.
+    '''
+    def __init__(self, name, save, restore, slots, tail_calls=None, end=None):
+        self.name = name
+        self.save = save
+        self.restore = restore
+        self.slots = slots
+        self.tail_calls = tail_calls if tail_calls is not None else []
+        self.end = end if end is not None else restore
+
+
+# Positions of the register operands of each instruction.
+_REGISTER_OPERANDS = {
+    'load_v': (0,),
+    'load_c': (0,),
+    'load_a': (0,),
+    'load_p': (0,),
+    'store_p': (0,),
+    'copy': (0, 1),
+    'phi': (0, 1, 2),
+    'branch_zero': (0,),
+    'branch_one': (0,),
+    'branch_eq': (0, 1),
+    'jump': (),
+    'label': (),
+    'reserve': (),
+    'ret': (),
+    'halt': (),
+}
+
+_REGISTER_OPERANDS.update(
+    (op, (0, 1, 2))
+    for op in ['add', 'sub', 'mul', 'div', 'rem', 'lt', 'lte', 'gt', 'gte', 'eq', 'neq']
+)
+
+_JUMPS = {
+    'jump': 0,
+    'branch_zero': 1,
+    'branch_one': 1,
+    'branch_eq': 2,
+}
+
+# bump whenever generated code changes, to invalidate cached bytecode
+VERSION = 5
+
+MAX_REGISTERS = 256
+
+# stack slots used by every call: result register, return address, frame pointer
+CALL_FRAME = 3
+
+
+class Allocator(object):
+    '''
+    Linear scan register allocation.
+
+    Each function body, and the top level code outside of any function,
+    is allocated independently, so registers are reused between functions
+    and between values within a function whose live ranges do not overlap.
+    '''
+
+    def __init__(self, max_registers=MAX_REGISTERS):
+        self.max_registers = max_registers
+
+    def allocate(self, block, start, functions):
+        '''
+        Rewrite block[start:] in place to use physical registers.
+
+        Returns the mapping of virtual to physical registers for each region,
+        keyed by function name (None for the top level).
+        '''
+        owners = self._owners(block, start, functions)
+
+        regions = {}
+        for index in range(start, len(block)):
+            regions.setdefault(owners[index], []).append(index)
+
+        mappings = {}
+        for name, indices in regions.items():
+            mappings[name] = self._allocate_region(block, indices)
+
+        return mappings
+
+    def _owners(self, block, start, functions):
+        '''
+        The innermost function containing each instruction.
+        '''
+        owners = {index: None for index in range(start, len(block))}
+
+        # assign outer functions first so that inner functions win
+        outermost_first = sorted(functions, key=lambda f: f.save - f.end)
+
+        for function in outermost_first:
+            for index in range(function.save, function.end + 1):
+                owners[index] = function.name
+
+        return owners
+
+    def _allocate_region(self, block, indices):
+        intervals = self._intervals(block, indices)
+
+        # register 0 is reserved, the rest are free
+        free = range(1, self.max_registers)
+        active = []
+        mapping = {}
+
+        for reg, (begin, end) in sorted(intervals.items(), key=lambda item: item[1]):
+
+            # expire intervals that ended before this one begins
+            for other in list(active):
+                if intervals[other][1] < begin:
+                    active.remove(other)
+                    heapq.heappush(free, mapping[other])
+
+            if not free:
+                raise CompileError(
+                    'Register allocation failed: more than {n} live registers.',
+                    n=self.max_registers - 1,
+                )
+
+            # take the lowest numbered free register
+            mapping[reg] = heapq.heappop(free)
+            active.append(reg)
+
+        for index in indices:
+            block[index] = self._rewrite(block[index], mapping)
+
+        return mapping
+
+    def _intervals(self, block, indices):
+        '''
+        Live intervals of each virtual register over the region's positions.
+        '''
+        intervals = {}
+        labels = {}
+        jumps = []
+
+        for position, index in enumerate(indices):
+            code = block[index]
+            if code is None:
+                continue
+
+            op = code[0]
+            if op == 'label':
+                labels[code[1]] = position
+
+            if op in _JUMPS:
+                jumps.append((position, code[_JUMPS[op] + 1]))
+
+            for reg in self._registers(code):
+                begin, end = intervals.get(reg, (position, position))
+                intervals[reg] = (min(begin, position), max(end, position))
+
+        # values live across a loop's back edge are live for the whole loop
+        loops = [
+            (labels[label], position)
+            for position, label in jumps
+            if label in labels and labels[label] <= position
+        ]
+
+        changed = True
+        while changed:
+            changed = False
+
+            for top, bottom in loops:
+                for reg, (begin, end) in intervals.items():
+                    overlaps = begin <= bottom and end >= top
+                    escapes = begin < top or end > bottom
+
+                    if overlaps and escapes:
+                        extended = (min(begin, top), max(end, bottom))
+
+                        if extended != (begin, end):
+                            intervals[reg] = extended
+                            changed = True
+
+        return intervals
+
+    def _positions(self, code):
+        '''
+        The operand positions of code that hold virtual registers.
+        '''
+        op = code[0]
+
+        # call func, *params
+        if op == 'call':
+            positions = range(1, len(code) - 1)
+        # tail_call func, count, *params
+        elif op == 'tail_call':
+            positions = range(2, 2 + code[2])
+        else:
+            try:
+                positions = _REGISTER_OPERANDS[op]
+            except KeyError:
+                raise CompileError('Cannot allocate registers for {op}.', op=op)
+
+        # register 0 is the physical return value register
+        return [i for i in positions if code[i + 1] != 0]
+
+    def _registers(self, code):
+        return [code[i + 1] for i in self._positions(code)]
+
+    def _rewrite(self, code, mapping):
+        if code is None:
+            return code
+
+        rewritten = list(code)
+        for i in self._positions(code):
+            rewritten[i + 1] = mapping[code[i + 1]]
+
+        return tuple(rewritten)
+
+
 class Compiler(object):
     '''
     Compilation Visitor
@@ -85,14 +310,28 @@ class Compiler(object):
         '!=': 'neq',
     }
 
-    def __init__(self):
+    def __init__(self, max_registers=MAX_REGISTERS):
         self.root = scope.Root()
         self.scope = self.root
 
         self.block = []
         self.registry = Registry()
-        self.functions = {}
+
+        # the source span of each instruction in block
+        self.spans = []
+        self._span = None
+
+        self.allocator = Allocator(max_registers=max_registers)
+        self.functions = []
         self.pool = None
+        self.tables = None
+
+        # positions of the tail calls in the function being compiled
+        self._tail_calls = None
+
+        # reported to the machine to size its register file and stack
+        self.max_register = 0
+        self.frames = {}
 
         self._result = None
 
@@ -103,23 +342,53 @@ class Compiler(object):
         self._result = reg
         return reg
 
-    def compile(self, ast, pool):
+    def compile(self, ast, pool, tables):
         self.pool = pool
+        self.tables = tables
+        self.functions = []
+
+        start = len(self.block)
+
         try:
-            bytecodes = self.visit(ast)
+            bytecodes = self.visit_child(ast)
+            mappings = self.allocator.allocate(self.block, start, self.functions)
         except CompileError:
             for i, code in enumerate(self.block):
                 print i, ':', code
             raise
-        bytecodes.append(('halt',))
+
+        for mapping in mappings.values():
+            self.max_register = max([self.max_register] + mapping.values())
+
+        # functions save and restore only the physical registers they use
+        for function in self.functions:
+            regs = sorted(set(mappings.get(function.name, {}).values()))
+            self.patch(function.save, tuple(['save'] + regs))
+
+            if function.restore is not None:
+                self.patch(function.restore, tuple(['restore'] + regs))
+
+            # tail calls restore the registers themselves before reusing the frame
+            for index in function.tail_calls:
+                self.block[index] = self.block[index] + tuple(regs)
+
+            self.frames[function.name] = CALL_FRAME + function.slots + len(regs)
+
+        # the result is computed by top level code
+        if self._result is not None:
+            self._result = mappings.get(None, {}).get(self._result, self._result)
+
+        self.emit(('halt',))
         return bytecodes
 
     def emit(self, *instructions):
         self.block += instructions
+        self.spans += [self._span] * len(instructions)
 
     def hole(self):
         index = len(self.block)
         self.block.append(None)
+        self.spans.append(self._span)
         return index
 
     def patch(self, index, instruction):
@@ -127,6 +396,25 @@ class Compiler(object):
             raise ValueError('Must patch a hole, not ' + str(self.block[index]))
         self.block[index] = instruction
 
+    def load_constant(self, n):
+        '''
+        Load a literal, as an immediate if the pool inlined it.
+        '''
+        r = self.registry.frame()
+
+        is_immediate, value = constant.unpack(self.tables.constant[n])
+
+        if is_immediate:
+            self.emit(
+                ('load_v', r(0), value),
+            )
+        else:
+            self.emit(
+                ('load_c', r(0), value),
+            )
+
+        return r(0)
+
     @multimethod(_store)
     def visit(self, n):
         raise TypeError('Node type {n} not yet supported for compilation'.format(n=n.__class__))
@@ -137,38 +425,20 @@ class Compiler(object):
 
     @visit.d(node.Int)
     def _(self, n):
-        r = self.registry.frame()
-
-        self.emit(
-            ('load_c', r(0), n['constant']),
-        )
-
-        return r(0)
+        return self.load_constant(n)
 
     @visit.d(node.Bool)
     def _(self, n):
-        r = self.registry.frame()
-
-        self.emit(
-            ('load_c', r(0), n['constant'])
-        )
-
-        return r(0)
+        return self.load_constant(n)
 
     @visit.d(node.Real)
     def _(self, n):
-        r = self.registry.frame()
-
-        self.emit(
-            ('load_c', r(0), n['constant']),
-        )
-
-        return r(0)
+        return self.load_constant(n)
 
     @visit.d(node.Val)
     def _(self, n):
-        result = self.visit(n.value)
-        index = n['index']
+        result = self.visit_child(n.value)
+        index = self.tables.index[n]
 
         self.emit(
             ('store_p', result, index),
@@ -178,9 +448,9 @@ class Compiler(object):
 
     @visit.d(node.Var)
     def _(self, n):
-        result = self.visit(n.value)
+        result = self.visit_child(n.value)
 
-        index = n['index']
+        index = self.tables.index[n]
 
         self.emit(
             ('store_p', result, index)
@@ -194,9 +464,9 @@ class Compiler(object):
 
         identifier = n.value
 
-        declaration = n['namespace'][identifier]
+        declaration = self.tables.namespace[n][identifier]
 
-        index = declaration['index']
+        index = self.tables.index[declaration]
 
         self.emit(
             ('load_p', r(0), index)
@@ -208,11 +478,11 @@ class Compiler(object):
     def _(self, n):
         identifier = n.name.value
 
-        declaration = n['namespace'][identifier]
+        declaration = self.tables.namespace[n][identifier]
 
-        index = declaration['index']
+        index = self.tables.index[declaration]
 
-        result = self.visit(n.value)
+        result = self.visit_child(n.value)
 
         self.emit(
             ('store_p', result, index)
@@ -223,7 +493,7 @@ class Compiler(object):
     @visit.d(node.Param)
     def _(self, n):
         r = self.registry.frame()
-        index = n['index']
+        index = self.tables.index[n]
 
         self.emit(
             ('load_p', r(0), index),
@@ -236,49 +506,72 @@ class Compiler(object):
         r = self.registry.frame()
         l = r.label
 
-        local_variables = n['locals']
+        local_variables = self.tables.locals_[n]
 
-        #  +1 for address load, +1 for hole, +1 for label
-        address = len(self.block) + 3
+        # the function body begins after the entry label, named for debugging,
+        # which the enclosing block has usually declared already
+        address = self.tables.address.get(n)
+        if address is None:
+            address = self.declare(n)
 
         # store the address of the function as the result.
         self.emit(
-            ('load_v', r(0), address),
-            ('label', l('skip_label')),
+            ('load_a', r(0), address),
             ('jump', l('end')),
+            ('label', address),
         )
 
         # set attributes
-        n['address'] = address
         n['result'] = r(0)
 
-        # reserve space for local variables
+        # reserve space for local variables, the params are already pushed
         self.emit(
-            ('reserve', len(local_variables)),
+            ('reserve', len(local_variables) - len(n.param.values)),
         )
         save = self.hole()
 
-        # track what registers we use in the function,
-        # +1 because register numbers start at 1 (0 is special)
-        reg_begin_index = self.registry.counter + 1
+        # calls whose result is returned directly reuse this function's frame
+        for call in self.tail_calls(n.body):
+            call['tail'] = True
 
-        # generate the function body
-        ret = self.visit(n.body)
+        outer_tail_calls = self._tail_calls
+        self._tail_calls = []
 
-        # record the registers we used
-        reg_end_index = self.registry.counter + 1
-        local_registers = range(reg_begin_index, reg_end_index)
+        # generate the function body
+        try:
+            ret = self.visit_child(n.body)
+            tail_calls = self._tail_calls
+        finally:
+            self._tail_calls = outer_tail_calls
+
+        # generate the return of the result, unless the body never returns here
+        end = None
+
+        if self.after_tail_call():
+            restore = None
+            end = len(self.block) - 1
+        else:
+            self.emit(
+                ('copy', 0, ret),
+            )
+            restore = self.hole()
+            self.emit(
+                ('ret',),
+            )
 
-        # generate the return of the result
         self.emit(
-            ('copy', 0, ret),
-            tuple(['restore'] + local_registers),
-            ('ret',),
             ('label', l('end')),
         )
 
-        # patch in the save
-        self.patch(save, tuple(['save'] + local_registers))
+        # the allocator fills in the save and restore of the registers used
+        self.functions.append(Function(
+            name=address,
+            save=save,
+            restore=restore,
+            slots=len(local_variables),
+            tail_calls=tail_calls,
+            end=end,
+        ))
 
         return self.result(r(0))
 
@@ -291,13 +584,13 @@ class Compiler(object):
         self.emit(('label', l('begin')))
 
         # compute the predicate
-        pred_result = self.visit(n.pred)
+        pred_result = self.visit_child(n.pred)
 
         # generate the skip
         self.emit(('branch_zero', pred_result, l('end')))
 
         # generate the body
-        loop_result = self.visit(n.body)
+        loop_result = self.visit_child(n.body)
 
         # loop
         self.emit(('jump', l('begin')))
@@ -314,17 +607,27 @@ class Compiler(object):
         identifier = n.func.value
 
         # lookup the function's declaration
-        declaration = n['namespace'][identifier]
+        declaration = self.tables.namespace[n][identifier]
 
         # lookup the address of the function body
-        address = declaration['address']
+        address = self.tables.address[declaration]
 
         # generate evaluations of all the arguments
         arg_registers = [
-            self.visit(value)
+            self.visit_child(value)
             for value in n.arg.values
         ]
 
+        # a tail call never returns here, once registers are allocated
+        # the registers to restore before it jumps are appended to it
+        if 'tail' in n and n['tail']:
+            self._tail_calls.append(len(self.block))
+            self.emit(
+                tuple(['tail_call', address, len(arg_registers)] + arg_registers),
+            )
+
+            return self.result(0)
+
         # generate the call
         self.emit(
             tuple(['call', address] + arg_registers),
@@ -347,9 +650,9 @@ class Compiler(object):
         if op is None:
             raise CompileError('BinOp {func} is not supported.', func=func)
 
-        left = self.visit(left_expr)
+        left = self.visit_child(left_expr)
 
-        right = self.visit(right_expr)
+        right = self.visit_child(right_expr)
 
         self.emit(
             (op, r(0), left, right),
@@ -366,23 +669,36 @@ class Compiler(object):
         if_body_expr = n.if_body
         else_body_expr = n.else_body
 
-        pred = self.visit(pred_expr)
+        pred = self.visit_child(pred_expr)
 
         self.emit(('branch_zero', pred, l('else_body')))
 
-        body_result = self.visit(if_body_expr)
+        body_result = self.visit_child(if_body_expr)
+        body_tail_call = self.after_tail_call()
+
+        # a branch ending in a tail call never reaches the end of the if
+        if not body_tail_call:
+            self.emit(
+                ('copy', r(0), body_result),
+                ('jump', l('if_end')),
+            )
 
         self.emit(
-            ('jump', l('if_end')),
             ('label', l('else_body')),
         )
 
-        else_result = self.visit(else_body_expr)
+        else_result = self.visit_child(else_body_expr)
 
-        self.emit(('label', l('if_end')))
+        if self.after_tail_call():
+            if body_tail_call:
+                return self.result(0)
+        else:
+            self.emit(
+                ('copy', r(0), else_result),
+            )
 
         self.emit(
-            ('phi', r(0), body_result, else_result)
+            ('label', l('if_end')),
         )
 
         return self.result(r(0))
@@ -401,8 +717,10 @@ class Compiler(object):
     def _(self, n):
         exprs = n.exprs
 
+        self.declare_all(exprs)
+
         for expr in exprs:
-            self.visit(expr)
+            self.visit_child(expr)
 
         return self.block
 
@@ -413,7 +731,82 @@ class Compiler(object):
         if len(exprs) == 0:
             raise CompileError('Empty Blocks not yet supported.')
 
+        self.declare_all(exprs)
+
         for expr in exprs:
-            result = self.visit(expr)
+            result = self.visit_child(expr)
 
         return self.result(result)
+
+    ##########################################################################
+    # Function Addresses
+    ##########################################################################
+
+    def declare(self, n):
+        '''
+        Give a Def its entry label.  Calls jump to the label, which the
+        assembler resolves, so it can be given before the body is compiled.
+        '''
+        address = self.registry.frame().label(n.name.value)
+        self.tables.address[n] = address
+
+        return address
+
+    def declare_all(self, exprs):
+        '''
+        Declare every function defined among exprs before compiling any of
+        them, so calls to functions defined later, including mutually
+        recursive calls, find their address.
+        '''
+        for expr in exprs:
+            if isinstance(expr, node.Def):
+                self.declare(expr)
+
+    ##########################################################################
+    # Tail Calls
+    ##########################################################################
+
+    def tail_calls(self, n):
+        '''
+        The calls whose result is the result of n: the last expression of a
+        block and both branches of an if, but not the bodies of nested
+        functions, which are compiled separately.
+        '''
+        if isinstance(n, node.Call):
+            return [n]
+
+        if isinstance(n, node.Block):
+            # joined else clauses leave NoOps behind
+            exprs = [expr for expr in n.exprs if not isinstance(expr, node.NoOp)]
+            return self.tail_calls(exprs[-1]) if exprs else []
+
+        if isinstance(n, node.If):
+            return self.tail_calls(n.if_body) + self.tail_calls(n.else_body)
+
+        return []
+
+    def after_tail_call(self):
+        '''
+        Whether the last instruction emitted is a tail call, which never
+        returns, so nothing emitted after it on the same path would run.
+        '''
+        return bool(self.block) and self.block[-1] is not None and self.block[-1][0] == 'tail_call'
+
+    ##########################################################################
+    # Source Spans
+    ##########################################################################
+
+    def visit_child(self, n):
+        '''
+        Compile a node, attributing the instructions emitted to its span,
+        or to the span of the closest enclosing node that has one.
+        '''
+        outer = self._span
+
+        if n.span is not None:
+            self._span = n.span
+
+        try:
+            return self.visit(n)
+        finally:
+            self._span = outer
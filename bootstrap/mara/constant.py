@@ -1,22 +1,84 @@
+from array import array
+
 from util.dispatch import method_store, multimethod
 import node
 
 
+# the kinds of constant, each stored in its own array
+INT, REAL, OBJECT = range(3)
+
+# ints in this range are loaded as immediates instead of pooled
+SMALL_INT_MIN = -(1 << 15)
+SMALL_INT_MAX = (1 << 15) - 1
+
+
+# Each literal's word in the constant table is either the index of its value in
+# the pool, or an immediate value, tagged by the low bit.  Immediates are
+# offset by SMALL_INT_MIN, so that every word is non-negative.
+
+def pooled(index):
+    '''
+    The constant word of a literal pooled at index.
+    '''
+    return index << 1
+
+
+def immediate(value):
+    '''
+    The constant word of a literal loaded as the immediate value.
+    '''
+    return ((value - SMALL_INT_MIN) << 1) | 1
+
+
+def unpack(word):
+    '''
+    Whether a constant word is an immediate, and its value or pool index.
+    '''
+    if word & 1:
+        return True, (word >> 1) + SMALL_INT_MIN
+
+    return False, word >> 1
+
+
 class ConstantPool(object):
     '''
     A pool for holding compile time constants.
+
+    Each distinct constant is stored once, ints and reals in typed arrays.
+    Small ints and bools are not pooled at all: their constant word holds
+    an immediate value to load directly instead of a pool index.
     '''
 
+    walk = 'down'
+    requires = ('ConstantFold',)
+
     _store = method_store()
 
-    def __init__(self):
-        self._pool = []
+    def __init__(self, tables):
+        self.tables = tables
+
+        self._ints = array('l')
+        self._reals = array('d')
+        self._objects = []
+
+        self._arrays = (self._ints, self._reals, self._objects)
+
+        # the kind of each constant and its offset within that kind's array
+        self._kinds = array('B')
+        self._offsets = array('l')
+
+        # the index of each constant, by kind and value
+        self._indices = {}
+
+    def __len__(self):
+        return len(self._kinds)
 
-        self._add(node.Bool('0'), lambda n: int(n.value))
-        self._add(node.Bool('1'), lambda n: int(n.value))
+    def __getitem__(self, index):
+        return self._arrays[self._kinds[index]][self._offsets[index]]
 
-    def __getitem__(self, key):
-        return self._pool.__getitem__(key)
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self[index]
 
     @multimethod(_store)
     def visit(self, n):
@@ -24,22 +86,54 @@ class ConstantPool(object):
 
     @visit.d(node.Int)
     def _(self, n):
-        self._add(n, lambda n: int(n.value))
+        value = int(n.value)
+
+        if SMALL_INT_MIN <= value <= SMALL_INT_MAX:
+            self.tables.constant[n] = immediate(value)
+        else:
+            self.tables.constant[n] = pooled(self.add(value))
 
     @visit.d(node.Real)
     def _(self, n):
-        self._add(n, lambda n: float(n.value))
+        self.tables.constant[n] = pooled(self.add(float(n.value)))
 
     @visit.d(node.Bool)
     def _(self, n):
         if n.value == '0':
-            n['constant'] = 0
+            self.tables.constant[n] = immediate(0)
+        else:
+            self.tables.constant[n] = immediate(1)
+
+    def add(self, value):
+        '''
+        The index of value in the pool, adding it if it is not already pooled.
+        '''
+        if isinstance(value, float):
+            # the exact bits, so that 0.0 and -0.0 stay distinct and nan is shared
+            kind, key = REAL, value.hex()
+        elif isinstance(value, (int, long)):
+            kind, key = INT, value
         else:
-            n['constant'] = 1
+            kind, key = OBJECT, value
+
+        try:
+            return self._indices[kind, key]
+        except KeyError:
+            lookup = (kind, key)
+
+        values = self._arrays[kind]
+
+        try:
+            values.append(value)
+        except OverflowError:
+            # too large for a machine word
+            kind, values = OBJECT, self._objects
+            values.append(value)
+
+        index = len(self._kinds)
 
-    def _add(self, n, accessor):
-        index = len(self._pool)
-        value = accessor(n)
+        self._kinds.append(kind)
+        self._offsets.append(len(values) - 1)
+        self._indices[lookup] = index
 
-        self._pool.append(value)
-        n['constant'] = index
+        return index
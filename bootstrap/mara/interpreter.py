@@ -11,8 +11,12 @@ import os
 import mara.special as special
 import mara.passes as passes
 import mara.constant as constant
+import mara.tables as tables
 
-from machine import Machine
+from assembler import Assembler
+from bytecode import encode
+from cache import BytecodeCache, CompiledUnit
+from machine import Machine, MAX_DEPTH
 from compiler import Compiler
 from parser import Parser
 
@@ -61,22 +65,37 @@ class MaraCompleter(object):
 
 class Interpreter(object):
 
-    def __init__(self, buffered=False, traced=False, shell=False, history=True):
+    def __init__(self, buffered=False, traced=False, shell=False, history=True, fuse=True,
+                 cache_dir=None, profiled=False, timed=False, max_depth=MAX_DEPTH):
         self.compiler = Compiler()
         self.parser = Parser()
-        self.machine = Machine(buffered=buffered, traced=traced)
+        self.machine = Machine(
+            buffered=buffered,
+            traced=traced,
+            fuse=fuse,
+            profiled=profiled,
+            max_depth=max_depth,
+        )
         self.completer = MaraCompleter()
+        self.cache = BytecodeCache(cache_dir) if cache_dir is not None else None
+
+        # the time spent in each compiler pass, if timed
+        self.pass_times = passes.PassTimes() if timed else None
+
+        # the dispatches removed by fusing the instructions of all code evaluated
+        self.eliminated = 0
 
         if shell:
             self.mara_dir = os.path.join(os.path.expanduser("~"), '.mara')
             if not os.path.exists(self.mara_dir):
                 os.mkdir(self.mara_dir)
 
-        if history:
+        if shell and history:
             self.history_filename = os.path.join(self.mara_dir, "history.txt")
 
         self.isbuffered = buffered
         self.istraced = traced
+        self.isfused = fuse
         self.position = 0
 
         self.init_readline()
@@ -97,31 +116,95 @@ class Interpreter(object):
     def eval_mara(self, line, type_check=False):
         module = 'module main_{0}\n{1}\nend'.format(self.position, line)
 
+        return self.evaluate(module, type_check=type_check)
+
+    def evaluate(self, module, type_check=False):
+        key = None
+        unit = None
+
+        if self.cache is not None:
+            key = self.cache.key(module, type_check=type_check, fuse=self.isfused)
+            unit = self.cache.load(key)
+
+        if unit is None:
+            unit = self.compile(module, type_check=type_check)
+
+            if self.cache is not None:
+                self.cache.store(key, unit)
+
+        self.eliminated += unit.eliminated
+
+        start = self.machine._load(
+            unit.code,
+            unit.pool,
+            registers=unit.registers,
+            frames=unit.frames,
+        )
+        self.machine._loop(start)
+
+        return self.machine._regs[unit.result]
+
+    def evaluate_file(self, filename, type_check=False):
+        '''
+        Evaluate a source file, caching its bytecode in a __maracache__
+        directory beside it unless the interpreter has its own cache.
+        '''
+        with open(filename) as stream:
+            module = stream.read()
+
+        if self.cache is not None:
+            return self.evaluate(module, type_check=type_check)
+
+        directory = os.path.join(os.path.dirname(os.path.abspath(filename)), '__maracache__')
+        self.cache = BytecodeCache(directory)
+        try:
+            return self.evaluate(module, type_check=type_check)
+        finally:
+            self.cache = None
+
+    def compile(self, module, type_check=False):
+        '''
+        Compile a module to a self contained unit of encoded bytecode.
+        '''
+        # the side tables of this compilation, made first to hold every node of the tree
+        context = tables.Tables()
         ast = self.parser.parse(module)
 
-        ast.walk_down(passes.JoinElse())
-        ast.walk_down(passes.ModuleFunction(), short_circuit=True)
-        ast.walk_down(passes.CollectNames())
-        ast.walk_down(passes.CollectLocals())
+        manager = passes.PassManager(times=self.pass_times)
+
+        manager.add(passes.JoinElse())
+        manager.add(passes.ModuleFunction())
+        manager.add(passes.CollectNames(context))
+        manager.add(passes.CollectLocals(context))
 
         if type_check:
-            ast.walk_up(passes.TypeCheck())
+            manager.add(passes.TypeCheck(context))
 
-        pool = constant.ConstantPool()
-        ast.walk_down(pool)
+        manager.add(passes.ConstantFold(context))
+        pool = manager.add(constant.ConstantPool(context))
 
-        bytecode = self.compiler.compile(ast, pool)
+        manager.run(ast)
 
-        result = self.compiler.result()
+        start = len(self.compiler.block)
+        bytecode = self.compiler.compile(ast, pool, context)[start:]
+        spans = self.compiler.spans[start:]
 
         if self.istraced:
             for i, code in enumerate(bytecode):
                 print '{0}:\t{1}'.format(i, code)
 
-        start = self.machine._load(bytecode, pool)
-        self.machine._loop(start)
-
-        return self.machine._regs[result]
+        # the code for each module only refers to its own labels and constants
+        assembler = Assembler(fuse=self.isfused)
+        assembled = assembler.assemble(bytecode, spans)
+
+        return CompiledUnit(
+            code=encode(assembled, symbols=assembler.symbols, lines=assembler.lines),
+            pool=list(pool),
+            result=self.compiler.result(),
+            registers=self.compiler.max_register + 1,
+            frames=dict(self.compiler.frames),
+            eliminated=assembler.eliminated,
+        )
 
     def eval_shell(self, line):
         cmd = line[1:]
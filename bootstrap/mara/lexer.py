@@ -1,7 +1,6 @@
 '''
 Mara Language Lexer
 '''
-import re
 from collections import namedtuple
 from ply.lex import TOKEN
 
@@ -86,6 +85,7 @@ def t_MODULE(tok):
     'module'
     tok.lexer.begin('code')
     tok.lexer.marabalancer = Balancer()
+    tok.lexer.maranewline = (tok.lexer.lexpos, False)
     return tok
 
 def t_OUTER(tok):
@@ -281,9 +281,10 @@ def t_code_TID(tok):
 
 SYMA = r'[~!?<>]'
 SYMB = r'[&|%=+\-^*/:]'
-SYMC = r'(\{|\[|\(|\\)'
-SYM_REGEX = re.compile(r'{A}|{B}|{C}'.format(A=SYMA, B=SYMB, C=SYMC))
-WHITESPACE = re.compile(r'[ \t\r\n]')
+
+# characters after which a newline does not terminate an expression
+SYMBOL_CHARS = frozenset('~!?<>' '&|%=+-^*/:' '{[(\\')
+WHITESPACE_CHARS = frozenset(' \t\r\n')
 
 
 @TOKEN(r'{A}+|{B}({A}|{B})+'.format(A=SYMA, B=SYMB))
@@ -297,21 +298,33 @@ def t_code_SID(tok):
 
 def _newline_terminates(tok):
     '''Determines if a newline token is preceded, excluding whitespace, by a terminating character.
+
+    The lexer remembers where the previous newline ended and whether it followed
+    a symbol, so only the whitespace since then is examined and every character
+    is looked at most once.
     '''
+    lexer = tok.lexer
+    lexdata = lexer.lexdata
+    previous_end, previous_symbol = lexer.maranewline
+
     # walk backward to find first non-whitespace char
-    # -1 because the current position is known to be whitespace
-    pos = tok.lexer.lexpos - 1
-    lexdata = tok.lexer.lexdata
+    # -1 because the current token is known to be whitespace
+    pos = tok.lexpos - 1
 
-    while WHITESPACE.match(lexdata[pos]):
+    while pos >= previous_end and lexdata[pos] in WHITESPACE_CHARS:
         pos -= 1
 
-    # check if the character causes a termination
-    after_symbol = SYM_REGEX.match(tok.lexer.lexdata[pos])
+    # only whitespace since the previous newline, which followed the same character
+    if pos < previous_end:
+        after_symbol = previous_symbol
+    else:
+        after_symbol = lexdata[pos] in SYMBOL_CHARS
+
+    lexer.maranewline = (lexer.lexpos, after_symbol)
 
     return (
         not after_symbol
-        and not tok.lexer.marabalancer.isopen()
+        and not lexer.marabalancer.isopen()
     )
 
 
@@ -350,6 +363,18 @@ def lex_simple(lexer, input_stream):
         yield SimpleToken(tok.type, tok.value)
 
 
+_LEXER = None
+
+
 def build_lexer():
-    import ply.lex as lex
-    return lex.lex()
+    '''A new lexer.
+
+    The token rules are compiled once per process and shared by every lexer.
+    '''
+    global _LEXER  # pylint: disable=W0603
+
+    if _LEXER is None:
+        import ply.lex as lex
+        _LEXER = lex.lex()
+
+    return _LEXER.clone()
@@ -3,10 +3,76 @@
 # pylint: disable=R0902
 
 import functools
+import struct
+import time
 
 from collections import defaultdict
 import special
 from assembler import Assembler
+from bytecode import Bytecode
+from profiler import CALLS, OpcodeProfile
+from util.reflection import deriving
+
+# default register file size, enough for any compiled code
+REGISTERS = 256
+
+# default maximum call depth
+MAX_DEPTH = 1024
+
+# default frame size, for code without frame size information
+FRAME_SIZE = 16
+
+# default initial heap size, in cells
+HEAP_SIZE = 8
+
+# default factor the heap grows by when full of live objects
+HEAP_GROWTH = 2
+
+
+class StackOverflow(Exception, deriving('eq', 'show')):
+    def __init__(self, msg, *largs, **kwargs):
+        self.message = msg.format(*largs, **kwargs)
+        super(StackOverflow, self).__init__(self.message)
+
+
+# bytes used by a single heap cell
+CELL_SIZE = struct.calcsize('P')
+
+
+class Pointer(int):
+    '''
+    A pointer to the start of a heap object.
+
+    Pointers are tagged by type so the collector can tell them from integers.
+    Arithmetic on a pointer gives a plain integer, so an offset into an object
+    does not keep it alive; the pointer to its start must.
+    '''
+    __slots__ = ()
+
+
+class HeapStats(deriving('show')):
+    '''
+    Garbage collection statistics.
+    '''
+
+    def __init__(self):
+        self.collections = 0
+        self.total_pause = 0.0
+        self.max_pause = 0.0
+        self.cells_freed = 0
+        self.objects_freed = 0
+
+    @property
+    def bytes_freed(self):
+        return self.cells_freed * CELL_SIZE
+
+    def record(self, pause, cells, objects):
+        self.collections += 1
+        self.total_pause += pause
+        self.max_pause = max(self.max_pause, pause)
+        self.cells_freed += cells
+        self.objects_freed += objects
+
 
 def builtin_comparison(pred):
 
@@ -30,30 +96,103 @@ def builtin_binop(func):
     return inner
 
 
+def fused_compare_branch(pred):
+    '''
+    Superinstruction for a comparison followed by a branch_zero on its result.
+    '''
+
+    @functools.wraps(pred)
+    def inner(self, dst, left, right, address):
+        lhs = self._get(left)
+        rhs = self._get(right)
+
+        value = 1 if pred(self, lhs, rhs) else 0
+        self._set(dst, value)
+
+        if value == 0:
+            self._pc = (address - 1)  # -1 to cancel loop iteration
+
+    return inner
+
+
+def fused_constant_binop(func):
+    '''
+    Superinstruction for a load_c followed by a binop on the loaded constant.
+    '''
+
+    @functools.wraps(func)
+    def inner(self, dst, left, tmp, index):
+        constant = self._pool[index]
+        self._set(tmp, constant)
+
+        value = func(self, self._get(left), constant)
+        self._set(dst, value)
+
+    return inner
+
+
+def fused_immediate_binop(func):
+    '''
+    Superinstruction for a load_v followed by a binop on the loaded value.
+    '''
+
+    @functools.wraps(func)
+    def inner(self, dst, left, tmp, value):
+        self._set(tmp, value)
+
+        value = func(self, self._get(left), value)
+        self._set(dst, value)
+
+    return inner
+
+
 class Machine(object):
     '''
     A simple, register-based virtual machine.
     '''
-    def __init__(self, buffered=False, traced=False):
-        self._assembler = Assembler()
+    def __init__(self, buffered=False, traced=False, trace_hooks=None, fuse=False,
+                 max_depth=MAX_DEPTH, heap_size=HEAP_SIZE, heap_growth=HEAP_GROWTH,
+                 profiled=False):
+        self._assembler = Assembler(fuse=fuse)
 
         self._code = []
-        self._regs_buffer = [None] * 4
+        self._instructions = []
+        self._ops = []
+        self._symbols = {}
+        self._lines = {}
+        self._regs_buffer = []
         self._pc = 0
 
         self._stack_buffer = []
         self._stack_ptr = -1
         self._frame_ptr = 0
+        self._max_depth = max_depth
+
+        if heap_size < 1 or heap_growth <= 1:
+            raise ValueError('Heap size must be positive and growth greater than 1.')
 
-        self._heaplet = [None] * 8
+        self._heaplet = [None] * heap_size
         self._free_ptr = 0
-        self._end_ptr = 7
+        self._end_ptr = heap_size - 1
+        self._heap_growth = heap_growth
+
+        # object headers: the size of the object starting at each address
+        self._objects = {}
+        self._heap_stats = HeapStats()
+
+        # interned symbols: the pointer to each distinct symbol
+        self._symbol_table = {}
 
         self._pool = None  # Constant Pool
 
         self._print_buffer = []
 
-        self._trace = traced
+        self._trace_hooks = list(trace_hooks or [])
+
+        if traced:
+            self._trace_hooks.append(self._print_trace)
+
+        self._profile = OpcodeProfile() if profiled else None
 
         def _buffered_print(arg):
             self._print_buffer.append(arg)
@@ -88,25 +227,104 @@ class Machine(object):
     # Internal Functions
     ##########################################################################
 
-    def _load(self, code, constant_pool=None):
+    def _load(self, code, constant_pool=None, registers=REGISTERS, frames=None):
+        '''
+        Load code, sizing the register file for the given number of
+        registers and the stack for the largest of the given frame sizes.
+
+        Code is either unassembled instructions in tuple form, or
+        already assembled, encoded Bytecode.  Returns the address to start
+        executing from: the end of the previously loaded code for tuple form,
+        which is expected to extend it, or 0 for Bytecode, which is complete.
+
+        The machine does not execute the encoding itself: Bytecode is a
+        storage format, decoded here once into tuple form, from which every
+        instruction is bound to its handler for the run loops.
+        '''
         start = len(self._code)
-        self._code = self._assembler.assemble(code)
+
+        if isinstance(code, Bytecode):
+            start = 0
+            self._code = code
+            self._symbols = code.symbols
+            self._lines = code.lines
+        else:
+            self._code = self._assembler.assemble(code)
+            self._symbols = self._assembler.symbols
+            self._lines = self._assembler.lines
+
+        # decoded once, for the run loops and the profilers
+        self._instructions = list(self._code)
+        self._ops = [self._decode(instruction) for instruction in self._instructions]
         self._pool = constant_pool
 
+        frame_size = max(frames.values()) if frames else FRAME_SIZE
+
+        # grow the register file and stack now, so they never grow at runtime
+        self._grow(self._regs_buffer, registers)
+        self._grow(self._stack_buffer, frame_size * self._max_depth)
+
         return start
 
-    def _describe(self):
+    def _grow(self, buffer_, size):
         '''
-        The instruction about to be executed.
+        Grow a buffer in place to at least size elements.
         '''
-        return '{pc}: {instruction}'.format(
-            pc=self._pc,
-            instruction=' '.join(str(instruction) for instruction in self._code[self._pc])
+        if size > len(buffer_):
+            buffer_.extend([None] * (size - len(buffer_)))
+
+    def _decode(self, instruction):
+        '''
+        Bind an assembled instruction to its handler, capturing the operands.
+        '''
+        bytecode = instruction[0]
+        handler = getattr(self, bytecode, self.on_error)
+
+        return functools.partial(handler, *instruction[1:])
+
+    def _add_trace_hook(self, hook):
+        '''
+        Register a hook called as hook(pc, instruction, regs) after every
+        instruction executes, where regs is a snapshot of the registers.
+        '''
+        self._trace_hooks.append(hook)
+
+    def _remove_trace_hook(self, hook):
+        '''
+        Unregister a previously added trace hook.
+        '''
+        self._trace_hooks.remove(hook)
+
+    def _print_trace(self, pc, instruction, regs):
+        '''
+        Trace hook that prints each instruction and the resulting machine state.
+        '''
+        print(self._describe(pc, instruction))
+        print(self._describe_result(pc, regs))
+
+    def _describe(self, pc, instruction):
+        '''
+        The instruction at pc, preceded by the labels that refer to it,
+        and followed by its source location if known.
+        '''
+        labels = ''.join(
+            '<{0}> '.format(name)
+            for name in self._symbols.get(pc, [])
         )
 
-    def _describe_result(self):
+        span = self._lines.get(pc)
+        source = '  @{0}'.format(span) if span is not None else ''
+
+        return '{pc}: {labels}{instruction}{source}'.format(
+            pc=pc,
+            labels=labels,
+            instruction=' '.join(str(arg) for arg in instruction),
+            source=source,
+        )
+
+    def _describe_result(self, pc, regs):
         '''
-        State of the machine after executing an instruction.
+        State of the machine after executing the instruction at pc.
         '''
         base_stack = []
         stack_fill = None
@@ -132,106 +350,315 @@ class Machine(object):
             stack_view.append(fp + sp + elem_str)
 
         return '{pc}= {{{regs}}} [{stack}]'.format(
-            pc=self._pc,
-            regs=', '.join('r{0}:{1}'.format(r, v) for r, v in self._regs.items()),
+            pc=pc,
+            regs=', '.join('r{0}:{1}'.format(r, v) for r, v in regs.items()),
             stack=', '.join(stack_view),
         )
 
-    def _loop(self, start):
+    def _loop(self, start=0):
         '''
         Main Interpretor Loop.
+
+        Runs the bare loop unless profiling or trace hooks are registered,
+        so plain execution pays nothing for either.
         '''
         if len(self._code) == 0:
             return
 
-        end = len(self._code)
+        if self._profile is not None:
+            self._run_profiled(start)
+        elif self._trace_hooks:
+            self._run_traced(start)
+        else:
+            self._run(start)
+
+    def _run(self, start):
+        '''
+        Execute from start until halting or falling off the end of the code.
+        '''
+        ops = self._ops
+        end = len(ops)
+        halt = special.HALT
+
         self._pc = start
-        # iterations = 0
 
-        while self._pc < end:
-            # if iterations > 100:
-            #     print('max iterations')
-            #     break
+        try:
+            while self._pc < end:
+                if ops[self._pc]() is halt:
+                    break
+
+                self._pc += 1
 
-            if self._trace:
-                print(self._describe())
+        except IndexError:
+            self._check_overflow()
+            raise
 
-            code = self._code[self._pc]
-            bytecode = code[0]
+    def _run_traced(self, start):
+        '''
+        Execute like _run, reporting every instruction to the trace hooks.
+        '''
+        code = self._instructions
+        ops = self._ops
+        hooks = self._trace_hooks
+        end = len(ops)
 
-            result = getattr(self, bytecode, self.on_error)(*code[1:])
+        self._pc = start
 
-            if self._trace:
-                print(self._describe_result())
+        try:
+            while self._pc < end:
+                pc = self._pc
+                result = ops[pc]()
+
+                regs = self._regs
+                for hook in hooks:
+                    hook(pc, code[pc], regs)
+
+                if result is special.HALT:
+                    break
 
-            if result is special.HALT:
-                break
-            else:
                 self._pc += 1
 
-            # iterations += 1
+        except IndexError:
+            self._check_overflow()
+            raise
+
+    def _run_profiled(self, start):
+        '''
+        Execute like _run, recording every instruction in the profile.
+        '''
+        ops = self._ops
+        names = [instruction[0] for instruction in self._instructions]
+        end = len(ops)
+        halt = special.HALT
+        clock = time.time
+
+        profile = self._profile
+        counts = profile.counts
+        times = profile.times
+        hits = profile.hits
+        calls = profile.calls
+
+        self._pc = start
+
+        try:
+            while self._pc < end:
+                pc = self._pc
+                name = names[pc]
+
+                began = clock()
+                result = ops[pc]()
+                times[name] += clock() - began
+
+                counts[name] += 1
+                hits[pc] += 1
+
+                if name in CALLS:
+                    # the pc is left just before the called function
+                    calls[self._pc + 1] += 1
+
+                if result is halt:
+                    break
+
+                self._pc += 1
+
+        except IndexError:
+            self._check_overflow()
+            raise
+
+    def _call_stack(self):
+        '''
+        The pcs of the active calls, outermost first, followed by the current pc.
+
+        Walks the chain of saved frame pointers: each frame holds the caller's
+        frame pointer, with the pc of the call just below it.
+        '''
+        stack = self._stack_buffer
+        pcs = [self._pc]
+
+        frame_ptr = self._frame_ptr
+        depth = 0
+
+        while frame_ptr > 0 and depth < self._max_depth:
+            pcs.append(stack[frame_ptr - 1])
+            frame_ptr = stack[frame_ptr]
+            depth += 1
+
+        pcs.reverse()
+        return tuple(pcs)
+
+    def _check_overflow(self):
+        '''
+        Raise StackOverflow if the stack pointer has run past the stack.
+
+        The stack is never bounds checked while running, instead pushing past
+        the end raises an IndexError that is translated here.
+        '''
+        if self._stack_ptr >= len(self._stack_buffer):
+            span = self._lines.get(self._pc)
+
+            raise StackOverflow(
+                'Stack overflow at pc {pc}{source}: more than {size} stack slots used.',
+                pc=self._pc,
+                source=' (line {0})'.format(span) if span is not None else '',
+                size=len(self._stack_buffer),
+            )
 
     def _set(self, reg, value):
         '''
         Set the value in a register.
         '''
-        # the closest you can get to realloc in python
-        if reg >= len(self._regs_buffer):
-            self._regs_buffer += [None] * max(len(self._regs_buffer), reg)
-
         self._regs_buffer[reg] = value
 
     def _get(self, reg):
         '''
-        Get the value in a register.
+        Get the value in a register, which is None if it was never set.
         '''
         return self._regs_buffer[reg]
 
-    def _get_nullable(self, reg):
+    def _allocate(self, size):
         '''
-        Get the value in a register, if it exists, else return None.
+        Allocate a new object in the heap.
         '''
-        if reg < len(self._regs_buffer):
-            return self._regs_buffer[reg]
-        else:
-            return None
+        # every object occupies at least one cell, so starts are unique
+        size = max(size, 1)
 
-    def _allocate(self, size):
+        # remeber the start of the chunk
+        chunk_ptr = self._free_ptr
+
+        # Not enough space? Hit slow path.
+        if chunk_ptr + size > self._end_ptr + 1:
+            chunk_ptr = self._make_room(size)
+
+        # move the free ptr past the chunk
+        self._free_ptr = chunk_ptr + size
+
+        # record the object header
+        self._objects[chunk_ptr] = size
+
+        return chunk_ptr
+
+    def _make_room(self, size):
         '''
-        Allocate a new object in the heap.
+        Make room for an object of size cells, returning its address.
+
+        Garbage is collected first.  The heap is then grown geometrically, in
+        place, until the live objects and roots would fill at most 1 / growth
+        of it.  A collection scans the roots and live objects, so this leaves
+        enough free space for the allocations before the next collection to
+        pay for it.
         '''
-        # prepare for not having Python
-        length = self._end_ptr - self._free_ptr
+        self._collect()
 
-        # Do we have space?  Hit fast path.
-        if self._free_ptr + size < length:
-            # remeber the start of the chunk
-            chunk_ptr = self._free_ptr
+        roots = len(self._regs_buffer) + self._stack_ptr + 1
+        needed = self._free_ptr + size + roots
+        capacity = self._end_ptr + 1
 
-            # move the free ptr past the chunk
-            self._free_ptr += size
+        while needed * self._heap_growth > capacity:
+            capacity = max(capacity + 1, int(capacity * self._heap_growth))
 
-            return chunk_ptr
+        self._grow(self._heaplet, capacity)
+        self._end_ptr = capacity - 1
 
-        # Not enough space? Hit slow path.
-        else:
-            # allocate more heap space.
-            new_length = (length * 2)
-            new_heap = [None] * new_length
-            self._end_ptr = new_length - 1
+        return self._free_ptr
+
+    def _collect(self):
+        '''
+        Mark-compact garbage collection of the heap.
+
+        Roots are the pointers in the register file, the live stack and the
+        symbol table.  Live
+        objects slide down to the start of the heap, keeping their order, and
+        every pointer to them is updated.  Returns the number of cells freed.
+        '''
+        began = time.time()
+
+        heap = self._heaplet
+        objects = self._objects
+
+        # mark
+        live = {}
+        worklist = [
+            value
+            for value in self._roots()
+            if isinstance(value, Pointer) and value in objects
+        ]
+
+        while worklist:
+            ptr = worklist.pop()
+
+            if ptr in live:
+                continue
+
+            size = live[ptr] = objects[ptr]
+
+            worklist.extend(
+                value
+                for value in heap[ptr:ptr + size]
+                if isinstance(value, Pointer) and value in objects and value not in live
+            )
+
+        # compute forwarding addresses
+        forward = {}
+        free_ptr = 0
 
-            # pythonism: locals are faster than self attributes
-            old_heap = self._heaplet
+        for ptr in sorted(live):
+            forward[ptr] = free_ptr
+            free_ptr += live[ptr]
 
-            # copy over existing objects
-            for i in range(length):
-                new_heap[i] = old_heap[i]
+        # update pointers
+        def relocate(buffer_, begin, end):
+            for i in xrange(begin, end):
+                value = buffer_[i]
 
-            # replace heaps
-            self._heaplet = new_heap
+                if isinstance(value, Pointer) and value in forward:
+                    buffer_[i] = Pointer(forward[value])
 
-            # recurse to hit the fast path
-            return self._allocate(size)
+        relocate(self._regs_buffer, 0, len(self._regs_buffer))
+        relocate(self._stack_buffer, 0, self._stack_ptr + 1)
+
+        self._symbol_table = {
+            sym: Pointer(forward[ptr])
+            for sym, ptr in self._symbol_table.iteritems()
+        }
+
+        for ptr, size in live.iteritems():
+            relocate(heap, ptr, ptr + size)
+
+        # compact, moving objects down in address order
+        for ptr in sorted(live):
+            size = live[ptr]
+            new_ptr = forward[ptr]
+
+            if new_ptr != ptr:
+                heap[new_ptr:new_ptr + size] = heap[ptr:ptr + size]
+
+        freed = self._free_ptr - free_ptr
+        heap[free_ptr:self._free_ptr] = [None] * freed
+
+        self._objects = {forward[ptr]: size for ptr, size in live.iteritems()}
+        self._free_ptr = free_ptr
+
+        self._heap_stats.record(
+            pause=time.time() - began,
+            cells=freed,
+            objects=len(objects) - len(live),
+        )
+
+        return freed
+
+    def _roots(self):
+        '''
+        Values that may hold pointers into the heap: the register file,
+        the live part of the stack and the interned symbols.
+        '''
+        for value in self._regs_buffer:
+            yield value
+
+        for i in xrange(self._stack_ptr + 1):
+            yield self._stack_buffer[i]
+
+        for value in self._symbol_table.itervalues():
+            yield value
 
     def _flush(self):
         '''
@@ -246,21 +673,14 @@ class Machine(object):
         Push a value onto the stack.
         '''
         self._stack_ptr += 1
-        if self._stack_ptr == -1 or self._stack_ptr == len(self._stack_buffer):
-            self._stack_buffer.append(arg)
-        else:
-            self._stack_buffer[self._stack_ptr] = arg
+        self._stack_buffer[self._stack_ptr] = arg
 
     def _reserve(self, count):
-        stack_size = len(self._stack_buffer)
+        '''
+        Reserve count slots on top of the stack.
+        '''
         self._stack_ptr += count
 
-        if self._stack_ptr >= stack_size:
-            # + 1 because the sp refers to the top value on the stack,
-            # not the next free space.
-            growth = self._stack_ptr - stack_size + 1
-            self._stack_buffer += [None] * growth
-
     def _pop(self):
         '''
         Pop a value off the stack.
@@ -283,8 +703,8 @@ class Machine(object):
         '''
         Return the value set by the path taken through the code.
         '''
-        lhs = self._get_nullable(left)
-        rhs = self._get_nullable(right)
+        lhs = self._get(left)
+        rhs = self._get(right)
 
         if lhs is not None and rhs is None:
             return self._set(result, lhs)
@@ -337,7 +757,7 @@ class Machine(object):
         length = heaplet[address]
 
         # lazy load the symbols' characters
-        chars = (heaplet[i] for i in range(1, length + 1))
+        chars = (heaplet[i] for i in range(address + 1, address + length + 1))
 
         # convert to a string for printing
         string = ''.join(chars)
@@ -372,6 +792,30 @@ class Machine(object):
     def neq(self, left, right):
         return left != right
 
+    @fused_compare_branch
+    def lt_branch_zero(self, left, right):
+        return left < right
+
+    @fused_compare_branch
+    def lte_branch_zero(self, left, right):
+        return left <= right
+
+    @fused_compare_branch
+    def gt_branch_zero(self, left, right):
+        return left > right
+
+    @fused_compare_branch
+    def gte_branch_zero(self, left, right):
+        return left >= right
+
+    @fused_compare_branch
+    def eq_branch_zero(self, left, right):
+        return left == right
+
+    @fused_compare_branch
+    def neq_branch_zero(self, left, right):
+        return left != right
+
     ##########################################################################
     # Math
     ##########################################################################
@@ -396,6 +840,22 @@ class Machine(object):
     def rem(self, left, right):
         return left % right
 
+    @fused_constant_binop
+    def add_c(self, left, right):
+        return left + right
+
+    @fused_constant_binop
+    def sub_c(self, left, right):
+        return left - right
+
+    @fused_immediate_binop
+    def add_v(self, left, right):
+        return left + right
+
+    @fused_immediate_binop
+    def sub_v(self, left, right):
+        return left - right
+
     ##########################################################################
     # Jumping
     ##########################################################################
@@ -468,6 +928,17 @@ class Machine(object):
         '''
         Call a function at absolute address func with a variable number of params.
         '''
+        # the result stays in r0
+        self.call_into(0, func, *params)
+
+    def call_into(self, dst, func, *params):
+        '''
+        Call a function at absolute address func with a variable number of params,
+        copying the result from r0 into reg dst on return.
+        '''
+        # save the result register
+        self._push(dst)
+
         # save the return address
         self._push(self._pc)
 
@@ -487,22 +958,53 @@ class Machine(object):
         # cancel out loop increment
         self._pc -= 1
 
+    def tail_call(self, func, count, *operands):
+        '''
+        Call a function at absolute address func with the first count operands
+        as params, reusing the current frame, so the function returns straight
+        to the current function's caller.  The remaining operands are the
+        registers saved by the current function, restored before the jump.
+        '''
+        params = [self._get(param) for param in operands[:count]]
+
+        # restore the caller's registers, as the current function's ret would
+        self.restore(*operands[count:])
+
+        # replace the current params and drop the rest of the frame
+        stack = self._stack_buffer
+        for offset, value in enumerate(params, self._frame_ptr + 1):
+            stack[offset] = value
+
+        self._stack_ptr = self._frame_ptr + count
+
+        # jump to the function
+        self._pc = func
+
+        # cancel out loop increment
+        self._pc -= 1
+
     def ret(self):
         '''
         Return from a function call, cleaning up the stack before leaving.
         '''
-        # saved frame_ptr, return address
-        fixed_offset = 2
+        # saved frame_ptr, return address, result register
+        fixed_offset = 3
 
         # get the return address
         ret_addr = self._stack_buffer[self._frame_ptr - 1]
 
+        # get the result register
+        dst = self._stack_buffer[self._frame_ptr - 2]
+
         # reset the stack_ptr
         self._stack_ptr = self._frame_ptr - fixed_offset
 
         # restore the old frame_ptr
         self._frame_ptr = self._stack_buffer[self._frame_ptr]
 
+        # deliver the result
+        self._set(dst, self._get(0))
+
         # jump to the return address
         self._pc = ret_addr
 
@@ -539,9 +1041,7 @@ class Machine(object):
         Save the registers onto the stack.
         '''
         for reg in reversed(regs):
-            self._push(self._get_nullable(reg))
-        # values = [self._get_nullable(r) for r in regs]
-        # self._push(values)
+            self._push(self._get(reg))
 
     def restore(self, *regs):
         '''
@@ -559,7 +1059,21 @@ class Machine(object):
 
     def new_sym(self, dst, sym):
         '''
-        Allocate a new symbol and store the pointer in reg dst.
+        Intern a symbol and store the pointer in reg dst.
+
+        Symbols are allocated once per distinct symbol, and live as long as
+        the machine, so equal symbols always have equal pointers.
+        '''
+        pointer = self._symbol_table.get(sym)
+
+        if pointer is None:
+            pointer = self._symbol_table[sym] = Pointer(self._new_sym(sym))
+
+        self._set(dst, pointer)
+
+    def _new_sym(self, sym):
+        '''
+        Allocate a symbol in the heap as its length followed by its characters.
         '''
         length = len(sym)
 
@@ -573,15 +1087,84 @@ class Machine(object):
         for i, char in enumerate(sym):
             self._heaplet[chunk + i + 1] = char
 
-        # store the pointer
-        self._set(dst, chunk)
+        return chunk
 
     def new_chunk(self, dst, size):
         '''
         Allocate a new chunk of memory and return the pointer in reg dst.
         '''
         chunk = self._allocate(size)
-        self._set(dst, chunk)
+        self._set(dst, Pointer(chunk))
+
+    ##########################################################################
+    # Strings
+    ##########################################################################
+
+    def _str(self, reg):
+        '''
+        The bytes of the packed string referenced by reg.
+        '''
+        return self._heaplet[self._get(reg)]
+
+    def new_str(self, dst, string):
+        '''
+        Allocate a packed string and store the pointer in reg dst.
+
+        A packed string is a single cell holding a memoryview of its bytes,
+        so slices share the bytes of the string they are taken from.
+        '''
+        chunk = self._allocate(1)
+        self._heaplet[chunk] = memoryview(bytearray(string))
+        self._set(dst, Pointer(chunk))
+
+    def print_str(self, reg):
+        '''
+        Print a packed string referenced by reg.
+        '''
+        self._print('r{i}:{a}=>{v}'.format(
+            i=reg,
+            a=self._get(reg),
+            v=repr(self._str(reg).tobytes()),
+        ))
+
+    def str_len(self, dst, src):
+        '''
+        Store the length in bytes of the string in reg src into reg dst.
+        '''
+        self._set(dst, len(self._str(src)))
+
+    def str_index(self, dst, src, index):
+        '''
+        Store the byte at the index in reg index of the string in reg src
+        into reg dst.
+        '''
+        self._set(dst, ord(self._str(src)[self._get(index)]))
+
+    def str_slice(self, dst, src, start, end):
+        '''
+        Store a pointer to the bytes from reg start to reg end of the string
+        in reg src into reg dst, without copying them.
+        '''
+        # allocate first, the collector may move the source
+        chunk = self._allocate(1)
+
+        view = self._str(src)
+        self._heaplet[chunk] = view[self._get(start):self._get(end)]
+        self._set(dst, Pointer(chunk))
+
+    def str_concat(self, dst, left, right):
+        '''
+        Store a pointer to a new string of the strings in regs left and right
+        into reg dst.
+        '''
+        # allocate first, the collector may move the sources
+        chunk = self._allocate(1)
+
+        joined = bytearray(self._str(left))
+        joined.extend(self._str(right))
+
+        self._heaplet[chunk] = memoryview(joined)
+        self._set(dst, Pointer(chunk))
 
     ##########################################################################
     # Load & Store
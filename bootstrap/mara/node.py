@@ -1,20 +1,56 @@
-from abc import ABCMeta
-
 from util.reflection import deriving
 from util.functions import unique_id
 import special
 import attributes
+import tables
 
 
 # pylint: disable=W0231
 
 
+class Span(deriving('eq', 'show')):
+    '''
+    The source text of a node, as offsets into the source and 1-based
+    lines and columns.  The end is exclusive.
+    '''
+
+    def __init__(self, start, end, line, column, end_line, end_column):
+        self.start = start
+        self.end = end
+        self.line = line
+        self.column = column
+        self.end_line = end_line
+        self.end_column = end_column
+
+    def __str__(self):
+        return '{0}:{1}'.format(self.line, self.column)
+
+
 class Node(deriving('eq', 'show')):
-    __metaclass__ = ABCMeta
+    '''
+    Nodes have slots rather than an instance dict, and only allocate their
+    Attributes when the first attribute is set, as most nodes never get any.
+    The hot attributes are kept in the side tables of the compilation,
+    indexed by the node's id.
+    '''
+    __slots__ = ('_id', '_attrs', '_unique_name', '_span')
 
     def __init__(self):
-        self._attrs = attributes.Attributes()
+        self._id = tables.next_id()
+        self._attrs = None
         self._unique_name = None
+        self._span = None
+
+    @property
+    def span(self):
+        '''
+        The Span of source the node was parsed from, if known.
+        '''
+        return self._span
+
+    @span.setter
+    def span(self, span):
+        self._span = span
 
     @property
     def unique_name(self):
@@ -39,23 +75,34 @@ class Node(deriving('eq', 'show')):
     def recurse(self, visitor, walk):
         pass
 
+    def _attributes(self):
+        '''
+        The node's Attributes, allocated on first use.
+        '''
+        if self._attrs is None:
+            self._attrs = attributes.Attributes()
+        return self._attrs
+
     def set_soft(self, key, value):
-        self._attrs.set_soft(key, value)
+        self._attributes().set_soft(key, value)
 
     def set_hard(self, key, value):
-        self._attrs.set_hard(key, value)
+        self._attributes().set_hard(key, value)
 
     def __contains__(self, key):
-        return self._attrs.__contains__(key)
+        return self._attrs is not None and self._attrs.__contains__(key)
 
     def __getitem__(self, key):
+        if self._attrs is None:
+            raise KeyError(key)
         return self._attrs.__getitem__(key)
 
     def __setitem__(self, key, value):
-        self._attrs.__setitem__(key, value)
+        self._attributes().__setitem__(key, value)
 
 
 class Module(Node):
+    __slots__ = ('name', 'exprs')
 
     def __init__(self, name=None, exprs=None):
         Node.__init__(self)
@@ -69,11 +116,14 @@ class Module(Node):
 
 
 class NoOp(Node):
+    __slots__ = ()
+
     def __init__(self):
         Node.__init__(self)
 
 
 class _Collection(Node):
+    __slots__ = ('values',)
 
     def __init__(self, values=None):
         Node.__init__(self)
@@ -87,14 +137,15 @@ class _Collection(Node):
 
 
 class Tuple(_Collection):
-    pass
+    __slots__ = ()
 
 
 class List(_Collection):
-    pass
+    __slots__ = ()
 
 
 class _Value(Node):
+    __slots__ = ('value',)
 
     def __init__(self, value):
         Node.__init__(self)
@@ -102,42 +153,46 @@ class _Value(Node):
 
 
 class Int(_Value):
-    pass
+    __slots__ = ()
 
 
 class Real(_Value):
-    pass
+    __slots__ = ()
 
 
 class Sci(_Value):
-    pass
+    __slots__ = ()
 
 
 class Bool(_Value):
+    __slots__ = ()
+
     def __init__(self, value):
         assert value in ('0', '1')
         _Value.__init__(self, value)
 
 
 class ValueId(_Value):
-    pass
+    __slots__ = ()
 
 
 class SymbolId(_Value):
-    pass
+    __slots__ = ()
 
 
 class TypeId(_Value):
-    pass
+    __slots__ = ()
 
 
 class Unit(Node):
+    __slots__ = ()
 
     def __init__(self):
         Node.__init__(self)
 
 
 class Block(Node):
+    __slots__ = ('exprs',)
 
     def __init__(self, exprs):
         Node.__init__(self)
@@ -150,6 +205,7 @@ class Block(Node):
 
 
 class BinOp(Node):
+    __slots__ = ('func', 'args')
 
     def __init__(self, func, args):
         Node.__init__(self)
@@ -163,6 +219,7 @@ class BinOp(Node):
 
 
 class If(Node):
+    __slots__ = ('pred', 'if_body', 'else_body')
 
     def __init__(self, pred, if_body, else_body=None):
         Node.__init__(self)
@@ -182,6 +239,7 @@ class If(Node):
 
 
 class Else(Node):
+    __slots__ = ('expr', 'body')
 
     def __init__(self, expr, body):
         Node.__init__(self)
@@ -195,6 +253,7 @@ class Else(Node):
 
 
 class Assign(Node):
+    __slots__ = ('name', 'value')
 
     def __init__(self, name, value):
         Node.__init__(self)
@@ -207,6 +266,7 @@ class Assign(Node):
 
 
 class AssignRhs(Node):
+    __slots__ = ('value',)
 
     def __init__(self, value):
         Node.__init__(self)
@@ -217,6 +277,7 @@ class AssignRhs(Node):
 
 
 class While(Node):
+    __slots__ = ('pred', 'body')
 
     def __init__(self, pred, body):
         Node.__init__(self)
@@ -229,6 +290,7 @@ class While(Node):
 
 
 class _Declaration(Node):
+    __slots__ = ('name', 'value', 'type_')
 
     def __init__(self, name, value, type_=None):
         Node.__init__(self)
@@ -245,22 +307,23 @@ class _Declaration(Node):
 
 
 class Val(_Declaration):
-    pass
+    __slots__ = ()
 
 
 class Var(_Declaration):
-    pass
+    __slots__ = ()
 
 
 class Mut(_Declaration):
-    pass
+    __slots__ = ()
 
 
 class Ref(_Declaration):
-    pass
+    __slots__ = ()
 
 
 class For(Node):
+    __slots__ = ('clauses', 'body')
 
     def __init__(self, clauses, body):
         Node.__init__(self)
@@ -273,6 +336,7 @@ class For(Node):
 
 
 class ForClause(Node):
+    __slots__ = ('bind', 'in_')
 
     def __init__(self, bind, in_):
         Node.__init__(self)
@@ -282,6 +346,7 @@ class ForClause(Node):
 
 
 class KV(Node):
+    __slots__ = ('key', 'value')
 
     def __init__(self, key, value):
         Node.__init__(self)
@@ -294,6 +359,7 @@ class KV(Node):
 
 
 class _Comment(Node):
+    __slots__ = ('content',)
 
     def __init__(self, content):
         Node.__init__(self)
@@ -302,18 +368,19 @@ class _Comment(Node):
 
 
 class TempComment(_Comment):
-    pass
+    __slots__ = ()
 
 
 class DocComment(_Comment):
-    pass
+    __slots__ = ()
 
 
 class BlockComment(_Comment):
-    pass
+    __slots__ = ()
 
 
 class Binding(Node):
+    __slots__ = ('left', 'right')
 
     def __init__(self, left, right):
         Node.__init__(self)
@@ -323,6 +390,7 @@ class Binding(Node):
 
 
 class Call(Node):
+    __slots__ = ('func', 'arg', 'block')
 
     def __init__(self, func, arg, block=None):
         Node.__init__(self)
@@ -341,6 +409,8 @@ class Call(Node):
 
 
 class Param(Node):
+    __slots__ = ('name', 'type_')
+
     def __init__(self, name, type_=None):
         Node.__init__(self)
         self.name = name
@@ -352,6 +422,7 @@ class Param(Node):
 
 
 class Def(Node):
+    __slots__ = ('name', 'param', 'body', 'return_type')
 
     def __init__(self, name, param, body, return_type=None):
         Node.__init__(self)
@@ -371,6 +442,8 @@ class Def(Node):
 
 
 class _Specification(Node):
+    __slots__ = ('name', 'body', 'param')
+
     def __init__(self, name, body, param=None):
         Node.__init__(self)
 
@@ -384,15 +457,15 @@ class _Specification(Node):
 
 
 class Proto(_Specification):
-    pass
+    __slots__ = ()
 
 
 class Object(_Specification):
-    pass
+    __slots__ = ()
 
 
 class Trait(_Specification):
-    pass
+    __slots__ = ()
 
 
 ##############################################################################
@@ -400,37 +473,62 @@ class Trait(_Specification):
 ##############################################################################
 
 
-class InferType(Node):
-    pass
+class _Type(Node):
+    '''
+    Types are immutable once built, and interned by the type checker, so
+    unlike other nodes they hash by their fields, consistently with equality.
+    '''
+    __slots__ = ()
+
+    def __hash__(self):
+        return hash(self.__class__)
+
 
+class InferType(_Type):
+    __slots__ = ()
 
-class IntType(Node):
-    pass
 
+class IntType(_Type):
+    __slots__ = ()
 
-class BoolType(Node):
-    pass
 
+class BoolType(_Type):
+    __slots__ = ()
 
-class RealType(Node):
-    pass
 
+class RealType(_Type):
+    __slots__ = ()
 
-class UnitType(Node):
-    pass
 
+class UnitType(_Type):
+    __slots__ = ()
 
-class AnyType(Node):
-    pass
 
+class AnyType(_Type):
+    __slots__ = ()
+
+
+class FunctionType(_Type):
+    __slots__ = ('param_type', 'return_type')
 
-class FunctionType(Node):
     def __init__(self, param_type, return_type):
+        Node.__init__(self)
         self.param_type = param_type
         self.return_type = return_type
 
+    def __hash__(self):
+        return hash((self.__class__, _type_hash(self.param_type), _type_hash(self.return_type)))
+
     def recurse(self, visitor, walk):
         walk(self.param_type, visitor)
         walk(self.return_type, visitor)
 
 
+def _type_hash(t):
+    '''
+    The hash of a type, where tuple types are Tuple nodes of types.
+    '''
+    if isinstance(t, Tuple):
+        return hash((Tuple,) + tuple(_type_hash(value) for value in t.values))
+
+    return hash(t)
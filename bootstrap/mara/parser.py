@@ -3,7 +3,12 @@
 '''
 Mara Parser
 '''
+import bisect
+import functools
+import os
+
 import ply.yacc as yacc
+from ply.lex import LexToken
 
 from lexer import tokens  # pylint: disable=W0611
 from lexer import KEYWORDS
@@ -727,18 +732,110 @@ def p_error(tok):
     raise ParseError(tok, tok.lexer)
 
 
+# the LALR tables ship with the package as this module
+TABMODULE = __name__.rpartition('.')[0] + '.parsetab' if '.' in __name__ else 'parsetab'
+
+_PARSER = None
+
+
+def build_parser():
+    '''
+    The shared LALR parser, built on first use.
+
+    Tables are read from TABMODULE, and only regenerated, beside this
+    module, if they are missing or out of date with the grammar.
+    '''
+    global _PARSER  # pylint: disable=W0603
+
+    if _PARSER is None:
+        _PARSER = yacc.yacc(
+            tabmodule=TABMODULE,
+            outputdir=os.path.dirname(os.path.abspath(__file__)),
+            debug=False,
+        )
+
+        # wrap the bound rules, leaving the grammar and its tables untouched
+        for production in _PARSER.productions:
+            if production.callable is not None:
+                production.callable = _spanned(production.callable)
+
+    return _PARSER
+
+
+def _spanned(rule):
+    '''
+    Wrap a grammar rule to record the span of the node it builds.
+
+    Nodes passed up unchanged keep their innermost span.
+    '''
+
+    @functools.wraps(rule)
+    def inner(p):
+        rule(p)
+
+        result = p[0]
+        if isinstance(result, node.Node) and result.span is None and len(p) > 1:
+            result.span = _span(p)
+
+    return inner
+
+
+def _span(p):
+    '''
+    The span of source covered by the symbols of a production.
+    '''
+    lexer = p.lexer
+    start = p.lexpos(1)
+
+    last = p.slice[-1]
+    value = getattr(last, 'value', None)
+
+    if isinstance(last, LexToken):
+        end = last.lexpos + len(last.value)
+    elif isinstance(value, node.Node) and value.span is not None:
+        end = value.span.end
+    else:
+        # the start of the last token
+        end = getattr(last, 'endlexpos', start)
+
+    line, column = _position(lexer, start)
+    end_line, end_column = _position(lexer, end)
+
+    return node.Span(start, end, line, column, end_line, end_column)
+
+
+def _position(lexer, offset):
+    '''
+    The 1-based line and column of an offset into the lexer's source.
+    '''
+    newlines = getattr(lexer, 'maranewlines', None)
+
+    if newlines is None:
+        data = lexer.lexdata
+        newlines = lexer.maranewlines = [
+            i for i in xrange(len(data)) if data[i] == '\n'
+        ]
+
+    line = bisect.bisect_left(newlines, offset)
+    line_start = newlines[line - 1] + 1 if line > 0 else 0
+
+    return line + 1, offset - line_start + 1
+
+
 class Parser(object):
-    def __init__(self):
-        self._parser = yacc.yacc(tabmodule='__plycache__/parser.out', outputdir='./__plycache__')
-        self._lexer = build_lexer()
+    '''
+    Parses documents with the shared parser.
+
+    Every parse uses its own lexer, so parsing is re-entrant.
+    '''
 
     def parse(self, document):
-        return self._parser.parse(document, lexer=self._lexer)
+        return build_parser().parse(document, lexer=build_lexer(), tracking=True)
 
     def simple_stream(self, document):
-        for tok in lex_simple(self._lexer, document):
+        for tok in lex_simple(build_lexer(), document):
             yield tok
 
     def token_stream(self, document):
-        for tok in lex_tokens(self._lexer, document):
+        for tok in lex_tokens(build_lexer(), document):
             yield tok
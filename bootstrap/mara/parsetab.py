@@ -0,0 +1,174 @@
+
+# parsetab.py
+# This file is automatically generated. Do not edit.
+_tabversion = '3.2'
+
+_lr_method = 'LALR'
+
+_lr_signature = '\xe5\xa5\xc2\x1f]h\x17\x92\xa7\x16\x0f\x1c-\x1a\xb2\xfb'
+    
+_lr_action_items = {'REAL':([3,9,14,20,21,33,42,45,47,60,72,80,85,95,107,115,116,117,118,119,120,121,122,123,124,125,126,127,128,130,145,152,159,175,],[6,-42,6,6,-41,6,-44,6,6,6,-45,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,-44,6,-21,-127,]),'LPAR':([3,9,14,20,21,33,42,45,47,60,72,80,85,86,93,95,96,97,98,99,104,107,115,116,117,118,119,120,121,122,123,124,125,126,127,128,130,145,146,152,159,175,],[47,-42,47,47,-41,47,-44,47,47,47,-45,47,47,136,136,47,136,-105,-106,-104,136,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,-44,-130,47,-21,-127,]),'OBJECT':([3,9,14,20,21,33,42,45,47,60,72,80,85,95,107,115,116,117,118,119,120,121,122,123,124,125,126,127,128,130,145,152,159,175,],[8,-42,8,8,-41,8,-44,8,8,8,-45,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,-44,8,-21,-127,]),'RPAR':([5,6,7,9,10,11,12,13,14,16,18,20,21,23,24,25,26,28,29,30,31,32,36,37,38,39,40,41,42,43,44,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,81,82,83,84,87,88,89,91,94,101,102,105,106,109,110,111,112,113,114,131,133,134,136,137,139,140,141,142,143,144,145,146,148,150,151,152,153,155,156,157,158,159,160,161,162,163,165,166,167,168,169,170,171,172,173,174,175,176,177,179,180,181,182,183,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,],[-24,-31,-23,-42,-135,-33,-5,-10,-123,-122,-58,-7,-41,-6,-85,-137,-97,-138,-32,-19,-11,-124,-18,-139,-47,-12,-15,-3,-44,-100,-98,-26,113,-83,-136,-52,-4,-17,-84,-36,-91,-92,-132,-53,-9,-14,-16,-99,-34,-35,-86,-120,-20,-8,-131,-27,-45,-121,-28,-133,-59,-30,-134,-29,-25,-46,-13,-22,-128,-87,-93,-125,-101,-76,-39,-54,-80,-120,-61,159,160,-37,-126,-129,-49,-57,113,-108,-140,-107,-89,-88,-95,-94,-44,-130,-142,-73,-103,-75,-40,-141,-82,-81,-60,-21,-38,-56,-63,-51,-67,-69,-55,-66,-62,-64,-50,-70,-71,-65,-127,-68,-48,-114,-118,196,-112,-115,-116,-143,-90,-96,-145,-72,-102,-113,-74,-144,-117,-109,-111,-119,-110,]),'WHILE':([3,5,6,7,9,10,11,12,13,14,16,18,20,21,23,24,25,26,28,29,30,31,32,33,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,87,88,89,91,94,95,101,102,105,106,107,108,109,110,111,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,130,131,132,133,134,137,139,140,141,142,143,144,145,146,148,150,151,152,153,155,156,157,158,159,160,161,162,163,165,166,167,168,169,170,171,172,173,174,175,176,177,186,187,188,189,190,191,192,194,196,],[45,-24,-31,-23,-42,-135,-33,-5,-10,45,-122,-58,45,-41,-6,-85,-137,-97,-138,-32,-19,-11,-124,45,-18,-139,-47,-12,-15,-3,-44,-100,-98,45,-26,45,-83,-136,-52,-4,-17,-84,-36,-91,-92,-132,-53,-9,116,-16,-99,-34,123,-35,-86,-120,-20,-8,-131,-27,-45,-121,-28,-133,-59,-30,-134,-29,45,-25,-46,-13,-22,45,123,-87,-93,123,-101,45,123,-39,-54,-80,45,123,-120,-61,123,-37,123,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,-129,123,-49,-57,-108,-140,-107,-89,-88,-95,-94,-44,-130,-142,-73,-103,45,-40,-141,-82,123,-60,-21,-38,123,123,123,-67,-69,123,-66,123,-64,123,-70,123,-65,-127,-68,-48,-143,-90,-96,-145,-72,-102,-113,-144,-109,]),'COLON':([5,6,7,9,10,11,12,13,14,16,18,20,21,23,24,25,26,28,29,30,31,32,36,37,38,39,40,41,42,43,44,46,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,81,82,83,84,87,88,89,91,94,101,102,105,106,108,109,110,111,113,114,131,132,133,134,137,139,140,141,142,143,144,145,146,148,150,151,153,155,156,157,158,159,160,161,162,163,165,166,167,168,169,170,171,172,173,174,175,176,177,186,187,188,189,190,191,192,194,196,],[-24,-31,-23,-42,-135,-33,-5,-10,-123,-122,-58,-7,-41,-6,-85,-137,-97,-138,-32,-19,-11,-124,-18,-139,-47,-12,-15,-3,-44,-100,-98,-26,-83,-136,-52,-4,-17,-84,-36,-91,-92,-132,-53,-9,-14,-16,-99,-34,127,-35,-86,-120,-20,-8,-131,-27,-45,-121,-28,-133,-59,-30,-134,-29,-25,-46,-13,-22,127,-87,-93,127,-101,127,-39,-54,-80,127,-120,-61,127,-37,127,-129,127,-49,-57,-108,-140,-107,-89,-88,-95,-94,-44,-130,-142,-73,-103,-40,-141,-82,127,-60,-21,-38,-56,-63,-51,-67,-69,-55,-66,-62,-64,-50,-70,127,-65,-127,-68,-48,-143,-90,-96,-145,-72,-102,-113,-144,-109,]),'RBKT':([5,6,7,9,10,11,12,13,14,16,18,20,21,23,24,25,26,28,29,30,31,32,33,36,37,38,39,40,41,42,43,44,46,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,81,82,83,84,87,88,89,91,94,101,102,103,105,106,109,110,113,114,131,133,134,137,139,140,141,142,143,144,145,146,148,150,151,152,153,155,156,157,158,159,160,161,162,163,165,166,167,168,169,170,171,172,173,174,175,176,177,186,187,188,189,190,191,192,193,194,196,],[-24,-31,-23,-42,-135,-33,-5,-10,-123,-122,-58,-7,-41,-6,-85,-137,-97,-138,-32,-19,-11,-124,102,-18,-139,-47,-12,-15,-3,-44,-100,-98,-26,-83,-136,-52,-4,-17,-84,-36,-91,-92,-132,-53,-9,-14,-16,-99,-34,-35,-86,-120,-20,-8,-131,-27,-45,-121,-28,-133,-59,-30,-134,-29,-25,-46,-13,-22,-128,-87,-93,-125,-101,-76,-39,153,-54,-80,-120,-61,-37,-126,-129,-49,-57,-108,-140,-107,-89,-88,-95,-94,-44,-130,-142,-73,-103,-75,-40,-141,-82,-81,-60,-21,-38,-56,-63,-51,-67,-69,-55,-66,-62,-64,-50,-70,-71,-65,-127,-68,-48,-143,-90,-96,-145,-72,-102,-113,-74,-144,-109,]),'SID':([5,6,7,9,10,11,12,13,14,16,18,20,21,23,24,25,26,28,29,30,31,32,36,37,38,39,40,41,42,43,44,46,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,81,82,83,84,87,88,89,91,94,101,102,105,106,108,109,110,111,113,114,131,132,133,134,137,139,140,141,142,143,144,145,146,148,150,151,153,155,156,157,158,159,160,161,162,163,165,166,167,168,169,170,171,172,173,174,175,176,177,186,187,188,189,190,191,192,194,196,],[-24,-31,-23,-42,-135,-33,-5,-10,-123,-122,-58,-7,-41,-6,-85,-137,-97,-138,-32,-19,-11,-124,-18,-139,-47,-12,-15,-3,-44,-100,-98,-26,-83,-136,-52,-4,-17,-84,-36,-91,-92,-132,-53,-9,-14,-16,-99,-34,126,-35,-86,-120,-20,-8,-131,-27,-45,-121,-28,-133,-59,-30,-134,-29,-25,-46,-13,-22,126,-87,-93,126,-101,126,-39,-54,-80,126,-120,-61,126,-37,126,-129,126,-49,-57,-108,-140,-107,-89,-88,-95,-94,-44,-130,-142,-73,-103,-40,-141,-82,126,-60,-21,-38,126,126,126,-67,-69,126,-66,126,-64,126,126,126,-65,-127,-68,-48,-143,-90,-96,-145,-72,-102,-113,-144,-109,]),'TID':([3,8,9,14,20,21,22,27,33,34,42,45,47,60,72,80,85,88,89,92,95,107,113,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,136,137,140,145,151,152,159,175,180,184,196,197,],[9,9,-42,9,9,-41,9,9,9,9,-44,9,9,9,-45,9,9,9,9,9,9,9,-37,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,-108,-107,-44,9,9,-21,-127,9,9,-109,9,]),'DCOMMENT':([3,9,14,20,21,33,42,45,47,60,72,80,85,95,107,115,116,117,118,119,120,121,122,123,124,125,126,127,128,130,145,152,159,175,],[46,-42,46,46,-41,46,-44,46,46,46,-45,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,-44,46,-21,-127,]),'TRUE':([3,9,14,20,21,33,42,45,47,60,72,80,85,95,107,115,116,117,118,119,120,121,122,123,124,125,126,127,128,130,145,152,159,175,],[11,-42,11,11,-41,11,-44,11,11,11,-45,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,-44,11,-21,-127,]),'MINUS':([5,6,7,9,10,11,12,13,14,16,18,20,21,23,24,25,26,28,29,30,31,32,36,37,38,39,40,41,42,43,44,46,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,81,82,83,84,87,88,89,91,94,101,102,105,106,108,109,110,111,113,114,131,132,133,134,137,139,140,141,142,143,144,145,146,148,150,151,153,155,156,157,158,159,160,161,162,163,165,166,167,168,169,170,171,172,173,174,175,176,177,186,187,188,189,190,191,192,194,196,],[-24,-31,-23,-42,-135,-33,-5,-10,-123,-122,-58,-7,-41,-6,-85,-137,-97,-138,-32,-19,-11,-124,-18,-139,-47,-12,-15,-3,-44,-100,-98,-26,-83,-136,-52,-4,-17,-84,-36,-91,-92,-132,-53,-9,-14,-16,-99,-34,128,-35,-86,-120,-20,-8,-131,-27,-45,-121,-28,-133,-59,-30,-134,-29,-25,-46,-13,-22,128,-87,-93,128,-101,128,-39,-54,-80,128,-120,-61,128,-37,128,-129,128,-49,-57,-108,-140,-107,-89,-88,-95,-94,-44,-130,-142,-73,-103,-40,-141,-82,128,-60,-21,-38,128,128,128,-67,-69,128,-66,128,-64,128,128,128,-65,-127,-68,-48,-143,-90,-96,-145,-72,-102,-113,-144,-109,]),'DEF':([3,9,14,20,21,33,42,45,47,60,72,80,85,95,107,115,116,117,118,119,120,121,122,123,124,125,126,127,128,130,145,152,159,175,],[27,-42,27,27,-41,27,-44,27,27,27,-45,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,-44,27,-21,-127,]),'TERM':([1,4,5,6,7,9,10,11,12,13,14,16,18,20,21,23,24,25,26,28,29,30,31,32,36,37,38,39,40,41,42,43,44,46,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,81,82,83,84,87,88,89,91,94,102,105,106,109,110,113,114,131,133,134,137,139,140,141,142,143,144,145,146,148,150,151,153,155,156,157,158,159,160,161,162,163,165,166,167,168,169,170,171,172,173,174,175,176,177,186,187,188,189,190,191,192,194,196,],[3,85,-24,-31,-23,-42,-135,-33,-5,-10,-123,-122,-58,-7,-41,-6,-85,-137,-97,-138,-32,-19,-11,-124,-18,-139,-47,-12,-15,-3,-44,-100,-98,-26,-83,-136,-52,-4,-17,-84,-36,-91,-92,-132,-53,-9,-14,-16,-99,-34,118,-35,-86,-120,-20,-8,-131,-27,-45,-121,-28,-133,-59,-30,-134,-29,-25,-46,-13,-22,-128,-87,-93,-125,-101,-39,-54,-80,-120,-61,-37,-126,-129,-49,-57,-108,-140,-107,-89,-88,-95,-94,-44,-130,-142,-73,-103,-40,-141,-82,-81,-60,-21,-38,-56,-63,-51,-67,-69,-55,-66,-62,-64,-50,-70,-71,-65,-127,-68,-48,-143,-90,-96,-145,-72,-102,-113,-144,-109,]),'SCI':([3,9,14,20,21,33,42,45,47,60,72,80,85,95,107,115,116,117,118,119,120,121,122,123,124,125,126,127,128,130,145,152,159,175,],[29,-42,29,29,-41,29,-44,29,29,29,-45,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,-44,29,-21,-127,]),'POWER':([5,6,7,9,10,11,12,13,14,16,18,20,21,23,24,25,26,28,29,30,31,32,36,37,38,39,40,41,42,43,44,46,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,81,82,83,84,87,88,89,91,94,101,102,105,106,108,109,110,111,113,114,131,132,133,134,137,139,140,141,142,143,144,145,146,148,150,151,153,155,156,157,158,159,160,161,162,163,165,166,167,168,169,170,171,172,173,174,175,176,177,186,187,188,189,190,191,192,194,196,],[-24,-31,-23,-42,-135,-33,-5,-10,-123,-122,-58,-7,-41,-6,-85,-137,-97,-138,-32,-19,-11,-124,-18,-139,-47,-12,-15,-3,-44,-100,-98,-26,-83,-136,-52,-4,-17,-84,-36,-91,-92,-132,-53,-9,-14,-16,-99,-34,120,-35,-86,-120,-20,-8,-131,-27,-45,-121,-28,-133,-59,-30,-134,-29,-25,-46,-13,-22,120,-87,-93,120,-101,120,-39,-54,-80,120,-120,-61,120,-37,120,-129,120,-49,-57,-108,-140,-107,-89,-88,-95,-94,-44,-130,-142,-73,-103,-40,-141,-82,120,-60,-21,-38,120,120,120,120,-69,120,120,120,120,120,120,120,120,-127,120,-48,-143,-90,-96,-145,-72,-102,-113,-144,-109,]),'LBRC':([5,6,7,9,10,11,12,13,14,16,18,20,21,23,24,25,26,28,29,30,31,32,35,36,37,38,39,40,41,42,43,44,46,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,81,82,83,84,86,87,88,89,91,93,94,102,104,105,106,107,108,109,110,113,114,115,131,132,133,134,137,138,139,140,141,142,143,144,145,146,147,148,150,151,153,154,155,156,157,158,159,160,161,162,163,165,166,167,168,169,170,171,172,173,174,175,176,177,186,187,188,189,190,191,192,194,196,],[-24,-31,-23,-42,-135,-33,-5,-10,-123,-122,-58,-7,-41,-6,-85,-137,95,-138,-32,-19,-11,-124,95,-18,-139,-47,-12,-15,-3,-44,-100,-98,-26,-83,-136,-52,-4,-17,-84,-36,-91,-92,-132,-53,-9,-14,-16,-99,-34,-35,-86,95,-20,-8,-131,-27,-45,-121,-28,-133,-59,-30,-134,-29,-25,-46,-13,-22,95,-128,-87,-93,-125,95,-101,-39,95,-54,-80,95,95,95,-61,-37,-126,95,-129,95,-49,-57,-108,95,-140,-107,-89,-88,-95,-94,-44,-130,95,-142,-73,-103,-40,95,-141,-82,-81,-60,-21,-38,-56,-63,-51,-67,-69,-55,-66,-62,-64,-50,-70,-71,-65,-127,-68,-48,-143,-90,-96,-145,-72,-102,-113,-144,-109,]),'TCOMMENT':([3,9,14,20,21,33,42,45,47,60,72,80,85,95,107,115,116,117,118,119,120,121,122,123,124,125,126,127,128,130,145,152,159,175,],[71,-42,71,71,-41,71,-44,71,71,71,-45,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,-44,71,-21,-127,]),'RBRC':([5,6,7,9,10,11,12,13,14,16,18,20,21,23,24,25,26,28,29,30,31,32,36,37,38,39,40,41,42,43,44,46,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,81,82,83,84,87,88,89,91,94,95,102,105,106,109,110,113,114,118,131,133,134,137,139,140,141,142,143,144,145,146,148,149,150,151,153,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,186,187,188,189,190,191,192,194,196,],[-24,-31,-23,-42,-135,-33,-5,-10,-123,-122,-58,-7,-41,-6,-85,-137,-97,-138,-32,-19,-11,-124,-18,-139,-47,-12,-15,-3,-44,-100,-98,-26,-83,-136,-52,-4,-17,-84,-36,-91,-92,-132,-53,-9,-14,-16,-99,-34,-79,-35,-86,-120,-20,-8,-131,-27,-45,-121,-28,-133,-59,-30,-134,-29,-25,-46,-13,-22,-128,-87,-93,-125,-101,150,-39,-54,-80,-120,-61,-37,-126,-78,-129,-49,-57,-108,-140,-107,-89,-88,-95,-94,-44,-130,-142,190,-73,-103,-40,-141,-82,-81,-60,-21,-38,-56,-63,-51,-77,-67,-69,-55,-66,-62,-64,-50,-70,-71,-65,-127,-68,-48,-143,-90,-96,-145,-72,-102,-113,-144,-109,]),'COMMA':([5,6,7,9,10,11,12,13,14,16,18,20,21,23,24,25,26,28,29,30,31,32,36,37,38,39,40,41,42,43,44,46,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,81,82,83,84,87,88,89,91,94,101,102,105,106,109,110,111,113,114,131,133,134,137,139,140,141,142,143,144,145,146,148,150,151,153,155,156,157,158,159,160,161,162,163,165,166,167,168,169,170,171,172,173,174,175,176,177,179,180,182,183,185,186,187,188,189,190,191,192,194,195,196,198,],[-24,-31,-23,-42,-135,-33,-5,-10,-123,-122,-58,-7,-41,-6,-85,-137,-97,-138,-32,-19,-11,-124,-18,-139,-47,-12,-15,-3,-44,-100,-98,-26,-83,-136,-52,-4,-17,-84,-36,-91,-92,-132,-53,-9,-14,-16,-99,-34,-35,-86,-120,-20,-8,-131,-27,-45,-121,-28,-133,-59,-30,-134,-29,-25,-46,-13,-22,-128,-87,-93,-125,-101,152,-39,-54,-80,-120,-61,152,-37,-126,-129,-49,-57,-108,-140,-107,-89,-88,-95,-94,-44,-130,-142,-73,-103,-40,-141,-82,-81,-60,-21,-38,-56,-63,-51,-67,-69,-55,-66,-62,-64,-50,-70,-71,-65,-127,-68,-48,-114,-118,197,-115,-116,-143,-90,-96,-145,-72,-102,-113,-144,-117,-109,-119,]),'DOT':([5,6,7,9,10,11,12,13,14,16,18,20,21,23,24,25,26,28,29,30,31,32,36,37,38,39,40,41,42,43,44,46,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,81,82,83,84,87,88,89,91,94,101,102,105,106,108,109,110,111,113,114,131,132,133,134,137,139,140,141,142,143,144,145,146,148,150,151,153,155,156,157,158,159,160,161,162,163,165,166,167,168,169,170,171,172,173,174,175,176,177,186,187,188,189,190,191,192,194,196,],[-24,-31,-23,-42,-135,-33,-5,-10,-123,-122,-58,-7,-41,-6,-85,-137,-97,-138,-32,-19,-11,-124,-18,-139,-47,-12,-15,-3,-44,-100,-98,-26,-83,-136,-52,-4,-17,-84,-36,-91,-92,-132,-53,-9,-14,-16,-99,-34,129,-35,-86,-120,-20,-8,-131,-27,-45,-121,-28,-133,-59,-30,-134,-29,-25,-46,-13,-22,129,-87,-93,129,-101,129,-39,-54,-80,129,-120,-61,129,-37,129,-129,129,-49,-57,-108,-140,-107,-89,-88,-95,-94,-44,-130,-142,-73,-103,-40,-141,-82,129,-60,-21,-38,-56,-63,-51,-67,-69,-55,-66,-62,-64,-50,-70,129,-65,-127,-68,-48,-143,-90,-96,-145,-72,-102,-113,-144,-109,]),'PLUS':([5,6,7,9,10,11,12,13,14,16,18,20,21,23,24,25,26,28,29,30,31,32,36,37,38,39,40,41,42,43,44,46,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,81,82,83,84,87,88,89,91,94,101,102,105,106,108,109,110,111,113,114,131,132,133,134,137,139,140,141,142,143,144,145,146,148,150,151,153,155,156,157,158,159,160,161,162,163,165,166,167,168,169,170,171,172,173,174,175,176,177,186,187,188,189,190,191,192,194,196,],[-24,-31,-23,-42,-135,-33,-5,-10,-123,-122,-58,-7,-41,-6,-85,-137,-97,-138,-32,-19,-11,-124,-18,-139,-47,-12,-15,-3,-44,-100,-98,-26,-83,-136,-52,-4,-17,-84,-36,-91,-92,-132,-53,-9,-14,-16,-99,-34,124,-35,-86,-120,-20,-8,-131,-27,-45,-121,-28,-133,-59,-30,-134,-29,-25,-46,-13,-22,124,-87,-93,124,-101,124,-39,-54,-80,124,-120,-61,124,-37,124,-129,124,-49,-57,-108,-140,-107,-89,-88,-95,-94,-44,-130,-142,-73,-103,-40,-141,-82,124,-60,-21,-38,124,124,124,-67,-69,124,-66,124,-64,124,124,124,-65,-127,-68,-48,-143,-90,-96,-145,-72,-102,-113,-144,-109,]),'LBKT':([3,9,14,20,21,33,42,45,47,60,72,80,85,95,107,115,116,117,118,119,120,121,122,123,124,125,126,127,128,130,145,152,159,175,],[33,-42,33,33,-41,33,-44,33,33,33,-45,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,-44,33,-21,-127,]),'$end':([2,90,178,],[0,-1,-2,]),'INTD':([3,9,14,20,21,33,42,45,47,60,72,80,85,95,107,115,116,117,118,119,120,121,122,123,124,125,126,127,128,130,145,152,159,175,],[74,-42,74,74,-41,74,-44,74,74,74,-45,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,-44,74,-21,-127,]),'END':([5,6,7,9,10,11,12,13,14,16,18,19,20,21,23,24,25,26,28,29,30,31,32,36,37,38,39,40,41,42,43,44,46,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,81,82,83,84,87,88,89,91,94,102,105,106,109,110,113,114,118,131,133,134,135,137,139,140,141,142,143,144,145,146,148,150,151,153,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,186,187,188,189,190,191,192,194,196,],[-24,-31,-23,-42,-135,-33,-5,-10,-123,-122,-58,90,-7,-41,-6,-85,-137,-97,-138,-32,-19,-11,-124,-18,-139,-47,-12,-15,-3,-44,-100,-98,-26,-83,-136,-52,-4,-17,-84,-36,-91,-92,-132,-53,-9,-14,-16,-99,-34,-79,-35,-86,-120,-20,-8,-131,-27,-45,-121,-28,-133,-59,-30,-134,-29,-25,-46,-13,-22,-128,-87,-93,-125,-101,-39,-54,-80,-120,-61,-37,-126,-78,-129,-49,-57,178,-108,-140,-107,-89,-88,-95,-94,-44,-130,-142,-73,-103,-40,-141,-82,-81,-60,-21,-38,-56,-63,-51,-77,-67,-69,-55,-66,-62,-64,-50,-70,-71,-65,-127,-68,-48,-143,-90,-96,-145,-72,-102,-113,-144,-109,]),'DIVIDE':([5,6,7,9,10,11,12,13,14,16,18,20,21,23,24,25,26,28,29,30,31,32,36,37,38,39,40,41,42,43,44,46,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,81,82,83,84,87,88,89,91,94,101,102,105,106,108,109,110,111,113,114,131,132,133,134,137,139,140,141,142,143,144,145,146,148,150,151,153,155,156,157,158,159,160,161,162,163,165,166,167,168,169,170,171,172,173,174,175,176,177,186,187,188,189,190,191,192,194,196,],[-24,-31,-23,-42,-135,-33,-5,-10,-123,-122,-58,-7,-41,-6,-85,-137,-97,-138,-32,-19,-11,-124,-18,-139,-47,-12,-15,-3,-44,-100,-98,-26,-83,-136,-52,-4,-17,-84,-36,-91,-92,-132,-53,-9,-14,-16,-99,-34,119,-35,-86,-120,-20,-8,-131,-27,-45,-121,-28,-133,-59,-30,-134,-29,-25,-46,-13,-22,119,-87,-93,119,-101,119,-39,-54,-80,119,-120,-61,119,-37,119,-129,119,-49,-57,-108,-140,-107,-89,-88,-95,-94,-44,-130,-142,-73,-103,-40,-141,-82,119,-60,-21,-38,119,119,119,-67,-69,119,-66,119,119,119,119,119,119,-127,-68,-48,-143,-90,-96,-145,-72,-102,-113,-144,-109,]),'VAL':([3,9,14,20,21,33,42,45,47,60,72,80,85,95,107,115,116,117,118,119,120,121,122,123,124,125,126,127,128,130,145,152,159,175,],[15,-42,15,15,-41,15,-44,15,15,15,-45,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,-44,15,-21,-127,]),'PROTO':([3,9,14,20,21,33,42,45,47,60,72,80,85,95,107,115,116,117,118,119,120,121,122,123,124,125,126,127,128,130,145,152,159,175,],[34,-42,34,34,-41,34,-44,34,34,34,-45,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,-44,34,-21,-127,]),'MODULE':([0,],[1,]),'ELSE':([3,5,6,7,9,10,11,12,13,14,16,18,20,21,23,24,25,26,28,29,30,31,32,33,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,87,88,89,91,94,95,101,102,105,106,107,108,109,110,111,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,130,131,132,133,134,137,139,140,141,142,143,144,145,146,148,150,151,152,153,155,156,157,158,159,160,161,162,163,165,166,167,168,169,170,171,172,173,174,175,176,177,186,187,188,189,190,191,192,194,196,],[35,-24,-31,-23,-42,-135,-33,-5,-10,35,-122,-58,35,-41,-6,-85,-137,-97,-138,-32,-19,-11,-124,35,-18,-139,-47,-12,-15,-3,-44,-100,-98,35,-26,35,-83,-136,-52,-4,-17,-84,-36,-91,-92,-132,-53,-9,115,-16,-99,-34,121,-35,-86,-120,-20,-8,-131,-27,-45,-121,-28,-133,-59,-30,-134,-29,35,-25,35,-13,-22,35,121,-87,-93,121,-101,35,121,-39,-54,-80,35,121,-120,-61,121,-37,121,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,-129,121,-49,-57,-108,-140,-107,-89,-88,-95,-94,-44,-130,-142,-73,-103,35,-40,-141,-82,121,-60,-21,-38,121,121,121,-67,-69,121,-66,121,-64,121,-70,121,-65,-127,-68,-48,-143,-90,-96,-145,-72,-102,-113,-144,-109,]),'INTP':([3,9,14,20,21,33,42,45,47,60,72,80,85,95,107,115,116,117,118,119,120,121,122,123,124,125,126,127,128,130,145,152,159,175,],[77,-42,77,77,-41,77,-44,77,77,77,-45,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,-44,77,-21,-127,]),'VAR':([3,9,14,20,21,33,42,45,47,60,72,80,85,95,107,115,116,117,118,119,120,121,122,123,124,125,126,127,128,130,145,152,159,175,],[17,-42,17,17,-41,17,-44,17,17,17,-45,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,-44,17,-21,-127,]),'TIMES':([5,6,7,9,10,11,12,13,14,16,18,20,21,23,24,25,26,28,29,30,31,32,36,37,38,39,40,41,42,43,44,46,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,81,82,83,84,87,88,89,91,94,101,102,105,106,108,109,110,111,113,114,131,132,133,134,137,139,140,141,142,143,144,145,146,148,150,151,153,155,156,157,158,159,160,161,162,163,165,166,167,168,169,170,171,172,173,174,175,176,177,186,187,188,189,190,191,192,194,196,],[-24,-31,-23,-42,-135,-33,-5,-10,-123,-122,-58,-7,-41,-6,-85,-137,-97,-138,-32,-19,-11,-124,-18,-139,-47,-12,-15,-3,-44,-100,-98,-26,-83,-136,-52,-4,-17,-84,-36,-91,-92,-132,-53,-9,-14,-16,-99,-34,122,-35,-86,-120,-20,-8,-131,-27,-45,-121,-28,-133,-59,-30,-134,-29,-25,-46,-13,-22,122,-87,-93,122,-101,122,-39,-54,-80,122,-120,-61,122,-37,122,-129,122,-49,-57,-108,-140,-107,-89,-88,-95,-94,-44,-130,-142,-73,-103,-40,-141,-82,122,-60,-21,-38,122,122,122,-67,-69,122,-66,122,122,122,122,122,122,-127,-68,-48,-143,-90,-96,-145,-72,-102,-113,-144,-109,]),'EQ':([9,21,42,88,89,141,143,],[-42,-41,107,107,107,107,107,]),'INTX':([3,9,14,20,21,33,42,45,47,60,72,80,85,95,107,115,116,117,118,119,120,121,122,123,124,125,126,127,128,130,145,152,159,175,],[79,-42,79,79,-41,79,-44,79,79,79,-45,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,-44,79,-21,-127,]),'IF':([3,5,6,7,9,10,11,12,13,14,16,18,20,21,23,24,25,26,28,29,30,31,32,33,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,87,88,89,91,94,95,101,102,105,106,107,108,109,110,111,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,130,131,132,133,134,137,139,140,141,142,143,144,145,146,148,150,151,152,153,155,156,157,158,159,160,161,162,163,165,166,167,168,169,170,171,172,173,174,175,176,177,186,187,188,189,190,191,192,194,196,],[80,-24,-31,-23,-42,-135,-33,-5,-10,80,-122,-58,80,-41,-6,-85,-137,-97,-138,-32,-19,-11,-124,80,-18,-139,-47,-12,-15,-3,-44,-100,-98,80,-26,80,-83,-136,-52,-4,-17,-84,-36,-91,-92,-132,-53,-9,117,-16,-99,-34,125,-35,-86,-120,-20,-8,-131,-27,-45,-121,-28,-133,-59,-30,-134,-29,80,-25,-46,-13,-22,80,125,-87,-93,125,-101,80,125,-39,-54,-80,80,125,-120,-61,125,-37,125,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,-129,125,-49,-57,-108,-140,-107,-89,-88,-95,-94,-44,-130,-142,-73,-103,80,-40,-141,-82,125,-60,-21,-38,125,125,125,-67,-69,125,-66,125,-64,125,-70,125,-65,-127,-68,-48,-143,-90,-96,-145,-72,-102,-113,-144,-109,]),'BCOMMENT':([3,9,14,20,21,33,42,45,47,60,72,80,85,95,107,115,116,117,118,119,120,121,122,123,124,125,126,127,128,130,145,152,159,175,],[81,-42,81,81,-41,81,-44,81,81,81,-45,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,-44,81,-21,-127,]),'FALSE':([3,9,14,20,21,33,42,45,47,60,72,80,85,95,107,115,116,117,118,119,120,121,122,123,124,125,126,127,128,130,145,152,159,175,],[63,-42,63,63,-41,63,-44,63,63,63,-45,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,-44,63,-21,-127,]),'VID':([1,3,9,14,15,17,20,21,27,33,42,45,47,60,72,80,85,92,95,107,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,136,145,152,159,175,197,],[4,21,-42,21,21,21,21,-41,21,21,-44,21,21,21,-45,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,-44,21,-21,-127,21,]),'TRAIT':([3,9,14,20,21,33,42,45,47,60,72,80,85,95,107,115,116,117,118,119,120,121,122,123,124,125,126,127,128,130,145,152,159,175,],[22,-42,22,22,-41,22,-44,22,22,22,-45,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,-44,22,-21,-127,]),'BIND':([9,20,21,42,72,97,99,100,],[-42,92,-41,-44,-45,-44,-45,92,]),'MOD':([5,6,7,9,10,11,12,13,14,16,18,20,21,23,24,25,26,28,29,30,31,32,36,37,38,39,40,41,42,43,44,46,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,81,82,83,84,87,88,89,91,94,101,102,105,106,108,109,110,111,113,114,131,132,133,134,137,139,140,141,142,143,144,145,146,148,150,151,153,155,156,157,158,159,160,161,162,163,165,166,167,168,169,170,171,172,173,174,175,176,177,186,187,188,189,190,191,192,194,196,],[-24,-31,-23,-42,-135,-33,-5,-10,-123,-122,-58,-7,-41,-6,-85,-137,-97,-138,-32,-19,-11,-124,-18,-139,-47,-12,-15,-3,-44,-100,-98,-26,-83,-136,-52,-4,-17,-84,-36,-91,-92,-132,-53,-9,-14,-16,-99,-34,130,-35,-86,-120,-20,-8,-131,-27,-45,-121,-28,-133,-59,-30,-134,-29,-25,-46,-13,-22,130,-87,-93,130,-101,130,-39,-54,-80,130,-120,-61,130,-37,130,-129,130,-49,-57,-108,-140,-107,-89,-88,-95,-94,-44,-130,-142,-73,-103,-40,-141,-82,130,-60,-21,-38,130,130,130,-67,-69,130,-66,130,130,130,130,130,130,-127,-68,-48,-143,-90,-96,-145,-72,-102,-113,-144,-109,]),}
+
+_lr_action = { }
+for _k, _v in _lr_action_items.items():
+   for _x,_y in zip(_v[0],_v[1]):
+      if not _x in _lr_action:  _lr_action[_x] = { }
+      _lr_action[_x][_k] = _y
+del _lr_action_items
+
+_lr_goto_items = {'comment':([3,14,20,33,45,47,60,80,85,95,107,115,116,117,118,119,120,121,122,123,124,125,126,127,128,130,152,],[41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,]),'block_comment':([3,14,20,33,45,47,60,80,85,95,107,115,116,117,118,119,120,121,122,123,124,125,126,127,128,130,152,],[5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,]),'untyped_param':([136,197,],[179,179,]),'vid':([3,14,15,17,20,27,33,45,47,60,80,85,92,95,107,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,136,152,197,],[42,42,88,89,42,97,42,42,42,42,42,42,145,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,145,42,180,42,180,]),'doc_comment':([3,14,20,33,45,47,60,80,85,95,107,115,116,117,118,119,120,121,122,123,124,125,126,127,128,130,152,],[7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,]),'param_list':([136,197,],[181,199,]),'binding':([3,14,20,27,33,45,47,60,80,85,95,107,115,116,117,118,119,120,121,122,123,124,125,126,127,128,130,152,],[68,68,68,98,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,]),'def_concrete':([3,14,20,33,45,47,60,80,85,95,107,115,116,117,118,119,120,121,122,123,124,125,126,127,128,130,152,],[44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,]),'module':([0,],[2,]),'full_param':([86,93,96,104,],[137,137,137,137,]),'generic_object':([3,14,20,33,45,47,60,80,85,95,107,115,116,117,118,119,120,121,122,123,124,125,126,127,128,130,152,],[10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,]),'def_name':([27,],[96,]),'def_param':([86,93,96,104,],[138,147,151,154,]),'if':([3,14,20,33,45,47,60,80,85,95,107,115,116,117,118,119,120,121,122,123,124,125,126,127,128,130,152,],[69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,]),'default_trait':([3,14,20,33,45,47,60,80,85,95,107,115,116,117,118,119,120,121,122,123,124,125,126,127,128,130,152,],[28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,]),'def_abstract':([3,14,20,33,45,47,60,80,85,95,107,115,116,117,118,119,120,121,122,123,124,125,126,127,128,130,152,],[26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,]),'val':([3,14,20,33,45,47,60,80,85,95,107,115,116,117,118,119,120,121,122,123,124,125,126,127,128,130,152,],[48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,]),'proto':([3,14,20,33,45,47,60,80,85,95,107,115,116,117,118,119,120,121,122,123,124,125,126,127,128,130,152,],[70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,]),'default_proto':([3,14,20,33,45,47,60,80,85,95,107,115,116,117,118,119,120,121,122,123,124,125,126,127,128,130,152,],[49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,]),'specification':([3,14,20,33,45,47,60,80,85,95,107,115,116,117,118,119,120,121,122,123,124,125,126,127,128,130,152,],[30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,]),'binop':([3,14,20,33,45,47,60,80,85,95,107,115,116,117,118,119,120,121,122,123,124,125,126,127,128,130,152,],[39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,]),'full_tuple':([3,14,20,33,45,47,60,80,85,95,107,115,116,117,118,119,120,121,122,123,124,125,126,127,128,130,152,],[65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,]),'param':([136,197,],[182,182,]),'prefix_else':([3,14,20,33,45,47,60,80,82,85,95,107,115,116,117,118,119,120,121,122,123,124,125,126,127,128,130,152,],[50,50,50,50,50,50,50,50,134,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,]),'tuple':([3,14,20,33,45,47,60,80,85,95,107,115,116,117,118,119,120,121,122,123,124,125,126,127,128,130,152,],[12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,]),'typed_param':([136,197,],[183,183,]),'literal':([3,14,20,33,45,47,60,80,85,95,107,115,116,117,118,119,120,121,122,123,124,125,126,127,128,130,152,],[51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,]),'compound_call':([3,14,20,33,45,47,60,80,85,95,107,115,116,117,118,119,120,121,122,123,124,125,126,127,128,130,152,],[32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,]),'ifelse':([3,14,20,33,45,47,60,80,85,95,107,115,116,117,118,119,120,121,122,123,124,125,126,127,128,130,152,],[13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,]),'var':([3,14,20,33,45,47,60,80,85,95,107,115,116,117,118,119,120,121,122,123,124,125,126,127,128,130,152,],[53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,]),'call':([3,14,20,33,45,47,60,80,85,95,107,115,116,117,118,119,120,121,122,123,124,125,126,127,128,130,152,],[52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,]),'bounded_param':([136,197,],[185,185,]),'var_untyped':([3,14,20,33,45,47,60,80,85,95,107,115,116,117,118,119,120,121,122,123,124,125,126,127,128,130,152,],[55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,]),'val_typed':([3,14,20,33,45,47,60,80,85,95,107,115,116,117,118,119,120,121,122,123,124,125,126,127,128,130,152,],[66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,]),'block_call':([3,14,20,33,45,47,60,80,85,95,107,115,116,117,118,119,120,121,122,123,124,125,126,127,128,130,152,],[73,73,73,73,110,73,73,133,73,73,73,73,110,133,73,73,73,73,73,73,73,73,73,73,73,73,73,]),'postfix_call':([3,14,20,33,45,47,60,80,85,95,107,115,116,117,118,119,120,121,122,123,124,125,126,127,128,130,152,],[14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,]),'def_untyped':([3,14,20,33,45,47,60,80,85,95,107,115,116,117,118,119,120,121,122,123,124,125,126,127,128,130,152,],[43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,]),'var_typed':([3,14,20,33,45,47,60,80,85,95,107,115,116,117,118,119,120,121,122,123,124,125,126,127,128,130,152,],[56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,]),'trait':([3,14,20,33,45,47,60,80,85,95,107,115,116,117,118,119,120,121,122,123,124,125,126,127,128,130,152,],[57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,]),'object':([3,14,20,33,45,47,60,80,85,95,107,115,116,117,118,119,120,121,122,123,124,125,126,127,128,130,152,],[75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,]),'postfix_else':([3,14,20,33,45,47,60,80,85,95,107,115,116,117,118,119,120,121,122,123,124,125,126,127,128,130,152,],[58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,]),'else':([3,14,20,33,45,47,60,80,85,95,107,115,116,117,118,119,120,121,122,123,124,125,126,127,128,130,152,],[59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,]),'wrapped':([3,14,20,33,45,47,60,80,85,95,107,115,116,117,118,119,120,121,122,123,124,125,126,127,128,130,152,],[60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,]),'tid':([3,8,14,20,22,27,33,34,45,47,60,80,85,88,89,92,95,107,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,136,151,152,180,184,197,],[72,86,72,72,93,99,72,104,72,72,72,72,72,141,143,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,184,192,72,195,198,184,]),'postfix_while':([3,14,20,33,45,47,60,80,85,95,107,115,116,117,118,119,120,121,122,123,124,125,126,127,128,130,152,],[76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,]),'declaration':([3,14,20,33,45,47,60,80,85,95,107,115,116,117,118,119,120,121,122,123,124,125,126,127,128,130,152,],[61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,]),'default_object':([3,14,20,33,45,47,60,80,85,95,107,115,116,117,118,119,120,121,122,123,124,125,126,127,128,130,152,],[78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,]),'prefix_while':([3,14,20,33,45,47,60,80,85,95,107,115,116,117,118,119,120,121,122,123,124,125,126,127,128,130,152,],[18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,]),'expr_list_term':([3,85,95,118,],[19,135,149,164,]),'def_typed':([3,14,20,33,45,47,60,80,85,95,107,115,116,117,118,119,120,121,122,123,124,125,126,127,128,130,152,],[62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,]),'empty_tuple':([3,14,20,33,45,47,60,80,85,86,93,95,96,104,107,115,116,117,118,119,120,121,122,123,124,125,126,127,128,130,152,],[54,54,54,54,54,54,54,54,54,140,140,54,140,140,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,]),'definition':([3,14,20,33,45,47,60,80,85,95,107,115,116,117,118,119,120,121,122,123,124,125,126,127,128,130,152,],[36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,]),'assign_rhs':([42,88,89,141,143,],[106,142,144,187,188,]),'generic_trait':([3,14,20,33,45,47,60,80,85,95,107,115,116,117,118,119,120,121,122,123,124,125,126,127,128,130,152,],[37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,]),'expr':([3,14,20,33,45,47,60,80,85,95,107,115,116,117,118,119,120,121,122,123,124,125,126,127,128,130,152,],[64,87,91,101,108,111,114,132,64,64,157,161,162,163,64,165,166,167,168,169,170,171,172,173,174,176,101,]),'name':([3,14,20,27,33,45,47,60,80,85,92,95,107,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,152,],[20,20,20,100,20,20,20,20,20,20,146,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,175,20,20,]),'generic_proto':([3,14,20,33,45,47,60,80,85,95,107,115,116,117,118,119,120,121,122,123,124,125,126,127,128,130,152,],[25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,]),'list':([3,14,20,33,45,47,60,80,85,95,107,115,116,117,118,119,120,121,122,123,124,125,126,127,128,130,152,],[23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,]),'prefix_if':([3,14,20,33,45,47,60,80,85,95,107,115,116,117,118,119,120,121,122,123,124,125,126,127,128,130,152,],[82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,]),'def_return':([151,],[191,]),'postfix_if':([3,14,20,33,45,47,60,80,85,95,107,115,116,117,118,119,120,121,122,123,124,125,126,127,128,130,152,],[38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,]),'while':([3,14,20,33,45,47,60,80,85,95,107,115,116,117,118,119,120,121,122,123,124,125,126,127,128,130,152,],[31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,]),'val_untyped':([3,14,20,33,45,47,60,80,85,95,107,115,116,117,118,119,120,121,122,123,124,125,126,127,128,130,152,],[24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,]),'kv':([3,14,20,33,45,47,60,80,85,95,107,115,116,117,118,119,120,121,122,123,124,125,126,127,128,130,152,],[83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,]),'blockless_call':([3,14,20,33,45,47,60,80,85,95,107,115,116,117,118,119,120,121,122,123,124,125,126,127,128,130,152,],[67,67,67,67,109,67,67,109,67,67,67,67,109,109,67,67,67,67,67,67,67,67,67,67,67,67,67,]),'temp_comment':([3,14,20,33,45,47,60,80,85,95,107,115,116,117,118,119,120,121,122,123,124,125,126,127,128,130,152,],[84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,]),'prefix_call':([3,14,20,33,45,47,60,80,85,95,107,115,116,117,118,119,120,121,122,123,124,125,126,127,128,130,152,],[16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,]),'assign':([3,14,20,33,45,47,60,80,85,95,107,115,116,117,118,119,120,121,122,123,124,125,126,127,128,130,152,],[40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,]),'block':([26,35,67,86,93,104,107,108,109,115,132,138,147,154,162,163,],[94,105,131,139,148,155,156,158,131,105,177,186,189,194,158,177,]),'expr_list_comma':([33,47,152,],[103,112,193,]),}
+
+_lr_goto = { }
+for _k, _v in _lr_goto_items.items():
+   for _x,_y in zip(_v[0],_v[1]):
+       if not _x in _lr_goto: _lr_goto[_x] = { }
+       _lr_goto[_x][_k] = _y
+del _lr_goto_items
+_lr_productions = [
+  ("S' -> module","S'",1,None,None,None),
+  ('module -> MODULE TERM expr_list_term END','module',4,'p_module','mara/parser.py',45),
+  ('module -> MODULE VID TERM expr_list_term END','module',5,'p_module','mara/parser.py',46),
+  ('expr -> comment','expr',1,'p_expr','mara/parser.py',60),
+  ('expr -> literal','expr',1,'p_expr','mara/parser.py',61),
+  ('expr -> tuple','expr',1,'p_expr','mara/parser.py',62),
+  ('expr -> list','expr',1,'p_expr','mara/parser.py',63),
+  ('expr -> name','expr',1,'p_expr','mara/parser.py',64),
+  ('expr -> if','expr',1,'p_expr','mara/parser.py',65),
+  ('expr -> else','expr',1,'p_expr','mara/parser.py',66),
+  ('expr -> ifelse','expr',1,'p_expr','mara/parser.py',67),
+  ('expr -> while','expr',1,'p_expr','mara/parser.py',68),
+  ('expr -> binop','expr',1,'p_expr','mara/parser.py',69),
+  ('expr -> kv','expr',1,'p_expr','mara/parser.py',70),
+  ('expr -> wrapped','expr',1,'p_expr','mara/parser.py',71),
+  ('expr -> assign','expr',1,'p_expr','mara/parser.py',72),
+  ('expr -> declaration','expr',1,'p_expr','mara/parser.py',73),
+  ('expr -> call','expr',1,'p_expr','mara/parser.py',74),
+  ('expr -> definition','expr',1,'p_expr','mara/parser.py',75),
+  ('expr -> specification','expr',1,'p_expr','mara/parser.py',76),
+  ('expr -> binding','expr',1,'p_expr','mara/parser.py',77),
+  ('wrapped -> LPAR expr RPAR','wrapped',3,'p_wrapped','mara/parser.py',86),
+  ('comment -> temp_comment','comment',1,'p_comment','mara/parser.py',94),
+  ('comment -> doc_comment','comment',1,'p_comment','mara/parser.py',95),
+  ('comment -> block_comment','comment',1,'p_comment','mara/parser.py',96),
+  ('block_comment -> BCOMMENT','block_comment',1,'p_block_comment','mara/parser.py',105),
+  ('doc_comment -> DCOMMENT','doc_comment',1,'p_doc_comment','mara/parser.py',105),
+  ('temp_comment -> TCOMMENT','temp_comment',1,'p_temp_comment','mara/parser.py',105),
+  ('literal -> INTD','literal',1,'p_literal','mara/parser.py',116),
+  ('literal -> INTX','literal',1,'p_literal','mara/parser.py',117),
+  ('literal -> INTP','literal',1,'p_literal','mara/parser.py',118),
+  ('literal -> REAL','literal',1,'p_literal','mara/parser.py',119),
+  ('literal -> SCI','literal',1,'p_literal','mara/parser.py',120),
+  ('literal -> TRUE','literal',1,'p_literal','mara/parser.py',121),
+  ('literal -> FALSE','literal',1,'p_literal','mara/parser.py',122),
+  ('tuple -> full_tuple','tuple',1,'p_tuple','mara/parser.py',145),
+  ('tuple -> empty_tuple','tuple',1,'p_tuple','mara/parser.py',146),
+  ('empty_tuple -> LPAR RPAR','empty_tuple',2,'p_empty_tuple','mara/parser.py',152),
+  ('full_tuple -> LPAR expr_list_comma RPAR','full_tuple',3,'p_full_tuple','mara/parser.py',158),
+  ('list -> LBKT RBKT','list',2,'p_list','mara/parser.py',164),
+  ('list -> LBKT expr_list_comma RBKT','list',3,'p_list','mara/parser.py',165),
+  ('vid -> VID','vid',1,'p_vid','mara/parser.py',174),
+  ('tid -> TID','tid',1,'p_tid','mara/parser.py',183),
+  ('sid -> SID','sid',1,'p_sid','mara/parser.py',192),
+  ('name -> vid','name',1,'p_name','mara/parser.py',201),
+  ('name -> tid','name',1,'p_name','mara/parser.py',202),
+  ('if -> prefix_if','if',1,'p_if','mara/parser.py',210),
+  ('if -> postfix_if','if',1,'p_if','mara/parser.py',211),
+  ('prefix_if -> IF expr block','prefix_if',3,'p_prefix_if','mara/parser.py',219),
+  ('prefix_if -> IF block_call','prefix_if',2,'p_prefix_if','mara/parser.py',220),
+  ('postfix_if -> expr IF expr','postfix_if',3,'p_postfix_if','mara/parser.py',241),
+  ('postfix_if -> wrapped IF expr','postfix_if',3,'p_postfix_if','mara/parser.py',242),
+  ('else -> prefix_else','else',1,'p_else','mara/parser.py',250),
+  ('else -> postfix_else','else',1,'p_else','mara/parser.py',251),
+  ('prefix_else -> ELSE block','prefix_else',2,'p_prefix_else','mara/parser.py',258),
+  ('postfix_else -> expr ELSE expr','postfix_else',3,'p_postfix_else','mara/parser.py',265),
+  ('postfix_else -> wrapped ELSE expr','postfix_else',3,'p_postfix_else','mara/parser.py',266),
+  ('ifelse -> prefix_if prefix_else','ifelse',2,'p_ifelse','mara/parser.py',273),
+  ('while -> prefix_while','while',1,'p_while','mara/parser.py',281),
+  ('while -> postfix_while','while',1,'p_while','mara/parser.py',282),
+  ('prefix_while -> WHILE expr block','prefix_while',3,'p_prefix_while','mara/parser.py',288),
+  ('prefix_while -> WHILE block_call','prefix_while',2,'p_prefix_while','mara/parser.py',289),
+  ('postfix_while -> expr WHILE expr','postfix_while',3,'p_postfix_while','mara/parser.py',308),
+  ('postfix_while -> wrapped WHILE expr','postfix_while',3,'p_postfix_while','mara/parser.py',309),
+  ('binop -> expr PLUS expr','binop',3,'p_binop','mara/parser.py',315),
+  ('binop -> expr MINUS expr','binop',3,'p_binop','mara/parser.py',316),
+  ('binop -> expr TIMES expr','binop',3,'p_binop','mara/parser.py',317),
+  ('binop -> expr DIVIDE expr','binop',3,'p_binop','mara/parser.py',318),
+  ('binop -> expr MOD expr','binop',3,'p_binop','mara/parser.py',319),
+  ('binop -> expr POWER expr','binop',3,'p_binop','mara/parser.py',320),
+  ('binop -> expr SID expr','binop',3,'p_binop','mara/parser.py',321),
+  ('kv -> expr COLON expr','kv',3,'p_kv','mara/parser.py',330),
+  ('block -> LBRC expr_list_term RBRC','block',3,'p_block','mara/parser.py',336),
+  ('block -> LBRC RBRC','block',2,'p_block','mara/parser.py',337),
+  ('expr_list_comma -> expr COMMA expr_list_comma','expr_list_comma',3,'p_expr_list_comma','mara/parser.py',355),
+  ('expr_list_comma -> expr COMMA','expr_list_comma',2,'p_expr_list_comma','mara/parser.py',356),
+  ('expr_list_comma -> expr','expr_list_comma',1,'p_expr_list_comma','mara/parser.py',357),
+  ('expr_list_term -> expr TERM expr_list_term','expr_list_term',3,'p_expr_list_term','mara/parser.py',355),
+  ('expr_list_term -> expr TERM','expr_list_term',2,'p_expr_list_term','mara/parser.py',356),
+  ('expr_list_term -> expr','expr_list_term',1,'p_expr_list_term','mara/parser.py',357),
+  ('assign -> vid assign_rhs','assign',2,'p_assign','mara/parser.py',379),
+  ('assign_rhs -> EQ expr','assign_rhs',2,'p_assign_rhs','mara/parser.py',387),
+  ('assign_rhs -> EQ block','assign_rhs',2,'p_assign_rhs','mara/parser.py',388),
+  ('declaration -> val','declaration',1,'p_declaration','mara/parser.py',396),
+  ('declaration -> var','declaration',1,'p_declaration','mara/parser.py',397),
+  ('val -> val_untyped','val',1,'p_val','mara/parser.py',422),
+  ('val -> val_typed','val',1,'p_val','mara/parser.py',423),
+  ('val_untyped -> VAL vid','val_untyped',2,'p_val_untyped','mara/parser.py',431),
+  ('val_untyped -> VAL vid assign_rhs','val_untyped',3,'p_val_untyped','mara/parser.py',432),
+  ('val_typed -> VAL vid tid','val_typed',3,'p_val_typed','mara/parser.py',438),
+  ('val_typed -> VAL vid tid assign_rhs','val_typed',4,'p_val_typed','mara/parser.py',439),
+  ('var -> var_untyped','var',1,'p_var','mara/parser.py',445),
+  ('var -> var_typed','var',1,'p_var','mara/parser.py',446),
+  ('var_untyped -> VAR vid','var_untyped',2,'p_var_untyped','mara/parser.py',454),
+  ('var_untyped -> VAR vid assign_rhs','var_untyped',3,'p_var_untyped','mara/parser.py',455),
+  ('var_typed -> VAR vid tid','var_typed',3,'p_var_typed','mara/parser.py',463),
+  ('var_typed -> VAR vid tid assign_rhs','var_typed',4,'p_var_typed','mara/parser.py',464),
+  ('definition -> def_abstract','definition',1,'p_definition','mara/parser.py',472),
+  ('definition -> def_concrete','definition',1,'p_definition','mara/parser.py',473),
+  ('def_abstract -> def_typed','def_abstract',1,'p_def_abstract','mara/parser.py',481),
+  ('def_abstract -> def_untyped','def_abstract',1,'p_def_abstract','mara/parser.py',482),
+  ('def_concrete -> def_abstract block','def_concrete',2,'p_def_concrete','mara/parser.py',490),
+  ('def_typed -> DEF def_name def_param def_return','def_typed',4,'p_def_typed','mara/parser.py',498),
+  ('def_untyped -> DEF def_name def_param','def_untyped',3,'p_def_untyped','mara/parser.py',511),
+  ('def_name -> tid','def_name',1,'p_def_name','mara/parser.py',521),
+  ('def_name -> vid','def_name',1,'p_def_name','mara/parser.py',522),
+  ('def_name -> binding','def_name',1,'p_def_name','mara/parser.py',523),
+  ('def_param -> empty_tuple','def_param',1,'p_def_param','mara/parser.py',529),
+  ('def_param -> full_param','def_param',1,'p_def_param','mara/parser.py',530),
+  ('full_param -> LPAR param_list RPAR','full_param',3,'p_full_param','mara/parser.py',536),
+  ('param_list -> param COMMA param_list','param_list',3,'p_param_list','mara/parser.py',542),
+  ('param_list -> param COMMA','param_list',2,'p_param_list','mara/parser.py',543),
+  ('param_list -> param','param_list',1,'p_param_list','mara/parser.py',544),
+  ('def_return -> tid','def_return',1,'p_def_return','mara/parser.py',560),
+  ('param -> untyped_param','param',1,'p_param','mara/parser.py',566),
+  ('param -> typed_param','param',1,'p_param','mara/parser.py',567),
+  ('param -> bounded_param','param',1,'p_param','mara/parser.py',568),
+  ('typed_param -> vid tid','typed_param',2,'p_typed_param','mara/parser.py',574),
+  ('untyped_param -> vid','untyped_param',1,'p_untyped_param','mara/parser.py',580),
+  ('bounded_param -> tid tid','bounded_param',2,'p_bounded_param','mara/parser.py',585),
+  ('call -> blockless_call','call',1,'p_call','mara/parser.py',591),
+  ('call -> block_call','call',1,'p_call','mara/parser.py',592),
+  ('blockless_call -> prefix_call','blockless_call',1,'p_blockless_call','mara/parser.py',600),
+  ('blockless_call -> postfix_call','blockless_call',1,'p_blockless_call','mara/parser.py',601),
+  ('blockless_call -> compound_call','blockless_call',1,'p_blockless_call','mara/parser.py',602),
+  ('prefix_call -> name expr','prefix_call',2,'p_prefix_call','mara/parser.py',609),
+  ('prefix_call -> wrapped expr','prefix_call',2,'p_prefix_call','mara/parser.py',610),
+  ('postfix_call -> expr DOT name','postfix_call',3,'p_postfix_call','mara/parser.py',623),
+  ('compound_call -> postfix_call expr','compound_call',2,'p_compound_call','mara/parser.py',637),
+  ('block_call -> blockless_call block','block_call',2,'p_block_call','mara/parser.py',653),
+  ('binding -> name BIND name','binding',3,'p_binding','mara/parser.py',663),
+  ('specification -> proto','specification',1,'p_specification','mara/parser.py',671),
+  ('specification -> trait','specification',1,'p_specification','mara/parser.py',672),
+  ('specification -> object','specification',1,'p_specification','mara/parser.py',673),
+  ('object -> default_object','object',1,'p_object','mara/parser.py',681),
+  ('object -> generic_object','object',1,'p_object','mara/parser.py',682),
+  ('proto -> default_proto','proto',1,'p_proto','mara/parser.py',681),
+  ('proto -> generic_proto','proto',1,'p_proto','mara/parser.py',682),
+  ('trait -> default_trait','trait',1,'p_trait','mara/parser.py',681),
+  ('trait -> generic_trait','trait',1,'p_trait','mara/parser.py',682),
+  ('default_object -> OBJECT tid block','default_object',3,'p_default_object','mara/parser.py',694),
+  ('default_proto -> PROTO tid block','default_proto',3,'p_default_proto','mara/parser.py',694),
+  ('default_trait -> TRAIT tid block','default_trait',3,'p_default_trait','mara/parser.py',694),
+  ('generic_object -> OBJECT tid def_param block','generic_object',4,'p_generic_object','mara/parser.py',706),
+  ('generic_proto -> PROTO tid def_param block','generic_proto',4,'p_generic_proto','mara/parser.py',706),
+  ('generic_trait -> TRAIT tid def_param block','generic_trait',4,'p_generic_trait','mara/parser.py',706),
+]
@@ -3,3 +3,5 @@ from collect_names import CollectNames
 from collect_locals import CollectLocals
 from module_function import ModuleFunction
 from type_check import TypeCheck
+from constant_fold import ConstantFold
+from manager import PassManager, PassTimes, PassError
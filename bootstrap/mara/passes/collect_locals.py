@@ -8,41 +8,58 @@ from .. import node
 
 
 class CollectLocals(object):
+    walk = 'down'
+    requires = ('CollectNames',)
+
     _store = method_store()
 
-    def __init__(self):
+    def __init__(self, tables):
+        self.tables = tables
         self.definition = None
+        self._enclosing = {}
 
-    @multimethod(_store)
     def visit(self, n):
+        # restore the definition enclosing n, which is not necessarily
+        # the most recently visited definition.
+        self.definition = self._enclosing.pop(id(n), self.definition)
+
+        self.collect(n)
+
+        def enclose(child, _):
+            self._enclosing[id(child)] = self.definition
+
+        n.recurse(self, enclose)
+
+    @multimethod(_store)
+    def collect(self, n):
         pass
 
-    @visit.d(node.Def)
+    @collect.d(node.Def)
     def _(self, n):
         self.definition = n
 
-        n['locals'] = {}
+        self.tables.locals_[n] = {}
 
-    @visit.d(node.Val)
+    @collect.d(node.Val)
     def _(self, n):
         self._collect(n)
 
-    @visit.d(node.Var)
+    @collect.d(node.Var)
     def _(self, n):
         self._collect(n)
 
-    @visit.d(node.Param)
+    @collect.d(node.Param)
     def _(self, n):
         self._collect(n)
 
     def _collect(self, n):
         ident = n.name.value
 
-        namespace = n['namespace']
+        namespace = self.tables.namespace[n]
         qualified = namespace.qualify(ident)
 
-        locals_ = self.definition['locals']
+        locals_ = self.tables.locals_[self.definition]
 
-        n['index'] = len(locals_)
+        self.tables.index[n] = len(locals_)
 
         locals_[qualified] = n
@@ -9,40 +9,44 @@ from .. import scope
 
 
 class CollectNames(object):
+    walk = 'down'
+    requires = ('ModuleFunction',)
+
     _store = method_store()
 
-    def __init__(self):
+    def __init__(self, tables):
+        self.tables = tables
         self.namespace = scope.Root()
 
     @multimethod(_store)
     def visit(self, n):
-        n['namespace'] = self.namespace
+        self.tables.namespace[n] = self.namespace
 
     @visit.d(node.Block)
     def _(self, n):
         if 'def_context' not in n and 'spec_context' not in n:
             self.namespace = self.namespace.child(n.unique_name)
 
-        n['namespace'] = self.namespace
+        self.tables.namespace[n] = self.namespace
 
     @visit.d(node.Module)
     def _(self, n):
         self.namespace = self.namespace.child(n.unique_name)
-        n['namespace'] = self.namespace
+        self.tables.namespace[n] = self.namespace
 
     @visit.d(node.Val)
     def _(self, n):
         ident = n.name.value
 
         self.namespace.declare(ident, n)
-        n['namespace'] = self.namespace
+        self.tables.namespace[n] = self.namespace
 
     @visit.d(node.Var)
     def _(self, n):
         ident = n.name.value
 
         self.namespace.declare(ident, n)
-        n['namespace'] = self.namespace
+        self.tables.namespace[n] = self.namespace
 
     @visit.d(node.Def)
     def _(self, n):
@@ -52,7 +56,7 @@ class CollectNames(object):
 
         n.body['def_context'] = n
 
-        n['namespace'] = self.namespace
+        self.tables.namespace[n] = self.namespace
         self.namespace = self.namespace.child(n.unique_name)
 
     @visit.d(node.Param)
@@ -60,7 +64,7 @@ class CollectNames(object):
         ident = n.name.value
 
         self.namespace.declare(ident, n)
-        n['namespace'] = self.namespace
+        self.tables.namespace[n] = self.namespace
 
     @visit.d(node.Object)
     def _(self, n):
@@ -81,5 +85,5 @@ class CollectNames(object):
 
         n.body['spec_context'] = n
 
-        n['namespace'] = self.namespace
+        self.tables.namespace[n] = self.namespace
         self.namespace = self.namespace.child(ident)
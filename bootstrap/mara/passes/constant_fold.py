@@ -0,0 +1,176 @@
+'''
+Fold BinOps over literals into literals,
+and propagate the literal values of Vals to their uses.
+
+Walk up the tree, so that the operands of each BinOp
+are folded before the BinOp itself.
+'''
+
+import operator
+
+from ..util.dispatch import method_store, multimethod
+from .. import node
+
+
+# the same semantics as the machine's builtins
+OPERATORS = {
+    '+': operator.add,
+    '-': operator.sub,
+    '*': operator.mul,
+    '/': operator.floordiv,
+    '<': operator.lt,
+    '<=': operator.le,
+    '>': operator.gt,
+    '>=': operator.ge,
+    '==': operator.eq,
+    '!=': operator.ne,
+}
+
+COMPARISONS = frozenset(['<', '<=', '>', '>=', '==', '!='])
+
+
+class ConstantFold(object):
+    walk = 'up'
+    requires = ('CollectNames',)
+
+    _store = method_store()
+
+    def __init__(self, tables):
+        self.tables = tables
+        # the literal value of each Val already visited, by id
+        self.constants = {}
+
+    @multimethod(_store)
+    def visit(self, n):
+        pass
+
+    @visit.d(node.Module)
+    def _(self, n):
+        n.exprs = [self.fold(expr) for expr in n.exprs]
+
+    @visit.d(node.Block)
+    def _(self, n):
+        n.exprs = [self.fold(expr) for expr in n.exprs]
+
+    @visit.d(node.Tuple)
+    def _(self, n):
+        n.values = [self.fold(value) for value in n.values]
+
+    @visit.d(node.List)
+    def _(self, n):
+        n.values = [self.fold(value) for value in n.values]
+
+    @visit.d(node.BinOp)
+    def _(self, n):
+        n.args = [self.fold(arg) for arg in n.args]
+
+    @visit.d(node.If)
+    def _(self, n):
+        n.pred = self.fold(n.pred)
+        n.if_body = self.fold(n.if_body)
+        n.else_body = self.fold(n.else_body)
+
+    @visit.d(node.While)
+    def _(self, n):
+        n.pred = self.fold(n.pred)
+        n.body = self.fold(n.body)
+
+    @visit.d(node.Val)
+    def _(self, n):
+        n.value = self.fold(n.value)
+
+        if literal(n.value) is not None:
+            self.constants[id(n)] = n.value
+
+    @visit.d(node.Var)
+    def _(self, n):
+        n.value = self.fold(n.value)
+
+    @visit.d(node.Assign)
+    def _(self, n):
+        n.value = self.fold(n.value)
+
+    @visit.d(node.AssignRhs)
+    def _(self, n):
+        n.value = self.fold(n.value)
+
+    @visit.d(node.KV)
+    def _(self, n):
+        n.value = self.fold(n.value)
+
+    @multimethod(_store)
+    def fold(self, n):
+        '''
+        The literal equivalent to n, or n itself.
+        '''
+        return n
+
+    @fold.d(node.ValueId)
+    def _(self, n):
+        if n not in self.tables.namespace:
+            return n
+
+        try:
+            declaration = self.tables.namespace[n][n.value]
+        except KeyError:
+            return n
+
+        constant = self.constants.get(id(declaration))
+
+        if constant is None:
+            return n
+
+        return _spanned(constant.__class__(constant.value), n)
+
+    @fold.d(node.BinOp)
+    def _(self, n):
+        func = n.func.value
+        operation = OPERATORS.get(func)
+
+        if operation is None or len(n.args) != 2:
+            return n
+
+        left, right = [literal(arg) for arg in n.args]
+
+        if left is None or right is None:
+            return n
+
+        try:
+            value = operation(left, right)
+        except (ZeroDivisionError, OverflowError):
+            # leave the error to the machine
+            return n
+
+        if func in COMPARISONS:
+            result = node.Bool('1' if value else '0')
+        elif isinstance(value, float):
+            result = node.Real(repr(value))
+        else:
+            result = node.Int(str(value))
+
+        return _spanned(result, n)
+
+
+def literal(n):
+    '''
+    The value of a literal node as the machine sees it, or None.
+    '''
+    try:
+        if isinstance(n, node.Int):
+            return int(n.value)
+
+        if isinstance(n, node.Real):
+            return float(n.value)
+
+        if isinstance(n, node.Bool):
+            return int(n.value)
+
+    except ValueError:
+        pass
+
+    return None
+
+
+def _spanned(result, n):
+    result.span = n.span
+    return result
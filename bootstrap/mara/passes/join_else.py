@@ -7,6 +7,9 @@ from .. import node
 
 
 class JoinElse(object):
+    walk = 'down'
+    requires = ()
+
     _store = method_store()
 
     @multimethod(_store)
@@ -0,0 +1,158 @@
+'''
+Run passes over a tree, fusing their traversals.
+
+Each pass declares how it walks the tree, 'down' visiting each node before
+its children or 'up' visiting it after them, and the names of the passes it
+requires to have visited a node before it does.
+
+Consecutive passes that walk the same way are fused into one traversal,
+which visits each node once and runs every pass's visit on it in order.
+This keeps each pass's view of the tree: passes only rewrite the children
+of the node they visit, so a pass still sees every node after the passes
+before it have, just as if each had walked the whole tree in turn.  When
+walking up, children replaced by one pass are never visited by the passes
+after it, so passes that replace children go after those that read them.
+'''
+
+import time
+from collections import defaultdict
+
+from ..util.reflection import deriving
+from .. import node
+
+WALKS = {
+    'down': node.Node.walk_down,
+    'up': node.Node.walk_up,
+}
+
+
+class PassError(Exception, deriving('eq', 'show')):
+    pass
+
+
+class PassTimes(object):
+    '''
+    The time spent in each pass and the number of times each pass ran.
+    '''
+
+    def __init__(self):
+        self.times = defaultdict(float)
+        self.runs = defaultdict(int)
+
+    def clear(self):
+        self.times.clear()
+        self.runs.clear()
+
+    def report(self):
+        '''
+        A text report of the passes, the most expensive first.
+        '''
+        total = sum(self.times.itervalues()) or 1.0
+
+        report = ['{0:<20} {1:>10} {2:>10} {3:>6}'.format('pass', 'runs', 'time', '%')]
+
+        by_time = sorted(self.times, key=lambda name_: (-self.times[name_], name_))
+        for name_ in by_time:
+            report.append('{0:<20} {1:>10} {2:>10.4f} {3:>6.1f}'.format(
+                name_,
+                self.runs[name_],
+                self.times[name_],
+                100 * self.times[name_] / total,
+            ))
+
+        return '\n'.join(report)
+
+
+class Traversal(object):
+    '''
+    A single walk of the tree running several passes.
+    '''
+
+    def __init__(self, walk, passes, times=None):
+        self.walk = walk
+        self.passes = passes
+        self.times = times
+
+        self._names = [name(p) for p in passes]
+        self._visits = [p.visit for p in passes]
+
+        if times is not None:
+            self.visit = self._timed_visit
+
+    @property
+    def names(self):
+        return list(self._names)
+
+    def visit(self, n):
+        for visit in self._visits:
+            visit(n)
+
+    def _timed_visit(self, n):
+        clock = time.time
+        times = self.times.times
+
+        for name_, visit in zip(self._names, self._visits):
+            began = clock()
+            visit(n)
+            times[name_] += clock() - began
+
+    def run(self, tree):
+        WALKS[self.walk](tree, self)
+
+        if self.times is not None:
+            for name_ in self._names:
+                self.times.runs[name_] += 1
+
+
+class PassManager(object):
+    '''
+    A schedule of passes to run over a tree, in the order they are added.
+
+    Timing each pass, by giving a PassTimes, costs a clock read around every
+    visit, so untimed runs visit without one.
+    '''
+
+    def __init__(self, times=None):
+        self.times = times
+        self.passes = []
+
+    def add(self, pass_):
+        '''
+        Schedule a pass after those already added.
+
+        Raises a PassError unless every pass it requires is already scheduled.
+        '''
+        if pass_.walk not in WALKS:
+            raise PassError('{0} walks {1!r}, not down or up'.format(name(pass_), pass_.walk))
+
+        scheduled = set(name(p) for p in self.passes)
+        missing = [required for required in pass_.requires if required not in scheduled]
+
+        if missing:
+            raise PassError('{0} requires {1}'.format(name(pass_), ', '.join(missing)))
+
+        self.passes.append(pass_)
+
+        return pass_
+
+    def traversals(self):
+        '''
+        The fused traversals that run the scheduled passes.
+        '''
+        groups = []
+
+        for pass_ in self.passes:
+            if groups and groups[-1][0].walk == pass_.walk:
+                groups[-1].append(pass_)
+            else:
+                groups.append([pass_])
+
+        return [Traversal(group[0].walk, group, self.times) for group in groups]
+
+    def run(self, tree):
+        for traversal in self.traversals():
+            traversal.run(tree)
+
+
+def name(pass_):
+    return pass_.__class__.__name__
@@ -7,6 +7,9 @@ from .. import node
 
 
 class ModuleFunction(object):
+    walk = 'down'
+    requires = ('JoinElse',)
+
     _store = method_store()
 
     def __init__(self):
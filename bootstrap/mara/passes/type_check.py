@@ -6,14 +6,89 @@ from ..util.dispatch import method_store, multimethod
 from .. import node
 
 
-class TypeCheck(object):
+class TypeTable(object):
+    '''
+    Hash-consed types.
+
+    Each distinct type has a single interned instance, and compound types
+    are interned from their interned parts, so equal types are identical:
+    they compare with is and can key dictionaries.
+    '''
     _store = method_store()
 
     def __init__(self):
+        # every interned type, by its class and the ids of its parts
+        self._types = {}
+
+    def __len__(self):
+        return len(self._types)
+
+    @multimethod(_store)
+    def intern(self, t):
+        '''
+        The interned instance of the type equal to t.
+        '''
+        return self._lookup((t.__class__,), lambda: t)
+
+    @intern.d(node.FunctionType)
+    def _(self, t):
+        param_type = self.intern(t.param_type)
+        return_type = self.intern(t.return_type)
+
+        return self._lookup(
+            (node.FunctionType, id(param_type), id(return_type)),
+            lambda: node.FunctionType(param_type=param_type, return_type=return_type),
+        )
+
+    @intern.d(node.Tuple)
+    def _(self, t):
+        values = [self.intern(value) for value in t.values]
+
+        return self._lookup(
+            (node.Tuple,) + tuple(id(value) for value in values),
+            lambda: node.Tuple(values),
+        )
+
+    def _lookup(self, key, make):
+        try:
+            return self._types[key]
+        except KeyError:
+            interned = self._types[key] = make()
+            return interned
+
+
+# interned types are never freed, so their ids stay unique
+TYPES = TypeTable()
+intern_type = TYPES.intern
+
+INT = intern_type(node.IntType())
+REAL = intern_type(node.RealType())
+BOOL = intern_type(node.BoolType())
+UNIT = intern_type(node.UnitType())
+ANY = intern_type(node.AnyType())
+INFER = intern_type(node.InferType())
+
+# the value of unit, which no type is equal to
+_UNIT_VALUE = node.Unit()
+
+
+class TypeCheck(object):
+    '''
+    Infer and check the type of every node, walking up the tree.
+
+    All types are interned, so they are compared by identity.
+    '''
+    walk = 'up'
+    requires = ('CollectNames',)
+
+    _store = method_store()
+
+    def __init__(self, tables):
+        self.tables = tables
         self._builtin_types = {
-            'Int': node.IntType(),
-            'Real': node.RealType(),
-            'Bool': node.BoolType(),
+            'Int': INT,
+            'Real': REAL,
+            'Bool': BOOL,
         }
 
     @multimethod(_store)
@@ -22,31 +97,31 @@ class TypeCheck(object):
 
     @visit.d(node.Int)
     def _(self, n):
-        n['type'] = node.IntType()
+        self.tables.type_[n] = INT
 
     @visit.d(node.Real)
     def _(self, n):
-        n['type'] = node.RealType()
+        self.tables.type_[n] = REAL
 
     @visit.d(node.Bool)
     def _(self, n):
-        n['type'] = node.BoolType()
+        self.tables.type_[n] = BOOL
 
     @visit.d(node.Val)
     def _(self, n):
-        n['type'] = self._declaration(n)
+        self.tables.type_[n] = self._declaration(n)
 
     @visit.d(node.Var)
     def _(self, n):
-        n['type'] = self._declaration(n)
+        self.tables.type_[n] = self._declaration(n)
 
     def _declaration(self, n):
         declared_type = self.resolve_type(n.type_)
-        value_type = n.value['type']
+        value_type = self.tables.type_[n.value]
 
         final_type = self.infer_check(inferable=declared_type, fixed=value_type)
 
-        if value_type != node.Unit() and final_type == node.UnitType():
+        if value_type != _UNIT_VALUE and final_type is UNIT:
             raise TypeError('Cannot assign Unit')
 
         return final_type
@@ -54,99 +129,99 @@ class TypeCheck(object):
     @visit.d(node.Assign)
     def _(self, n):
         ident = n.name.value
-        declaration = n['namespace'][ident]
+        declaration = self.tables.namespace[n][ident]
 
         declared_type = self._declaration(declaration)
-        value_type = n.value['type']
+        value_type = self.tables.type_[n.value]
 
         final_type = self.infer_check(inferable=declared_type, fixed=value_type)
 
-        if final_type == node.UnitType():
+        if final_type is UNIT:
             raise TypeError('Cannot assign Unit')
 
         # propogate type inference back to the declaration.
-        if declared_type != final_type:
-            declaration.set_hard('type', final_type)
+        if declared_type is not final_type:
+            self.tables.type_.set_hard(declaration, final_type)
 
-        n['type'] = final_type
+        self.tables.type_[n] = final_type
 
     @visit.d(node.ValueId)
     def _(self, n):
         ident = n.value
-        declaration = n['namespace'][ident]
+        declaration = self.tables.namespace[n][ident]
 
-        n['type'] = self._declaration(declaration)
+        self.tables.type_[n] = self._declaration(declaration)
 
     @visit.d(node.Block)
     def _(self, n):
         if len(n.exprs) == 0:
-            n['type'] = node.UnitType()
+            self.tables.type_[n] = UNIT
 
         else:
-            n['type'] = n.exprs[-1]['type']
+            self.tables.type_[n] = self.tables.type_[n.exprs[-1]]
 
     @visit.d(node.Tuple)
     def _(self, n):
-        n['type'] = node.Tuple([
-            value['type']
+        self.tables.type_[n] = intern_type(node.Tuple([
+            self.tables.type_[value]
             for value in n.values
-        ])
+        ]))
 
     @visit.d(node.Param)
     def _(self, n):
-        if n.type_ == node.InferType():
-            n['type'] = node.AnyType()
+        if isinstance(n.type_, node.InferType):
+            self.tables.type_[n] = ANY
         else:
             raise NotImplementedError(n)
 
     @visit.d(node.Unit)
     def _(self, n):
-        n['type'] = node.UnitType()
+        self.tables.type_[n] = UNIT
 
     @visit.d(node.If)
     def _(self, n):
-        pred_type = n.pred['type']
-        if_type = n.if_body['type']
-        else_type = n.else_body['type']
+        pred_type = self.tables.type_[n.pred]
+        if_type = self.tables.type_[n.if_body]
+        else_type = self.tables.type_[n.else_body]
 
         # ensure that the predicate is of type Bool
-        self.infer_check(inferable=pred_type, fixed=node.BoolType())
+        self.infer_check(inferable=pred_type, fixed=BOOL)
 
         final_type = self.infer_check(inferable=if_type, fixed=else_type)
 
-        n['type'] = final_type
+        self.tables.type_[n] = final_type
 
     @visit.d(node.Def)
     def _(self, n):
-        n['type'] = self._definition(n)
+        self.tables.type_[n] = self._definition(n)
 
     def _definition(self, n):
-        param_type = n.param['type']
-        body_type = n.body['type']
+        param_type = self.tables.type_[n.param]
+        body_type = self.tables.type_[n.body]
 
         return_type = self.resolve_type(n.return_type)
         final_type = self.infer_check(inferable=return_type, fixed=body_type)
 
-        return node.FunctionType(
+        return intern_type(node.FunctionType(
             param_type=param_type,
             return_type=final_type,
-        )
+        ))
 
     @visit.d(node.Call)
     def _(self, n):
         ident = n.func.value
-        definition = n['namespace'][ident]
+        definition = self.tables.namespace[n][ident]
 
-        n['type'] = self._definition(definition)
+        self.tables.type_[n] = self._definition(definition)
 
     def infer_check(self, inferable, fixed):
-        if fixed == node.UnitType():
+        if fixed is UNIT:
             return fixed
 
-        elif inferable == node.InferType():
+        elif inferable is INFER:
             return fixed
 
-        elif inferable != fixed:
+        elif inferable is not fixed:
             raise TypeError('Type Mismatch: {0} != {1}'.format(inferable, fixed))
 
         return fixed
@@ -157,7 +232,7 @@ class TypeCheck(object):
 
     @resolve_type.d(node.InferType)
     def _(self, n):
-        return n
+        return INFER
 
     @resolve_type.d(node.TypeId)
     def _(self, n):
@@ -0,0 +1,230 @@
+'''
+Machine Profilers.
+
+OpcodeProfile records every instruction the machine executes: how often
+and for how long each opcode ran, how often each pc was executed and how
+often each function was called.  The machine only runs its profiled loop
+when given a profile, so unprofiled execution pays nothing for it.
+
+SamplingProfiler instead periodically samples the call stack of a running
+machine from a timer signal, leaving the machine's loop untouched, and
+reports the samples in collapsed stack format for flame graph tools.
+'''
+
+import json
+import signal
+from collections import defaultdict
+
+# opcodes that enter a function, leaving the pc just before its address
+CALLS = frozenset(['call', 'call_into', 'tail_call'])
+
+# position of the function address in the operands of each call opcode
+CALL_TARGETS = {
+    'call': 1,
+    'call_into': 2,
+    'tail_call': 1,
+}
+
+TIMER_SIGNALS = {
+    signal.ITIMER_REAL: signal.SIGALRM,
+    signal.ITIMER_VIRTUAL: signal.SIGVTALRM,
+    signal.ITIMER_PROF: signal.SIGPROF,
+}
+
+
+class OpcodeProfile(object):
+    '''
+    Per opcode, per pc and per function execution counts.
+    '''
+
+    def __init__(self):
+        self.counts = defaultdict(int)
+        self.times = defaultdict(float)
+        self.hits = defaultdict(int)
+        self.calls = defaultdict(int)
+
+    def clear(self):
+        self.counts.clear()
+        self.times.clear()
+        self.hits.clear()
+        self.calls.clear()
+
+    def to_dict(self, symbols=None):
+        '''
+        The profile as plain data, naming functions with the given symbols.
+        '''
+        symbols = symbols or {}
+
+        return {
+            'opcodes': {
+                name: {'count': count, 'time': self.times[name]}
+                for name, count in self.counts.iteritems()
+            },
+            'pcs': {str(pc): hits for pc, hits in self.hits.iteritems()},
+            'calls': {
+                str(address): {'count': count, 'names': symbols.get(address, [])}
+                for address, count in self.calls.iteritems()
+            },
+        }
+
+    def to_json(self, symbols=None, **kwargs):
+        return json.dumps(self.to_dict(symbols), sort_keys=True, **kwargs)
+
+    def report(self, symbols=None, lines=None, limit=20):
+        '''
+        A text report of the most expensive opcodes, hottest pcs and most
+        called functions, locating pcs in the source with the given lines.
+        '''
+        symbols = symbols or {}
+        lines = lines or {}
+        total = sum(self.times.itervalues()) or 1.0
+
+        report = ['{0:<20} {1:>10} {2:>10} {3:>6}'.format('opcode', 'count', 'time', '%')]
+
+        by_time = sorted(self.counts, key=lambda name: (-self.times[name], name))
+        for name in by_time[:limit]:
+            report.append('{0:<20} {1:>10} {2:>10.4f} {3:>6.1f}'.format(
+                name,
+                self.counts[name],
+                self.times[name],
+                100 * self.times[name] / total,
+            ))
+
+        report.append('')
+        report.append('{0:<20} {1:>10}'.format('pc', 'hits'))
+
+        by_hits = sorted(self.hits, key=lambda pc: (-self.hits[pc], pc))
+        for pc in by_hits[:limit]:
+            span = lines.get(pc)
+            location = '{0} @{1}'.format(pc, span) if span is not None else str(pc)
+            report.append('{0:<20} {1:>10}'.format(location, self.hits[pc]))
+
+        report.append('')
+        report.append('{0:<20} {1:>10}'.format('function', 'calls'))
+
+        by_calls = sorted(self.calls, key=lambda address: (-self.calls[address], address))
+        for address in by_calls[:limit]:
+            name = ','.join(symbols.get(address, [])) or str(address)
+            report.append('{0:<20} {1:>10}'.format(name, self.calls[address]))
+
+        return '\n'.join(report)
+
+
+class SamplingProfiler(object):
+    '''
+    Samples the call stack of a machine on a timer signal.
+
+    Samples are taken by a signal handler in the main thread, between
+    Python bytecodes, so the machine's loop pays nothing for them.  Use as
+    a context manager around running the machine, and report the samples
+    before loading different code into it.
+    '''
+
+    def __init__(self, machine, interval=0.001, timer=signal.ITIMER_PROF):
+        self.machine = machine
+        self.interval = interval
+        self.timer = timer
+
+        # the number of samples of each stack of pcs
+        self.samples = defaultdict(int)
+
+        self._previous_handler = None
+
+        # the code last reported on and the function each of its pcs is in
+        self._functions = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def start(self):
+        self._previous_handler = signal.signal(TIMER_SIGNALS[self.timer], self._sample)
+        signal.setitimer(self.timer, self.interval, self.interval)
+
+    def stop(self):
+        signal.setitimer(self.timer, 0)
+        signal.signal(TIMER_SIGNALS[self.timer], self._previous_handler or signal.SIG_DFL)
+
+    def _sample(self, signum, frame):
+        # pylint: disable=W0212,W0613
+        self.samples[self.machine._call_stack()] += 1
+
+    def frames(self, pcs):
+        '''
+        The names of the functions on a stack of pcs, outermost first.
+
+        Each frame is named after the function its pc is in, rather than
+        the function its call entered, as a tail call reuses the frame.
+        '''
+        # pylint: disable=W0212
+        code = self.machine._instructions
+
+        if self._functions is None or self._functions[0] is not code:
+            self._functions = (code, self.functions())
+
+        functions = self._functions[1]
+
+        return [functions[pc] if pc < len(functions) else 'main' for pc in pcs]
+
+    def functions(self):
+        '''
+        The name of the function each instruction of the machine's code is
+        in, or main for code outside every function.
+
+        Functions are entered at the targets of calls.  The compiler jumps
+        over each function's body to its end, so a function extends to the
+        target of the jump just before it, if any, else to the next function.
+        '''
+        # pylint: disable=W0212
+        code = self.machine._instructions
+        symbols = self.machine._symbols
+
+        entries = sorted(set(
+            instruction[CALL_TARGETS[instruction[0]]]
+            for instruction in code
+            if instruction[0] in CALL_TARGETS
+        ))
+        nexts = entries[1:] + [len(code)]
+
+        ends = {}
+        for entry, next_entry in zip(entries, nexts):
+            jump = code[entry - 1] if entry > 0 else None
+
+            if jump is not None and jump[0] == 'jump' and jump[1] > entry:
+                ends[entry] = jump[1]
+            else:
+                ends[entry] = next_entry
+
+        # the functions containing the current pc, innermost last
+        enclosing = [(len(code), 'main')]
+        functions = []
+
+        for pc in xrange(len(code)):
+            while enclosing[-1][0] <= pc:
+                enclosing.pop()
+
+            if pc in ends:
+                name = ','.join(symbols.get(pc, [])) or 'pc {0}'.format(pc)
+                enclosing.append((ends[pc], name))
+
+            functions.append(enclosing[-1][1])
+
+        return functions
+
+    def collapsed(self):
+        '''
+        The samples in collapsed stack format: one line per distinct stack,
+        its frames separated by semicolons, followed by its sample count.
+        '''
+        counts = defaultdict(int)
+
+        for pcs, count in self.samples.iteritems():
+            counts[';'.join(self.frames(pcs))] += count
+
+        return '\n'.join(
+            '{0} {1}'.format(stack, count)
+            for stack, count in sorted(counts.iteritems())
+        )
@@ -13,6 +13,10 @@ class SpecialValue(object):
     def __repr__(self):
         return str(self.name)
 
+    def __reduce__(self):
+        # unpickle as the module level singleton
+        return self.name
+
 NULL = SpecialValue('NULL')
 UNIT = SpecialValue('UNIT')
 HALT = SpecialValue('HALT')
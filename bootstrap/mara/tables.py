@@ -0,0 +1,161 @@
+'''
+Side tables of the hot node attributes.
+
+Every node is numbered densely as it is created.  Each table holds one
+attribute for all nodes, in a list or typed array indexed by node id, so
+reading an attribute is an index instead of the key checks and path
+parsing of Attributes.  Attributes are still set once: setting one again
+raises a KeyError, unless set soft to an equal value or set hard.
+
+The tables belong to a Tables context, one per compilation, which the
+passes and the compiler are given.  A context is created before the tree
+it describes is parsed, so its tables are indexed from that tree's first
+node, and they go away with the compilation.  Ids are never reused, so
+the attributes of one compilation never leak into another.
+'''
+
+from array import array
+import itertools
+
+# the id of the next node created
+next_id = itertools.count().next
+
+MISSING = object()
+
+# marks missing values in typed tables, which only hold non-negative ints
+MISSING_INT = -1
+
+
+class SideTable(object):
+    '''
+    One attribute of every node, indexed by node id.
+
+    Typed tables store their values in an array of the given typecode.
+    The array starts at the id base, so it only grows for nodes created
+    since, and the few older nodes that are set are kept aside in a dict.
+    '''
+
+    def __init__(self, name, typecode=None, base=0):
+        self.name = name
+        self.typecode = typecode
+
+        self._missing = MISSING if typecode is None else MISSING_INT
+
+        self._base = base
+        self._values = self._empty()
+        self._detached = {}
+
+    def _empty(self):
+        if self.typecode is None:
+            return []
+
+        return array(self.typecode)
+
+    def _grow(self, offset):
+        count = offset + 1 - len(self._values)
+
+        if self.typecode is None:
+            self._values.extend([MISSING] * count)
+        else:
+            self._values.extend(array(self.typecode, [MISSING_INT]) * count)
+
+    def _lookup(self, n):
+        # pylint: disable=W0212
+        offset = n._id - self._base
+
+        if offset < 0:
+            return self._detached.get(n._id, self._missing)
+
+        try:
+            return self._values[offset]
+        except IndexError:
+            return self._missing
+
+    def _store(self, n, value):
+        # pylint: disable=W0212
+        if self.typecode is not None and value < 0:
+            raise ValueError('{0} must not be negative, not {1}'.format(self.name, value))
+
+        offset = n._id - self._base
+
+        if offset < 0:
+            self._detached[n._id] = value
+            return
+
+        if offset >= len(self._values):
+            self._grow(offset)
+
+        self._values[offset] = value
+
+    def _present(self, value):
+        if self.typecode is None:
+            return value is not MISSING
+
+        return value != MISSING_INT
+
+    def __contains__(self, n):
+        return self._present(self._lookup(n))
+
+    def __getitem__(self, n):
+        value = self._lookup(n)
+
+        if not self._present(value):
+            raise KeyError(self.name)
+
+        return value
+
+    def __setitem__(self, n, value):
+        if n in self:
+            raise KeyError(self.name)
+
+        self._store(n, value)
+
+    def get(self, n, default=None):
+        try:
+            return self[n]
+        except KeyError:
+            return default
+
+    def set_soft(self, n, value):
+        '''
+        Set and possibly override the attribute of n, only if the new value
+        is equal to the old value, raising a KeyError otherwise.
+        '''
+        if n in self:
+            if self[n] != value:
+                raise KeyError(self.name)
+            return
+
+        self._store(n, value)
+
+    def set_hard(self, n, value):
+        '''
+        Set and always override the attribute of n.
+        '''
+        self._store(n, value)
+
+
+class Tables(object):
+    '''
+    The side tables of one compilation.
+
+    Only nodes created after the context are indexed in its tables, so it
+    should be created before parsing.
+    '''
+
+    def __init__(self):
+        # the id of the next node created
+        base = next_id() + 1
+
+        self.namespace = SideTable('namespace', base=base)
+        self.index = SideTable('index', 'l', base=base)
+        self.constant = SideTable('constant', 'l', base=base)
+        self.type_ = SideTable('type', base=base)
+        self.address = SideTable('address', base=base)
+        self.locals_ = SideTable('locals', base=base)
+
+    def tables(self):
+        '''
+        Every table of the context.
+        '''
+        return [self.namespace, self.index, self.constant, self.type_, self.address, self.locals_]
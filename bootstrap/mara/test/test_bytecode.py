@@ -0,0 +1,72 @@
+'''
+Test the compact bytecode encoding.
+'''
+
+# pylint: disable=W0621
+# pylint: disable=W0212
+
+import pytest
+
+from .. import bytecode
+from .. import special
+from ..assembler import Assembler
+from ..machine import Machine
+
+
+def test_encode_round_trip():
+    instructions = [
+        ('load_v', 0, special.NULL),
+        ('load_v', 1, 10),
+        ('load_v', 2, 10.0),
+        ('new_sym', 3, 'hello'),
+        ('call', 7, 1, 2),
+        ('save', 1, 2, 3),
+        ('ret',),
+        ('halt',),
+    ]
+
+    encoded = bytecode.encode(instructions)
+
+    assert len(encoded) == len(instructions)
+    assert encoded[4] == ('call', 7, 1, 2)
+    assert bytecode.decode(encoded) == instructions
+
+    # 10 and 10.0 are distinct literals
+    assert encoded.literals == [special.NULL, 10, 10.0, 'hello']
+
+    # one opcode and one length word per instruction
+    assert len(encoded.code) == 2 * len(instructions) + 14
+
+    restored = bytecode.Bytecode.fromstring(encoded.tostring(), encoded.literals)
+    assert bytecode.decode(restored) == instructions
+
+    # encoded code holds arrays, so it only hashes by identity
+    assert hash(encoded) == object.__hash__(encoded)
+
+
+def test_encode_errors():
+    with pytest.raises(bytecode.BytecodeError):
+        bytecode.encode([('bogus', 1)])
+
+    with pytest.raises(bytecode.BytecodeError):
+        bytecode.encode([('copy', 1, 'r2')])
+
+
+def test_machine_runs_bytecode():
+    assembled = Assembler().assemble([
+        ['load_v', 1, 3],
+        ['load_v', 2, -1],
+        ['label', 'loop'],
+        ['add', 1, 1, 2],
+        ['print_reg', 1],
+        ['branch_zero', 1, 'end'],
+        ['jump', 'loop'],
+        ['label', 'end'],
+        ['halt'],
+    ])
+
+    machine = Machine(buffered=True, traced=True)
+    machine._load(bytecode.encode(assembled))
+    machine._loop()
+
+    assert machine._print_buffer == ['r1:2', 'r1:1', 'r1:0']
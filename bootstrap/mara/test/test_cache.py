@@ -0,0 +1,113 @@
+'''
+Test the compiled bytecode cache.
+'''
+
+# pylint: disable=W0621
+# pylint: disable=W0212
+
+import os
+
+import pytest
+
+from .. import special
+from ..cache import BytecodeCache
+from ..interpreter import Interpreter
+
+from test_parser import maramodule
+
+
+@pytest.fixture
+def source():
+    return maramodule('test', '''
+        def fib (x) {
+            1 if x < 2
+            else {
+                (fib(x - 2)) +
+                (fib(x - 1))
+            }
+        }
+
+        var x = 2.5
+        fib(10)
+    ''')
+
+
+def test_warm_start(tmpdir, source):
+    cold = Interpreter(cache_dir=str(tmpdir))
+
+    assert cold.evaluate(source) == 89
+    assert cold.cache.misses == 1
+    assert len(tmpdir.listdir()) == 1
+
+    warm = Interpreter(cache_dir=str(tmpdir))
+    warm.parser = None  # a warm start never parses
+
+    assert warm.evaluate(source) == 89
+    assert warm.cache.hits == 1
+
+    assert warm.evaluate(source) == 89
+    assert warm.cache.hits == 2
+
+    # the fused dispatch count is cached with the code
+    assert warm.eliminated == 2 * cold.eliminated > 0
+
+
+def test_cache_key(tmpdir, source):
+    cache = BytecodeCache(str(tmpdir))
+
+    assert cache.key(source) == cache.key(source)
+    assert cache.key(source) != cache.key(source + ' ')
+    assert cache.key(source, fuse=True) != cache.key(source, fuse=False)
+
+
+def test_cached_special_values(tmpdir):
+    given = maramodule('test', '''
+        if 0 {
+            2 * 10
+        }
+    ''')
+
+    Interpreter(cache_dir=str(tmpdir)).evaluate(given)
+
+    warm = Interpreter(cache_dir=str(tmpdir))
+    assert warm.evaluate(given) is special.NULL
+    assert warm.cache.hits == 1
+
+
+def test_corrupt_entries_are_recompiled(tmpdir, source):
+    cold = Interpreter(cache_dir=str(tmpdir))
+    cold.evaluate(source)
+
+    for path in tmpdir.listdir():
+        path.write('garbage')
+
+    warm = Interpreter(cache_dir=str(tmpdir))
+
+    assert warm.evaluate(source) == 89
+    assert warm.cache.misses == 1
+
+    assert Interpreter(cache_dir=str(tmpdir)).evaluate(source) == 89
+
+
+def test_truncated_entries_are_recompiled(tmpdir, source):
+    Interpreter(cache_dir=str(tmpdir)).evaluate(source)
+
+    for path in tmpdir.listdir():
+        data = path.read('rb')
+        path.write(data[:-1], 'wb')
+
+    warm = Interpreter(cache_dir=str(tmpdir))
+
+    assert warm.evaluate(source) == 89
+    assert warm.cache.misses == 1
+
+
+def test_evaluate_file(tmpdir, source):
+    path = tmpdir.join('fib.mara')
+    path.write(source)
+
+    interpreter = Interpreter()
+
+    assert interpreter.evaluate_file(str(path)) == 89
+    assert interpreter.cache is None
+    assert os.listdir(str(tmpdir.join('__maracache__')))
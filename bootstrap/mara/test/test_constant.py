@@ -0,0 +1,80 @@
+'''
+Test the constant pool.
+'''
+
+# pylint: disable=W0621
+# pylint: disable=W0212
+
+from .. import node
+from .. import tables
+from ..constant import ConstantPool, SMALL_INT_MIN, SMALL_INT_MAX, unpack
+from ..interpreter import Interpreter
+
+from test_parser import maramodule
+
+
+def test_constants_are_deduplicated():
+    pool = ConstantPool(tables.Tables())
+
+    large = [node.Int(str(SMALL_INT_MAX + 1)) for _ in range(500)]
+    reals = [node.Real('1.5'), node.Real('1.5'), node.Real('2.5')]
+    huge = [node.Int(str(1 << 80)), node.Int(str(1 << 80))]
+
+    for n in large + reals + huge:
+        pool.visit(n)
+
+    assert list(pool) == [SMALL_INT_MAX + 1, 1.5, 2.5, 1 << 80]
+    assert set(unpack(pool.tables.constant[n]) for n in large) == set([(False, 0)])
+    assert [unpack(pool.tables.constant[n]) for n in reals] == [(False, 1), (False, 1), (False, 2)]
+    assert [unpack(pool.tables.constant[n]) for n in huge] == [(False, 3), (False, 3)]
+
+    assert len(pool._ints) == 1
+    assert len(pool._reals) == 2
+
+
+def test_ints_and_reals_stay_distinct():
+    pool = ConstantPool(tables.Tables())
+
+    values = ['100000', '100000.0', '-0.0', '0.0']
+    nodes = [node.Int(values[0])] + [node.Real(value) for value in values[1:]]
+
+    for n in nodes:
+        pool.visit(n)
+
+    assert len(pool) == 4
+    assert isinstance(pool[0], int)
+    assert isinstance(pool[1], float)
+    assert str(pool[2]) == '-0.0'
+
+
+def test_small_ints_are_immediates():
+    pool = ConstantPool(tables.Tables())
+
+    one = node.Int('1')
+    true = node.Bool('1')
+    lowest = node.Int(str(SMALL_INT_MIN))
+
+    pool.visit(one)
+    pool.visit(true)
+    pool.visit(lowest)
+
+    assert unpack(pool.tables.constant[one]) == (True, 1)
+    assert unpack(pool.tables.constant[true]) == (True, 1)
+    assert unpack(pool.tables.constant[lowest]) == (True, SMALL_INT_MIN)
+    assert len(pool) == 0
+
+    # immediates live in the side table, not in per node attributes
+    assert one._attrs is None and true._attrs is None
+
+    given = maramodule('test', '''
+        var x = 1
+        x + 1
+    ''')
+
+    interpreter = Interpreter()
+    unit = interpreter.compile(given)
+
+    assert unit.pool == []
+    assert 'load_c' not in [code[0] for code in unit.code]
+    assert 'add_v' in [code[0] for code in unit.code]
+    assert interpreter.evaluate(given) == 2
@@ -10,7 +10,8 @@ Test the Mara Bytecode Compiler
 import pytest
 
 from ..interpreter import Interpreter
-from ..compiler import CompileError
+from ..compiler import CompileError, Compiler
+from ..machine import StackOverflow
 from .. import special
 
 from test_parser import maramodule
@@ -261,6 +262,68 @@ def test_evaluate_twice(interpreter):
     assert result_0 == 20
 
 
+def test_registers_are_reused(interpreter):
+    given = maramodule('test', '''
+        def fib (x) {
+            1 if x == 0
+            else {
+                1 if x == 1
+                else {
+                    (fib(x - 2)) +
+                    (fib(x - 1))
+                }
+            }
+        }
+
+        fib(6)
+    ''')
+
+    result = interpreter.evaluate(given)
+
+    assert result == 13
+
+    saves = [code for code in interpreter.compiler.block if code[0] == 'save']
+    assert max(len(code) - 1 for code in saves) <= 6
+
+
+def test_frame_sizes_are_reported(interpreter):
+    given = maramodule('test', '''
+        def add(x, y) {
+            val z = x + y
+            z
+        }
+
+        add(1, 2)
+    ''')
+
+    result = interpreter.evaluate(given)
+
+    assert result == 3
+
+    # 3 call slots, 3 locals including the 2 params, and the saved registers
+    frame_size = max(interpreter.compiler.frames.values())
+    saved = max(len(code) - 1 for code in interpreter.compiler.block if code[0] == 'save')
+
+    assert frame_size == 3 + 3 + saved
+    assert len(interpreter.machine._regs_buffer) >= interpreter.compiler.max_register + 1
+
+
+def test_register_limit():
+    interpreter = Interpreter(traced=True)
+    interpreter.compiler.allocator.max_registers = 3
+
+    given = maramodule('test', '''
+        var a = 1
+        var b = 2
+        var c = 3
+        var d = 4
+        (a + b) * (c + d)
+    ''')
+
+    with pytest.raises(CompileError):
+        interpreter.evaluate(given)
+
+
 @pytest.mark.skipif(True, reason='slowness')
 def test_benchmark(interpreter):
     given = maramodule('test', '''
@@ -279,3 +342,202 @@ def test_benchmark(interpreter):
 
     assert result == 200
 
+
+
+def test_line_table(interpreter):
+    given = '''module test
+var x = 6
+var y = 7
+
+x * y
+end'''
+
+    unit = interpreter.compile(given)
+    lines = unit.code.lines
+
+    multiply = [pc for pc, code in enumerate(unit.code) if code[0] == 'mul']
+    assert len(multiply) == 1
+    assert str(lines[multiply[0]]) == '5:1'
+
+    assert set([2, 3, 5]) <= set(lines[pc].line for pc in lines)
+
+
+def test_overflow_reports_source_line():
+    given = '''module test
+def f(x) {
+    (f(x)) + 1
+}
+f(1)
+end'''
+
+    with pytest.raises(StackOverflow) as info:
+        Interpreter().evaluate(given)
+
+    assert '(line ' in str(info.value)
+
+
+def test_max_depth_raises_the_stack_limit():
+    given = maramodule('test', '''
+        def depth (n) {
+            if n < 1 { 0 }
+            else {
+                (depth(n - 1)) + 1
+            }
+        }
+
+        depth(5000)
+    ''')
+
+    with pytest.raises(StackOverflow):
+        Interpreter().evaluate(given)
+
+    assert Interpreter(max_depth=20000).evaluate(given) == 5000
+
+
+def test_tail_calls_reuse_the_frame():
+    given = maramodule('test', '''
+        def count (n, acc) {
+            if n < 1 { acc }
+            else {
+                count(n - 1, acc + 2)
+            }
+        }
+
+        count(100000, 0)
+    ''')
+
+    interpreter = Interpreter()
+
+    assert interpreter.evaluate(given) == 200000
+
+    code = list(interpreter.machine._code)
+    tail_calls = [pc for pc, instruction in enumerate(code) if instruction[0] == 'tail_call']
+
+    assert tail_calls
+
+    # a tail call never returns, so its result is never copied out of r0
+    for pc in tail_calls:
+        assert code[pc + 1][:1] != ('copy',) or code[pc + 1][2] != 0
+
+
+def test_calls_to_later_functions():
+    given = maramodule('test', '''
+        def f (n) {
+            (g(n)) + 1
+        }
+
+        def g (n) {
+            n * 2
+        }
+
+        f(3)
+    ''')
+
+    assert Interpreter().evaluate(given) == 7
+
+
+def test_mutually_recursive_tail_calls_reuse_the_frame():
+    given = maramodule('test', '''
+        def even (n) {
+            if n < 1 { 1 }
+            else {
+                odd(n - 1)
+            }
+        }
+
+        def odd (n) {
+            if n < 1 { 0 }
+            else {
+                even(n - 1)
+            }
+        }
+
+        even(100001)
+    ''')
+
+    # the stack only has room for a few frames, so every call must reuse one
+    assert Interpreter(max_depth=8).evaluate(given) == 0
+
+
+def test_timed_passes():
+    given = maramodule('test', '''
+        val x = 2
+        x
+    ''')
+
+    interpreter = Interpreter(timed=True)
+
+    assert interpreter.evaluate(given, type_check=True) == 2
+    assert interpreter.evaluate(given) == 2
+
+    assert interpreter.pass_times.runs['ConstantPool'] == 2
+    assert interpreter.pass_times.runs['TypeCheck'] == 1
+    assert 'TypeCheck' in interpreter.pass_times.report()
+    assert Interpreter().pass_times is None
+
+
+def test_eliminated_dispatches_are_reported():
+    given = maramodule('test', '''
+        var x = 0
+        while x < 10 {
+            x = x + 1
+        }
+        x
+    ''')
+
+    fused = Interpreter()
+    unfused = Interpreter(fuse=False)
+
+    unit = fused.compile(given)
+
+    assert unit.eliminated > 0
+    assert unfused.compile(given).eliminated == 0
+
+    assert fused.evaluate(given) == unfused.evaluate(given) == 10
+    assert fused.eliminated == unit.eliminated
+    assert unfused.eliminated == 0
+
+
+def test_folded_operations_match_the_machine():
+    operations = [
+        ('6', '*', '7'),
+        ('-7', '/', '2'),
+        ('7', '/', '-2'),
+        ('-7.0', '/', '2'),
+        ('3', '-', '10'),
+        ('3', '<', '4'),
+        ('4', '>', '3'),
+        ('2', '==', '2'),
+    ]
+
+    for left, op, right in operations:
+        # literal operands are folded, the machine computes with var operands
+        folded = maramodule('test', '\n{0} {1} {2}\n'.format(left, op, right))
+        computed = maramodule('test', '''
+            var a = {0}
+            var b = {1}
+            a {2} b
+        '''.format(left, right, op))
+
+        interpreter = Interpreter()
+        result = interpreter.evaluate(folded)
+        expected = Interpreter().evaluate(computed)
+
+        assert (result, type(result)) == (expected, type(expected))
+
+        # nothing is left for the machine to compute
+        instructions = set(instruction[0] for instruction in interpreter.machine._instructions)
+        assert not instructions & set(Compiler._builtins.values())
+
+
+def test_division_by_zero_is_not_folded():
+    given = maramodule('test', '''
+        7 / 0
+    ''')
+
+    interpreter = Interpreter()
+
+    with pytest.raises(ZeroDivisionError):
+        interpreter.evaluate(given)
+
+    assert 'div' in [instruction[0] for instruction in interpreter.machine._instructions]
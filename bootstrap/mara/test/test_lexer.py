@@ -295,3 +295,33 @@ def test_control_with_empty(lex_simple):
     result = list(lex_simple(given))
 
     assert result == expected
+
+
+def test_continuation_across_blank_lines(lex_simple):
+    given = '''module test
+    x = 1 +
+        \t
+            \t  \r
+        2
+        \t
+    y
+    '''
+
+    expected = [
+        ('MODULE', 'module'),
+        ('VID', 'test'),
+        ('TERM', '\n'),
+        ('VID', 'x'),
+        ('EQ', '='),
+        ('INTD', '1'),
+        ('PLUS', '+'),
+        ('INTD', '2'),
+        ('TERM', '\n'),
+        ('TERM', '\n'),
+        ('VID', 'y'),
+        ('TERM', '\n'),
+    ]
+
+    result = list(lex_simple(given))
+
+    assert result == expected
@@ -1,6 +1,11 @@
+import json
+
 import pytest
 
-from ..machine import Machine
+from ..assembler import Assembler
+from ..interpreter import Interpreter
+from ..machine import Machine, StackOverflow, Pointer, CELL_SIZE
+from ..profiler import SamplingProfiler
 
 # pylint: disable=W0621
 # pylint: disable=W0212
@@ -372,3 +377,506 @@ def test_copy(machine):
         'r1:10',
         'r2:10',
     ]
+
+
+def test_unknown_instruction_halts(machine):
+    machine._load([
+        ['load_v', r(1), 10],
+        ['bogus', r(1)],
+        ['print_reg', r(1)],
+    ])
+
+    assert len(machine._ops) == len(machine._code)
+
+    machine._loop()
+
+    assert machine._print_buffer == []
+
+
+def test_trace_hooks():
+    machine = Machine(buffered=True)
+    trace = []
+
+    def hook(pc, instruction, regs):
+        trace.append((pc, instruction, regs))
+
+    machine._add_trace_hook(hook)
+    machine._load([
+        ['load_v', r(0), 1],
+        ['load_v', r(1), 2],
+        ['add', r(2), r(0), r(1)],
+        ['halt'],
+    ])
+
+    machine._loop()
+
+    assert trace == [
+        (0, ('load_v', 0, 1), {0: 1}),
+        (1, ('load_v', 1, 2), {0: 1, 1: 2}),
+        (2, ('add', 2, 0, 1), {0: 1, 1: 2, 2: 3}),
+        (3, ('halt',), {0: 1, 1: 2, 2: 3}),
+    ]
+
+    machine._remove_trace_hook(hook)
+    machine._loop()
+
+    assert len(trace) == 4
+
+
+def test_fused_superinstructions():
+    machine = Machine(buffered=True, fuse=True)
+    machine._load([
+        ['load_v', r(0), 0],
+        ['load_v', r(1), 5],
+        ['jump', 'loop'],
+        # f(x) { x + 1 }
+        ['label', 'f'],
+        ['load_p', r(10), 0],
+        ['load_c', r(11), 0],
+        ['add', r(0), r(10), r(11)],
+        ['ret'],
+        # while r0 < r1 { r0 = f(r0) }
+        ['label', 'loop'],
+        ['lt', r(2), r(0), r(1)],
+        ['branch_zero', r(2), 'end'],
+        ['call', 'f', r(0)],
+        ['copy', r(0), 0],
+        ['jump', 'loop'],
+        ['label', 'end'],
+        ['print_reg', r(0)],
+        ['print_reg', r(2)],
+        ['halt'],
+    ], [1])
+
+    assert machine._assembler.eliminated == 3
+    assert [code[0] for code in machine._code] == [
+        'load_v', 'load_v', 'jump',
+        'load_p', 'add_c', 'ret',
+        'lt_branch_zero', 'call_into', 'jump',
+        'print_reg', 'print_reg', 'halt',
+    ]
+
+    machine._loop()
+
+    assert machine._print_buffer == [
+        'r0:5',
+        'r2:0',
+    ]
+
+
+def test_labels_are_stripped(machine):
+    machine._load([
+        ['load_v', r(0), 2],
+        ['label', 'loop'],
+        ['noop'],
+        ['load_v', r(1), -1],
+        ['add', r(0), r(0), r(1)],
+        ['branch_zero', r(0), 'end'],
+        ['jump', 'loop'],
+        ['label', 'end'],
+        ['print_reg', r(0)],
+    ])
+
+    assert machine._code == [
+        ('load_v', 0, 2),
+        ('load_v', 1, -1),
+        ('add', 0, 0, 1),
+        ('branch_zero', 0, 5),
+        ('jump', 1),
+        ('print_reg', 0),
+    ]
+    assert machine._symbols == {1: ['loop'], 5: ['end']}
+
+    machine._loop()
+
+    assert machine._print_buffer == ['r0:0']
+
+
+def test_assembler_lines_are_per_assembly():
+    assembler = Assembler()
+    code = [
+        ('label', 'start'),
+        ('load_v', 0, 1),
+        ('halt',),
+    ]
+
+    assembler.assemble(code, spans=[None, '1:1', '2:1'])
+    assert assembler.lines == {0: '1:1', 1: '2:1'}
+
+    assembler.assemble(code)
+    assert assembler.lines == {}
+
+
+def test_stack_overflow():
+    machine = Machine(buffered=True, max_depth=4)
+    machine._load([
+        # f() { f() }
+        ['label', 'f'],
+        ['call', 'f'],
+        ['ret'],
+    ], frames={'f': 3})
+
+    assert len(machine._stack_buffer) == 12
+
+    with pytest.raises(StackOverflow):
+        machine._loop()
+
+
+def test_garbage_collection():
+    machine = Machine(buffered=True)
+
+    machine._load([
+        ['new_chunk', r(1), 2],             # r1 = outer chunk
+        ['new_chunk', r(2), 1],             # r2 = inner chunk
+        ['load_v', r(10), 42],
+        ['store_d', r(10), r(2)],           # *inner = 42
+        ['store_d', r(2), r(1)],            # *outer = inner
+        ['load_v', r(2), 0],                # inner is only reachable via outer
+
+        ['load_v', r(3), 1000],
+        ['load_v', r(11), 1],
+        ['label', 'loop'],
+        ['new_chunk', r(4), 4],             # garbage
+        ['sub', r(3), r(3), r(11)],
+        ['branch_zero', r(3), 'done'],
+        ['jump', 'loop'],
+        ['label', 'done'],
+
+        ['load_d', r(5), r(1)],             # r5 = *outer
+        ['load_d', r(6), r(5)],             # r6 = *inner
+        ['print_reg', r(6)],
+        ['halt'],
+    ])
+
+    machine._loop()
+
+    assert machine._print_buffer == ['r6:42']
+
+    stats = machine._heap_stats
+    assert stats.collections > 0
+    assert stats.objects_freed >= 500
+    assert stats.bytes_freed == stats.cells_freed * CELL_SIZE
+    assert 0 <= stats.max_pause <= stats.total_pause
+
+    # less than the 4000 cells of garbage allocated
+    assert len(machine._heaplet) < 4000
+
+    # live objects were compacted to the start of the heap
+    assert sorted(machine._objects)[:2] == [0, 2]
+    assert isinstance(machine._regs[5], Pointer)
+
+
+def test_collect_frees_unreachable_objects():
+    machine = Machine(buffered=True)
+
+    machine._load([
+        ['new_chunk', r(1), 3],
+        ['new_chunk', r(2), 3],
+        ['halt'],
+    ])
+
+    machine._loop()
+    machine._set(r(1), None)
+
+    assert machine._collect() == 3
+    assert machine._objects == {0: 3}
+    assert machine._regs[2] == 0
+    assert machine._free_ptr == 3
+
+
+def test_heap_growth():
+    machine = Machine(heap_size=4, heap_growth=2)
+
+    machine._load([
+        ['new_chunk', r(1), 3],
+        ['store_d', r(1), r(1)],            # keep the chunk alive via itself
+        ['new_chunk', r(2), 3],
+        ['halt'],
+    ], registers=4)
+
+    machine._loop()
+
+    # 3 live cells + 3 new cells + 4 registers, doubled and rounded up to 4 * 2^n
+    assert len(machine._heaplet) == 32
+    assert machine._heaplet[0] == 0
+    assert machine._regs[2] == 3
+
+    with pytest.raises(ValueError):
+        Machine(heap_size=0)
+
+    with pytest.raises(ValueError):
+        Machine(heap_growth=1)
+
+
+def test_symbols_are_interned(machine):
+    machine._load([
+        ['new_chunk', r(9), 2],
+        ['load_v', r(3), 3],
+        ['load_v', r(11), 1],
+        ['label', 'loop'],
+        ['new_sym', r(1), 'spam'],
+        ['sub', r(3), r(3), r(11)],
+        ['branch_zero', r(3), 'done'],
+        ['jump', 'loop'],
+        ['label', 'done'],
+        ['new_sym', r(2), 'spam'],
+        ['new_sym', r(4), 'eggs'],
+        ['eq', r(5), r(1), r(2)],
+        ['eq', r(6), r(1), r(4)],
+        ['print_reg', r(5)],
+        ['print_reg', r(6)],
+        ['print_sym', r(2)],
+        ['print_sym', r(4)],
+        ['halt'],
+    ])
+
+    machine._loop()
+
+    assert machine._print_buffer == [
+        'r5:1',
+        'r6:0',
+        "r2:2=>'spam'",
+        "r4:7=>'eggs'",
+    ]
+
+    # one chunk and two symbols
+    assert len(machine._objects) == 3
+
+    # the unreachable chunk is freed, symbols move but stay interned
+    machine._set(r(9), None)
+    machine._set(r(1), None)
+    machine._set(r(2), None)
+    machine._set(r(4), None)
+    machine._collect()
+
+    assert machine._symbol_table == {'spam': 0, 'eggs': 5}
+
+    machine.new_sym(r(1), 'eggs')
+    assert machine._regs[1] == 5
+
+
+def test_packed_strings(machine):
+    machine._load([
+        ['new_str', r(1), 'hello, '],
+        ['new_str', r(2), 'world'],
+        ['str_concat', r(3), r(1), r(2)],
+        ['str_len', r(4), r(3)],
+        ['load_v', r(10), 7],
+        ['load_v', r(11), 12],
+        ['str_slice', r(5), r(3), r(10), r(11)],
+        ['load_v', r(10), 1],
+        ['str_index', r(6), r(5), r(10)],
+        ['print_str', r(3)],
+        ['print_reg', r(4)],
+        ['print_str', r(5)],
+        ['print_reg', r(6)],
+        ['halt'],
+    ])
+
+    machine._loop()
+
+    assert machine._print_buffer == [
+        "r3:2=>'hello, world'",
+        'r4:12',
+        "r5:3=>'world'",
+        'r6:111',
+    ]
+
+    # slices share the bytes of the sliced string
+    concatenated = machine._heaplet[machine._regs[3]]
+    sliced = machine._heaplet[machine._regs[5]]
+
+    concatenated[7] = 'W'
+    assert sliced.tobytes() == 'World'
+
+
+def test_opcode_profile():
+    machine = Machine(buffered=True, fuse=True, profiled=True)
+    machine._load([
+        ['load_v', r(0), 0],
+        ['load_v', r(1), 5],
+        ['jump', 'loop'],
+        # f(x) { x + 1 }
+        ['label', 'f'],
+        ['load_p', r(10), 0],
+        ['load_c', r(11), 0],
+        ['add', r(0), r(10), r(11)],
+        ['ret'],
+        # while r0 < r1 { r0 = f(r0) }
+        ['label', 'loop'],
+        ['lt', r(2), r(0), r(1)],
+        ['branch_zero', r(2), 'end'],
+        ['call', 'f', r(0)],
+        ['copy', r(0), 0],
+        ['jump', 'loop'],
+        ['label', 'end'],
+        ['halt'],
+    ], [1])
+
+    machine._loop()
+
+    profile = machine._profile
+
+    assert profile.counts['call_into'] == 5
+    assert profile.counts['add_c'] == 5
+    assert profile.counts['lt_branch_zero'] == 6
+    assert profile.counts['halt'] == 1
+    assert profile.calls == {3: 5}
+    assert profile.hits[3] == 5
+    assert sum(profile.hits.values()) == sum(profile.counts.values())
+    assert set(profile.times) == set(profile.counts)
+
+    exported = json.loads(profile.to_json(machine._symbols))
+    assert exported['calls'] == {'3': {'count': 5, 'names': ['f']}}
+    assert exported['pcs']['3'] == 5
+    assert exported['opcodes']['add_c']['count'] == 5
+
+    report = profile.report(machine._symbols)
+    assert 'call_into' in report
+    assert 'f                             5' in report
+
+
+def test_profile_is_off_by_default(machine):
+    assert machine._profile is None
+
+
+def test_call_stack():
+    machine = Machine(buffered=True)
+    stacks = []
+
+    def record(pc, instruction, regs):
+        if instruction[0] == 'add':
+            stacks.append(machine._call_stack())
+
+    machine._add_trace_hook(record)
+    machine._load([
+        # main { print f(6) }
+        ['load_v', r(0), 6],
+        ['call', 'f', r(0)],
+        ['halt'],
+        # g(x, y) { x + y }
+        ['label', 'g'],
+        ['load_p', r(11), 0],
+        ['load_p', r(12), 1],
+        ['add', r(0), r(11), r(12)],
+        ['ret'],
+        # f(x) { g(x, x) }
+        ['label', 'f'],
+        ['load_p', r(21), 0],
+        ['call', 'g', r(21), r(21)],
+        ['ret'],
+    ])
+    machine._loop()
+
+    assert stacks == [(1, 8, 5)]
+
+    profiler = SamplingProfiler(machine)
+    profiler.samples[(1, 8, 5)] += 3
+    profiler.samples[(1, 7)] += 1
+    profiler.samples[(2,)] += 2
+
+    assert profiler.collapsed() == '\n'.join([
+        'main 2',
+        'main;f 1',
+        'main;f;g 3',
+    ])
+
+
+def test_call_stack_after_tail_call():
+    machine = Machine(buffered=True)
+    stacks = []
+
+    def record(pc, instruction, regs):
+        if instruction[0] == 'add':
+            stacks.append(machine._call_stack())
+
+    machine._add_trace_hook(record)
+    machine._load([
+        # main { print f(6) }
+        ['load_v', r(0), 6],
+        ['call', 'f', r(0)],
+        ['halt'],
+        # g(x) { x + x }
+        ['label', 'g'],
+        ['load_p', r(11), 0],
+        ['add', r(0), r(11), r(11)],
+        ['ret'],
+        # f(x) { g(x) }
+        ['label', 'f'],
+        ['load_p', r(21), 0],
+        ['tail_call', 'g', 1, r(21)],
+    ])
+    machine._loop()
+
+    # f's frame is reused by g, so the call at pc 1 is running g
+    assert stacks == [(1, 4)]
+
+    profiler = SamplingProfiler(machine)
+    profiler.samples[(1, 4)] += 1
+
+    assert profiler.collapsed() == 'main;g 1'
+
+
+def test_profiled_tail_calls_name_the_function_running():
+    interpreter = Interpreter()
+    given = '''module test
+    def g (n) {
+        (n * 2) + 1
+    }
+
+    def f (n) {
+        g(n)
+    }
+
+    (f(3)) + 1
+    end'''
+
+    profiler = SamplingProfiler(interpreter.machine)
+
+    def record(pc, instruction, regs):
+        if instruction[0] == 'mul':
+            profiler.samples[interpreter.machine._call_stack()] += 1
+
+    interpreter.machine._add_trace_hook(record)
+    assert interpreter.evaluate(given) == 8
+
+    stack, count = profiler.collapsed().rsplit(' ', 1)
+    frames = stack.split(';')
+
+    # f tail calls g, so g runs in the frame of the module's call to f
+    assert len(frames) == 3
+    assert frames[0] == 'main'
+    assert frames[1].endswith('_test')
+    assert frames[2].endswith('_g')
+    assert count == '1'
+
+
+def test_sampling_profiler():
+    interpreter = Interpreter()
+    given = '''module test
+    def fib (x) {
+        1 if x < 2
+        else {
+            (fib(x - 2)) +
+            (fib(x - 1))
+        }
+    }
+
+    fib(18)
+    end'''
+
+    profiler = SamplingProfiler(interpreter.machine, interval=0.0005)
+
+    with profiler:
+        interpreter.evaluate(given)
+
+    assert sum(profiler.samples.values()) > 0
+
+    for line in profiler.collapsed().splitlines():
+        stack, count = line.rsplit(' ', 1)
+        frames = stack.split(';')
+
+        # the module itself is compiled to a function
+        assert frames[0] == 'main'
+        assert all(frame.endswith(('_test', '_fib')) for frame in frames[1:])
+        assert int(count) > 0
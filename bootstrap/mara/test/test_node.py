@@ -22,7 +22,21 @@ def test_node_shared_methods():
 
     assert repr(dummy) == "DummyNode(a='qua', b=None, c=0)"
     assert dummy == other
-    assert dummy._attrs
+
+    # attributes are allocated on first write
+    assert dummy._attrs is None
+    assert 'foo' not in dummy
+
+    dummy['foo'] = 1
+    assert dummy._attrs['foo'] == 1
+
+
+def test_nodes_have_slots():
+    for n in [node.Int('1'), node.BinOp(func='+', args=[]), node.IntType()]:
+        assert not hasattr(n, '__dict__')
+
+    with pytest.raises(AttributeError):
+        node.Int('1').extra = None
 
 
 def test_compoment_equality():
@@ -67,6 +81,15 @@ def test_complex_equality():
     assert a == b
 
 
+def test_node_hashes_are_stable_under_mutation():
+    block = node.Block([node.Int('1')])
+    seen = set([block])
+
+    block.exprs.append(node.Int('2'))
+
+    assert block in seen
+
+
 def test_node_attributes():
     # pylint: disable=W0212
     # pylint: disable=W0104
@@ -988,3 +988,59 @@ def test_name_resolution_program(parser, program_name_resolution):
     ast = parser.parse(program_name_resolution)
 
     assert ast is not None
+
+
+def test_shared_tables(tmpdir, monkeypatch):
+    monkeypatch.chdir(tmpdir)
+    monkeypatch.setattr(parser_module, '_PARSER', None)
+
+    shared = parser_module.build_parser()
+
+    assert parser_module.build_parser() is shared
+    assert parser_module.Parser().parse('module test; 10 end') == n.Module(
+        name='test', exprs=[n.Int(value='10')],
+    )
+
+    # tables are read from the package, never written to the working directory
+    assert tmpdir.listdir() == []
+
+
+def test_interleaved_streams(parser):
+    first = parser.simple_stream('module first; 1 end')
+    second = parser.simple_stream('module second; 2.0 end')
+
+    assert next(first) == ('MODULE', 'module')
+    assert next(second) == ('MODULE', 'module')
+    assert next(first) == ('VID', 'first')
+    assert next(second) == ('VID', 'second')
+
+    assert [tok.type for tok in first] == ['TERM', 'INTD', 'END']
+    assert [tok.type for tok in second] == ['TERM', 'REAL', 'END']
+
+
+def test_node_spans(parser):
+    given = '''module test
+x = 10 +
+    20
+def f(y) { y * 3 }
+end'''
+
+    module = parser.parse(given)
+    assign, definition = module.exprs
+
+    assert (assign.span.line, assign.span.column) == (2, 1)
+    assert (assign.span.end_line, assign.span.end_column) == (3, 7)
+
+    binop = assign.value
+    assert (binop.span.line, binop.span.column) == (2, 5)
+    assert given[binop.span.start:binop.span.end] == '10 +\n    20'
+
+    ten, twenty = binop.args
+    assert given[ten.span.start:ten.span.end] == '10'
+    assert str(twenty.span) == '3:5'
+
+    assert str(definition.span) == '4:1'
+    assert str(definition.body.exprs[0].span) == '4:12'
+
+    # spans do not take part in equality
+    assert ten == n.Int(value='10')
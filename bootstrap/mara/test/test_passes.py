@@ -9,6 +9,8 @@ from .. import node
 from .. import special
 from .. import passes
 from .. import scope
+from .. import tables
+from ..passes.type_check import intern_type
 
 from programs import program_name_resolution
 
@@ -16,14 +18,19 @@ from test_lexer import lex_simple
 from test_parser import parser, maramodule
 
 
+@pytest.fixture
+def context():
+    return tables.Tables()
+
+
 @pytest.fixture
 def join_else():
     return passes.JoinElse()
 
 
 @pytest.fixture
-def collect_names():
-    return passes.CollectNames()
+def collect_names(context):
+    return passes.CollectNames(context)
 
 
 @pytest.fixture
@@ -32,8 +39,13 @@ def resolve_names():
 
 
 @pytest.fixture
-def type_check():
-    return passes.TypeCheck()
+def type_check(context):
+    return passes.TypeCheck(context)
+
+
+@pytest.fixture
+def constant_fold(context):
+    return passes.ConstantFold(context)
 
 
 def test_join_else(parser, join_else):
@@ -115,7 +127,7 @@ def test_join_else_regression(parser, join_else):
     assert ast == expected
 
 
-def test_collect_names(parser, collect_names):
+def test_collect_names(parser, context, collect_names):
     given = maramodule('test', '''
         val x = 10
         var y
@@ -175,12 +187,13 @@ def test_collect_names(parser, collect_names):
 
     ast.walk_down(collect_names)
 
-    assert ast['namespace']['x'] == expected['x']
-    assert ast['namespace']['y'] == expected['y']
-    assert ast['namespace']['foo'] == expected['foo']
+    namespace = context.namespace[ast]
+    assert namespace['x'] == expected['x']
+    assert namespace['y'] == expected['y']
+    assert namespace['foo'] == expected['foo']
 
-    foo = ast['namespace']['foo']
-    inner_result = foo.body['namespace']
+    foo = namespace['foo']
+    inner_result = context.namespace[foo.body]
     assert inner_result['x'] == inner['x']
     assert inner_result['y'] == expected['y']
     assert inner_result['foo'] == expected['foo']
@@ -201,7 +214,34 @@ def test_collect_bad_names(parser, collect_names):
         ast.walk_down(collect_names)
 
 
-def test_type_check_simple(type_check):
+def test_constant_fold(parser, collect_names, constant_fold):
+    given = maramodule('test', '''
+        val n = 10
+        var x = 1
+        2 * 3 + x
+        n * 4
+        7 / 2
+        7.0 / 2
+        n < 4
+        x / 0
+    ''')
+
+    ast = parser.parse(given)
+
+    ast.walk_down(collect_names)
+    ast.walk_up(constant_fold)
+
+    assert ast.exprs[2:] == [
+        node.BinOp(func=node.SymbolId('+'), args=[node.Int('6'), node.ValueId('x')]),
+        node.Int('40'),
+        node.Int('3'),
+        node.Real('3.0'),
+        node.Bool('0'),
+        node.BinOp(func=node.SymbolId('/'), args=[node.ValueId('x'), node.Int('0')]),
+    ]
+
+
+def test_type_check_simple(context, type_check):
     given = node.Def(
         name=node.ValueId('foo'),
         param=node.Tuple([node.Param(node.ValueId('x'))]),
@@ -214,13 +254,13 @@ def test_type_check_simple(type_check):
 
     given.walk_up(type_check)
 
-    assert given['type'] == node.FunctionType(
+    assert context.type_[given] == node.FunctionType(
         param_type=node.Tuple([node.AnyType()]),
         return_type=node.IntType(),
     )
 
 
-def test_type_check_infer(type_check):
+def test_type_check_infer(context, type_check):
     given = node.Def(
         name=node.ValueId('foo'),
         param=node.Tuple([node.Param(node.ValueId('x'))]),
@@ -232,13 +272,13 @@ def test_type_check_infer(type_check):
 
     given.walk_up(type_check)
 
-    assert given['type'] == node.FunctionType(
+    assert context.type_[given] == node.FunctionType(
         param_type=node.Tuple([node.AnyType()]),
         return_type=node.IntType(),
     )
 
 
-@pytest.skip
+@pytest.mark.skip
 def test_name_resolution_program(parser, collect_names, program_name_resolution):
     ast = parser.parse(program_name_resolution)
 
@@ -247,6 +287,37 @@ def test_name_resolution_program(parser, collect_names, program_name_resolution)
     assert False
 
 
+def test_type_check_interns_types(context, type_check):
+    first = node.Def(
+        name=node.ValueId('foo'),
+        param=node.Tuple([node.Param(node.ValueId('x'))]),
+        body=node.Block([node.Int('10')]),
+    )
+    second = node.Def(
+        name=node.ValueId('bar'),
+        param=node.Tuple([node.Param(node.ValueId('y'))]),
+        body=node.Block([node.Int('20')]),
+        return_type=node.TypeId('Int'),
+    )
+
+    first.walk_up(type_check)
+    second.walk_up(type_check)
+
+    assert context.type_[first] is context.type_[second]
+    assert context.type_[first] is intern_type(node.FunctionType(
+        param_type=node.Tuple([node.AnyType()]),
+        return_type=node.IntType(),
+    ))
+    assert context.type_[first].return_type is intern_type(node.IntType())
+
+    # types hash consistently with equality, so fresh types find interned ones
+    fresh = node.FunctionType(
+        param_type=node.Tuple([node.AnyType()]),
+        return_type=node.IntType(),
+    )
+    assert {context.type_[first]: 'foo'}[fresh] == 'foo'
+
+
 def test_type_check_return_fail(type_check):
     given = node.Def(
         name=node.ValueId('foo'),
@@ -260,3 +331,55 @@ def test_type_check_return_fail(type_check):
 
     with pytest.raises(TypeError):
         given.walk_up(type_check)
+
+
+def test_pass_manager_fuses_walks(parser):
+    given = maramodule('test', '''
+        val n = 10
+        if n < 4 {
+            n * 2
+        }
+        else {
+            n
+        }
+    ''')
+
+    context = tables.Tables()
+    times = passes.PassTimes()
+    manager = passes.PassManager(times=times)
+
+    manager.add(passes.JoinElse())
+    manager.add(passes.ModuleFunction())
+    manager.add(passes.CollectNames(context))
+    manager.add(passes.CollectLocals(context))
+    manager.add(passes.ConstantFold(context))
+
+    assert [(t.walk, t.names) for t in manager.traversals()] == [
+        ('down', ['JoinElse', 'ModuleFunction', 'CollectNames', 'CollectLocals']),
+        ('up', ['ConstantFold']),
+    ]
+
+    ast = parser.parse(given)
+    manager.run(ast)
+
+    wrapper, _ = ast.exprs
+    _, conditional, _ = wrapper.body.exprs
+
+    assert conditional.pred == node.Bool('0')
+    assert conditional.else_body.exprs == [node.Int('10')]
+    assert context.locals_[wrapper].keys() == [context.namespace[wrapper.body].qualify('n')]
+
+    assert sorted(times.times) == sorted(times.runs) == [
+        'CollectLocals', 'CollectNames', 'ConstantFold', 'JoinElse', 'ModuleFunction',
+    ]
+    assert times.report().splitlines()[0].split() == ['pass', 'runs', 'time', '%']
+
+
+def test_pass_manager_requires_dependencies():
+    manager = passes.PassManager()
+    manager.add(passes.JoinElse())
+
+    with pytest.raises(passes.PassError):
+        manager.add(passes.CollectLocals(tables.Tables()))
+
+    assert [t.names for t in manager.traversals()] == [['JoinElse']]
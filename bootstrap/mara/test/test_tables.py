@@ -0,0 +1,69 @@
+'''
+Test the side tables of hot node attributes.
+'''
+
+# pylint: disable=W0212
+
+import pytest
+
+from .. import node
+from .. import tables
+
+
+def test_side_table():
+    table = tables.SideTable('index', 'l')
+    a, b = node.Int('1'), node.Int('2')
+
+    assert a not in table
+    with pytest.raises(KeyError):
+        table[a]
+
+    table[b] = 3
+    assert table[b] == 3
+    assert a not in table
+    assert table.get(a, 'default') == 'default'
+
+    # set once, unless soft to an equal value or hard
+    with pytest.raises(KeyError):
+        table[b] = 4
+
+    table.set_soft(b, 3)
+    with pytest.raises(KeyError):
+        table.set_soft(b, 4)
+
+    table.set_hard(b, 4)
+    assert table[b] == 4
+
+    with pytest.raises(ValueError):
+        table[a] = -1
+
+
+def test_contexts_only_hold_their_own_nodes():
+    old = node.Int('1')
+
+    first = tables.Tables()
+    given = node.Int('2')
+    first.index[given] = 0
+
+    second = tables.Tables()
+    other = node.Int('3')
+    second.index[other] = 1
+
+    assert given not in second.index
+    assert other not in first.index
+    assert len(second.index._values) == 1
+
+    # nodes older than the context are kept aside
+    first.index[old] = 2
+    assert first.index[old] == 2
+    assert len(first.index._values) == 1
+
+
+def test_node_items_are_not_in_the_tables():
+    context = tables.Tables()
+    given = node.Int('1')
+
+    given['index'] = 0
+
+    assert given not in context.index
+    assert given._attrs.keys() == ['index']
@@ -178,3 +178,47 @@ def test_deriving():
 
     assert eq_show0 == eq_show1
     assert eq_show2 != eq_show1
+
+
+def test_deriving_slotted_classes():
+    from ..util.reflection import deriving
+
+    class Point(deriving('eq', 'show')):
+        __slots__ = ('x', 'y', '_cache')
+
+        def __init__(self, x, y):
+            self.x = x
+            self.y = y
+            self._cache = None
+
+    class Point3(Point):
+        __slots__ = ('z',)
+
+        def __init__(self, x, y, z):
+            Point.__init__(self, x, y)
+            self.z = z
+
+    class Loose(Point):
+        def __init__(self, x, y):
+            Point.__init__(self, x, y)
+            self.w = [x]
+
+    # fields are fixed when the class is created
+    assert Point._derived_fields == ('x', 'y')
+    assert Point3._derived_fields == ('x', 'y', 'z')
+    assert Loose._derived_fields is None
+
+    assert repr(Point(1, 'a')) == "Point(x=1, y='a')"
+    assert str(Point(1, 'a')) == 'Point(x=1, y=a)'
+    assert repr(Point3(1, 2, 3)) == 'Point3(x=1, y=2, z=3)'
+    assert repr(Loose(1, 2)) == 'Loose(w=[1], x=1, y=2)'
+
+    assert Point(1, 2) == Point(1, 2)
+    assert Point(1, 2) != Point(1, 3)
+    assert Point3(1, 2, 3) != Point3(1, 2, 4)
+    assert Point(1, 2) != Point3(1, 2, 3)
+    assert Loose(1, 2) == Loose(1, 2)
+
+    # deriving eq does not make mutable objects hash by their fields
+    point = Point(1, [2])
+    assert hash(point) == object.__hash__(point)
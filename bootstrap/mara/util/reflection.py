@@ -8,27 +8,98 @@ import types
 ##############################################################################
 
 
-class _Derived(object):
-    '''Base class for dynamically generated "Derived" class
+class _DerivingMeta(type):
+    '''Metaclass of derived classes.
+
+    Computes the fields of each class as it is created, and if they are
+    fixed by __slots__ generates eq, ne, repr and str methods specialized
+    to those fields, replacing any inherited derived methods.
+    '''
+
+    def __init__(cls, name, bases, namespace):
+        super(_DerivingMeta, cls).__init__(name, bases, namespace)
+
+        cls._derived_slots, slotted = _slot_fields(cls)
+        cls._derived_fields = cls._derived_slots if slotted else None
+
+        for method_name, generic in _generic_methods.items():
+            inherited = getattr(cls, method_name, None)
+
+            derived = (
+                method_name not in namespace and
+                getattr(inherited, '_derived', None) is not None
+            )
+
+            if not derived:
+                continue
+
+            if cls._derived_fields is None:
+                setattr(cls, method_name, generic)
+            else:
+                setattr(cls, method_name, _generate(method_name, cls._derived_fields))
+
+
+def _slot_fields(cls):
+    '''The public slots of a class, and whether its instances have only slots.
+    '''
+    fields = set()
+    slotted = True
 
-    (Currently Empty)
+    for base in cls.__mro__[:-1]:
+        slots = base.__dict__.get('__slots__')
+
+        if slots is None:
+            slotted = False
+            continue
+
+        if isinstance(slots, basestring):
+            slots = [slots]
+
+        fields.update(slot for slot in slots if not slot.startswith('_'))
+
+    return tuple(sorted(fields)), slotted
+
+
+def _fields(obj):
+    '''The public fields of an object.
+
+    The fixed fields of its class if it has them, otherwise the public
+    slots and instance attributes it has, which is what instance_fields
+    finds without the cost of dir().
     '''
-    pass
+    cls = obj.__class__
+    fields = cls._derived_fields
+
+    if fields is not None:
+        return fields
+
+    fields = [attr for attr in cls._derived_slots if hasattr(obj, attr)]
+
+    for attr, value in vars(obj).iteritems():
+        if attr.startswith('_') or isinstance(value, types.MethodType):
+            continue
+
+        class_attribute = getattr(cls, attr, None)
+        if class_attribute is None or isinstance(class_attribute, types.MemberDescriptorType):
+            fields.append(attr)
+
+    return sorted(fields)
 
 
 def _derived__eq__(self, other):
-    '''Universal equality method based on inspecting the "public fields".
+    '''Universal equality method based on the "public fields".
     '''
-    canary = object()
-    for attr in instance_fields(self):
+    if self.__class__ is not other.__class__:
+        return False
 
-        attribute = getattr(self, attr)
+    canary = object()
+    for attr in _fields(self):
         other_attribute = getattr(other, attr, canary)
-        equal = (other_attribute is not canary and attribute == other_attribute)
 
-        if not equal:
+        if other_attribute is canary or getattr(self, attr) != other_attribute:
             return False
-    return self.__class__ == other.__class__
+
+    return True
 
 
 def _derived__ne__(self, other):
@@ -40,17 +111,13 @@ def _derived__ne__(self, other):
 def _derived__repr__(self):
     '''Universal repr method
 
-    Based on inspecting the name and "public fields".
+    Based on the name and "public fields".
     '''
-    fields = [
-        (attr, repr(getattr(self, attr)))
-        for attr in instance_fields(self)
-    ]
-
     field_str = ', '.join([
-        '{name}={value}'.format(name=name, value=value) for
-        (name, value) in fields
+        '{name}={value}'.format(name=attr, value=repr(getattr(self, attr)))
+        for attr in _fields(self)
     ])
+
     return '{cls}({fields})'.format(
         cls=self.__class__.__name__,
         fields=field_str,
@@ -60,16 +127,11 @@ def _derived__repr__(self):
 def _derived__str__(self):
     '''Universal str str method
 
-    Based on inspecting the name and "public fields".
+    Based on the name and "public fields".
     '''
-    fields = [
-        (attr, str(getattr(self, attr)))
-        for attr in instance_fields(self)
-    ]
-
     field_str = ', '.join([
-        '{name}={value}'.format(name=name, value=value) for
-        (name, value) in fields
+        '{name}={value}'.format(name=attr, value=str(getattr(self, attr)))
+        for attr in _fields(self)
     ])
 
     return '{cls}({fields})'.format(
@@ -78,6 +140,50 @@ def _derived__str__(self):
     )
 
 
+# the source of each method specialized to a fixed list of fields
+_specialized_sources = {
+    '__eq__': (
+        'def __eq__(self, other):\n'
+        '    return self.__class__ is other.__class__{compare}\n'
+    ),
+    '__ne__': (
+        'def __ne__(self, other):\n'
+        '    return not self == other\n'
+    ),
+    '__repr__': (
+        'def __repr__(self):\n'
+        '    return self.__class__.__name__ + ({show}).format({reprs})\n'
+    ),
+    '__str__': (
+        'def __str__(self):\n'
+        '    return self.__class__.__name__ + ({show}).format({strs})\n'
+    ),
+}
+
+
+def _generate(method_name, fields):
+    '''Generate a derived method specialized to the given fields.
+    '''
+    source = _specialized_sources[method_name].format(
+        compare=''.join(
+            ' and self.{0} == other.{0}'.format(field) for field in fields
+        ),
+        show=repr('(' + ', '.join(
+            '{0}={{{1}}}'.format(field, i) for i, field in enumerate(fields)
+        ) + ')'),
+        reprs=', '.join('repr(self.{0})'.format(field) for field in fields),
+        strs=', '.join('str(self.{0})'.format(field) for field in fields),
+    )
+
+    namespace = {}
+    exec source in namespace
+
+    method = namespace[method_name]
+    method._derived = True
+
+    return method
+
+
 def _derived__dictstr__(self):
     items = sorted(self.members.items())
     field_str = ', '.join([
@@ -124,13 +230,34 @@ def _deriving(*method_ids):
 
     cls_name = '_' + ''.join(['Deriving'] + list(method_ids))
     cls_bases = (_Derived,)
-    cls = type(cls_name, cls_bases, methods)
+    methods['__slots__'] = ()
+    cls = _DerivingMeta(cls_name, cls_bases, methods)
 
     return cls
 
 
 _derivable_ids = {'__repr__', '__eq__'}
 
+# the generic derived methods, which are specialized to each slotted class
+_generic_methods = {
+    '__eq__': _derived__eq__,
+    '__ne__': _derived__ne__,
+    '__repr__': _derived__repr__,
+    '__str__': _derived__str__,
+}
+
+for _method in _generic_methods.values():
+    _method._derived = True
+
+
+class _Derived(object):
+    '''Base class for dynamically generated "Derived" class
+
+    Has no slots, so that classes deriving from it may use __slots__.
+    '''
+    __metaclass__ = _DerivingMeta
+    __slots__ = ()
+
 
 _derivable_names = {
     '__dictstr__': '__str__',
@@ -195,9 +322,10 @@ def _is_instance_method(obj, attr):
 
 def _is_instance_field(obj, attr):
     attribute = getattr(obj, attr, None)
+    class_attribute = getattr(obj.__class__, attr, None)
     return (
         not isinstance(attribute, types.MethodType) and
-        getattr(obj.__class__, attr, None) is None
+        (class_attribute is None or isinstance(class_attribute, types.MemberDescriptorType))
     )
 
 